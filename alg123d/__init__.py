@@ -6,7 +6,29 @@ from .generic import *
 from .part import *
 from .sketch import *
 from .line import *
-from .algcompound import SkipClean, Copy, AlgCompound, LazyAlgCompound
+from .expression import *
+from .parametric import *
+from .boolean import *
+from .profiling import *
+from .serialize import *
+from .selectors import *
+from .history import *
+from .adjacency import *
+from .parallel import parallel_map, parameter_grid, TaskResult
+from .algcompound import (
+    SkipClean,
+    CleanMode,
+    CleanPolicy,
+    Copy,
+    ParallelFuse,
+    AutoBatch,
+    LazyExpressions,
+    PrimitiveCache,
+    BooleanCache,
+    DiskCache,
+    AlgCompound,
+    LazyAlgCompound,
+)
 from build123d.importers import *
 
 from .assembly import *
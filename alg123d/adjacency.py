@@ -0,0 +1,200 @@
+from typing import Dict, Tuple
+
+import numpy as np
+from OCP.TopExp import TopExp
+from OCP.TopTools import TopTools_IndexedDataMapOfShapeListOfShape
+
+from .topology import *
+from .topology import _SHAPE_ENUMS, _TopologyIndex, _indexed
+
+__all__ = ["Adjacency", "adjacency_graph"]
+
+CSR = Tuple[np.ndarray, np.ndarray]
+
+_TYPE_NAMES = {enum: name for name, enum in _SHAPE_ENUMS.items()}
+
+#
+# Adjacency of faces, edges and vertices
+#
+
+
+def _transpose(graph: CSR, columns: int) -> CSR:
+    """the CSR arrays of the transposed graph with columns rows"""
+    indptr, indices = graph
+    rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    order = np.argsort(indices, kind="stable")
+    t_indptr = np.zeros(columns + 1, dtype=np.int64)
+    np.cumsum(np.bincount(indices, minlength=columns), out=t_indptr[1:])
+    return t_indptr, rows[order]
+
+
+def _neighbors(down: CSR, up: CSR, count: int) -> CSR:
+    """rows of down connected via a shared column of up (e.g. faces sharing an edge)"""
+    d_indptr, d_indices = down
+    u_indptr, u_indices = up
+
+    rows = np.repeat(np.arange(count), np.diff(d_indptr))
+    counts = np.diff(u_indptr)[d_indices]
+    starts = np.repeat(u_indptr[d_indices], counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    rows = np.repeat(rows, counts)
+    columns = u_indices[starts + offsets]
+
+    pairs = np.unique(rows[rows != columns] * count + columns[rows != columns])
+    indptr = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(pairs // count, minlength=count), out=indptr[1:])
+    return indptr, pairs % count
+
+
+class Adjacency:
+    """Adjacency graph of the faces, edges and vertices of a shape
+
+    The graph is built with TopExp.MapShapesAndUniqueAncestors on first use and
+    kept in the topology index of the shape, so it is rebuilt only when the shape
+    changes. Rows and columns are the positions in faces(), edges() and vertices()
+    of the shape. The graphs are CSR arrays (indptr, indices): the neighbors of row
+    i are indices[indptr[i]:indptr[i + 1]], e.g. for scipy.sparse.csr_matrix.
+
+    Args:
+        index (_TopologyIndex): topology index of the shape
+    """
+
+    def __init__(self, index: _TopologyIndex):
+        self.index = index
+        self._graphs: Dict[Tuple[str, str], CSR] = {}
+        self._edge_positions: Dict[int, int] = None
+
+    def _count(self, topo_type: str) -> int:
+        return len(self.index.get(topo_type))
+
+    def _position(self, topo_type: str, i: int) -> int:
+        """position in index.get(topo_type) of the i-th shape of index.map(topo_type)
+
+        Only edges differ, get() skips the degenerated ones (None).
+        """
+        if topo_type != Edge.__name__:
+            return i - 1
+        if self._edge_positions is None:
+            shape_map = self.index.map(topo_type)
+            self._edge_positions = {
+                shape_map.FindIndex(e): j
+                for j, e in enumerate(self.index.get(topo_type))
+            }
+        return self._edge_positions.get(i)
+
+    def _ancestors(self, child: str, parent: str) -> CSR:
+        key = (child, parent)
+        graph = self._graphs.get(key)
+        if graph is None:
+            ancestors = TopTools_IndexedDataMapOfShapeListOfShape()
+            TopExp.MapShapesAndUniqueAncestors_s(
+                self.index.shape, _SHAPE_ENUMS[child], _SHAPE_ENUMS[parent], ancestors
+            )
+            parent_map = self.index.map(parent)
+
+            indptr = [0]
+            indices = []
+            for e in self.index.get(child):
+                i = ancestors.FindIndex(e)
+                if i > 0:
+                    for p in ancestors.FindFromIndex(i):
+                        j = self._position(parent, parent_map.FindIndex(p))
+                        if j is not None:  # not a degenerated edge
+                            indices.append(j)
+                indptr.append(len(indices))
+
+            graph = self._graphs[key] = (
+                np.array(indptr, dtype=np.int64),
+                np.array(indices, dtype=np.int64),
+            )
+        return graph
+
+    def _descendants(self, parent: str, child: str) -> CSR:
+        key = (parent, child)
+        graph = self._graphs.get(key)
+        if graph is None:
+            graph = self._graphs[key] = _transpose(
+                self._ancestors(child, parent), self._count(parent)
+            )
+        return graph
+
+    #
+    # CSR arrays
+    #
+
+    @property
+    def edge_faces(self) -> CSR:
+        """faces of every edge"""
+        return self._ancestors(Edge.__name__, Face.__name__)
+
+    @property
+    def face_edges(self) -> CSR:
+        """edges of every face"""
+        return self._descendants(Face.__name__, Edge.__name__)
+
+    @property
+    def vertex_edges(self) -> CSR:
+        """edges of every vertex"""
+        return self._ancestors(Vertex.__name__, Edge.__name__)
+
+    @property
+    def edge_vertices(self) -> CSR:
+        """vertices of every edge"""
+        return self._descendants(Edge.__name__, Vertex.__name__)
+
+    @property
+    def face_faces(self) -> CSR:
+        """faces sharing an edge with every face"""
+        key = (Face.__name__, Face.__name__)
+        graph = self._graphs.get(key)
+        if graph is None:
+            graph = self._graphs[key] = _neighbors(
+                self.face_edges, self.edge_faces, self._count(Face.__name__)
+            )
+        return graph
+
+    #
+    # Neighbor queries
+    #
+
+    def position(self, shape: Shape) -> int:
+        """position of shape in faces(), edges(), ... of the graph's shape"""
+        topo_type = _TYPE_NAMES[shape.wrapped.ShapeType()]
+        i = self.index.map(topo_type).FindIndex(shape.wrapped)
+        j = None if i == 0 else self._position(topo_type, i)
+        if j is None:
+            raise ValueError(f"{shape} is not a sub-shape of this shape")
+        return j
+
+    def _select(self, graph: CSR, shape: Shape, topo_type: str) -> LazyShapeList:
+        indptr, indices = graph
+        i = self.position(shape)
+        return _indexed(self.index, topo_type, indices[indptr[i] : indptr[i + 1]])
+
+    def faces_of(self, edge: Edge) -> LazyShapeList:
+        """the faces adjacent to edge"""
+        return self._select(self.edge_faces, edge, Face.__name__)
+
+    def edges_of(self, face: Face) -> LazyShapeList:
+        """the edges bounding face"""
+        return self._select(self.face_edges, face, Edge.__name__)
+
+    def edges_at(self, vertex: Vertex) -> LazyShapeList:
+        """the edges ending in vertex"""
+        return self._select(self.vertex_edges, vertex, Edge.__name__)
+
+    def vertices_of(self, edge: Edge) -> LazyShapeList:
+        """the vertices of edge"""
+        return self._select(self.edge_vertices, edge, Vertex.__name__)
+
+    def neighbors(self, face: Face) -> LazyShapeList:
+        """the faces sharing an edge with face"""
+        return self._select(self.face_faces, face, Face.__name__)
+
+
+def adjacency_graph(shape: Shape) -> Adjacency:
+    """The cached adjacency graph of shape, rebuilt if the shape was changed"""
+    index = topology_index(shape)
+    if index.adjacency is None:
+        index.adjacency = Adjacency(index)
+    return index.adjacency
@@ -1,41 +1,488 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 import copy
-from typing import List
+from enum import Enum, auto
+import functools
+import inspect
+import os
+from typing import Callable, List
+import warnings
 
 import build123d as bd
-
+from OCP.BRep import BRep_Builder
+from OCP.ShapeUpgrade import ShapeUpgrade_UnifySameDomain
+from OCP.TopAbs import TopAbs_ShapeEnum
+from OCP.TopExp import TopExp_Explorer
+from OCP.TopLoc import TopLoc_Location
+from OCP.TopoDS import TopoDS_Compound
+
+from .adjacency import Adjacency, adjacency_graph
+from .boolean import BooleanOptions, _boolean_history, _boolean_options, bool_op
+from .brepcache import BRepCache, library_versions
+from .broadphase import bounds, overlap, overlap_clusters
+from .cache import LRUCache, shape_size
+from .common import LocationArray
+from .fingerprint import digest, is_persistent, make_key
+from .history import History, _record_history, recording
+from .parallel import tree_fuse
+from .profiling import traced
+from .serialize import deserialize, serialize
 from .topology import *
 from .utils import to_list
 
-__all__ = ["SkipClean", "Copy", "LazyAlgCompound", "AlgCompound", "create_compound"]
+__all__ = [
+    "SkipClean",
+    "CleanMode",
+    "CleanPolicy",
+    "Copy",
+    "ParallelFuse",
+    "AutoBatch",
+    "LazyExpressions",
+    "PrimitiveCache",
+    "BooleanCache",
+    "DiskCache",
+    "LazyAlgCompound",
+    "AlgCompound",
+    "PartObject",
+    "SketchObject",
+    "LineObject",
+    "create_compound",
+]
 
 CTX = [None, bd.BuildLine, bd.BuildSketch, bd.BuildPart]
 
+_TOPABS = [
+    None,
+    TopAbs_ShapeEnum.TopAbs_EDGE,
+    TopAbs_ShapeEnum.TopAbs_FACE,
+    TopAbs_ShapeEnum.TopAbs_SOLID,
+]
+
 #
-# SkipClean context
+# Contexts
 #
 
+# The state of the contexts is held in context variables, so every thread and
+# every asyncio task sees its own state and models can be built concurrently.
+
+_clean = ContextVar("clean", default=True)
+_clean_policy = ContextVar("clean_policy", default=None)
+_raw_shapes = ContextVar("raw_shapes", default=False)
+_shallow = ContextVar("shallow", default=False)
+_parallel_fuse = ContextVar("parallel_fuse", default=(None, 64))
+_auto_batch = ContextVar("auto_batch", default=False)
+_lazy_expressions = ContextVar("lazy_expressions", default=(False, None))
+_primitive_cache = ContextVar("primitive_cache", default=None)
+_boolean_cache = ContextVar("boolean_cache", default=(None, False))
+_disk_cache = ContextVar("disk_cache", default=None)
+_lazy_scopes = ContextVar("lazy_scopes", default=())
+
+
+# SkipClean.clean and Copy.shallow used to be class attributes, they stay readable
+# as class properties returning the state of the current context
+
+
+class _SkipCleanState(type):
+    @property
+    def clean(cls) -> bool:
+        """False within SkipClean"""
+        return _clean.get()
+
 
-class SkipClean:
-    clean = True
+class _CopyState(type):
+    @property
+    def shallow(cls) -> bool:
+        """True within Copy"""
+        return _shallow.get()
 
+
+class SkipClean(metaclass=_SkipCleanState):
     def __enter__(self):
-        SkipClean.clean = False
+        self._token = _clean.set(False)
 
     def __exit__(self, exception_type, exception_value, traceback):
-        SkipClean.clean = True
+        _clean.reset(self._token)
+
+
+class CleanMode(Enum):
+    """when CleanPolicy cleans the results of operations
+
+    ALWAYS: after every operation (the default without CleanPolicy)
+    DEFERRED: once, on the first read of the shape outside of operations, i.e. on
+        export, show or the first topology query
+    THRESHOLD: only when the number of faces (edges for lines) has grown by more
+        than the threshold since the last clean
+    """
+
+    ALWAYS = auto()
+    DEFERRED = auto()
+    THRESHOLD = auto()
+
+
+class CleanPolicy:
+    """Clean (ShapeUpgrade_UnifySameDomain) the results of operations less often
 
+    stats counts the operations, the clean calls run and the ones skipped, so the
+    cheapest mode that still gives correct results can be chosen per pipeline.
+    SkipClean within the context still disables cleaning completely.
 
-class Copy:
-    shallow = False
+    Args:
+        mode (CleanMode, optional): when to clean. Defaults to CleanMode.ALWAYS.
+        threshold (float, optional): relative growth of the face count that
+            triggers a clean in mode THRESHOLD. Defaults to 0.5.
+    """
+
+    def __init__(self, mode: CleanMode = CleanMode.ALWAYS, threshold: float = 0.5):
+        self.mode = mode
+        self.threshold = threshold
+        self.operations = 0
+        self.cleaned = 0
+        self.skipped = 0
 
     def __enter__(self):
-        Copy.shallow = True
+        self._token = _clean_policy.set(self)
+        return self
 
     def __exit__(self, exception_type, exception_value, traceback):
-        Copy.shallow = False
+        _clean_policy.reset(self._token)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @property
+    def stats(self) -> dict:
+        return dict(
+            operations=self.operations, cleaned=self.cleaned, skipped=self.skipped
+        )
+
+    def _apply(self, result: AlgCompound, reference: Shape = None) -> AlgCompound:
+        self.operations += 1
+
+        if self.mode == CleanMode.DEFERRED:
+            result._unclean = self
+            self.skipped += 1
+            return result
+
+        elif self.mode == CleanMode.THRESHOLD:
+            baseline = None
+            if reference is not None and reference.wrapped is not None:
+                baseline = getattr(reference, "_clean_count", None)
+                if baseline is None:
+                    baseline = _count(reference, result.dim)
+
+            if baseline is not None:
+                if _count(result, result.dim) <= baseline * (1 + self.threshold):
+                    result._clean_count = baseline
+                    self.skipped += 1
+                    return result
+
+        return self._clean(result)
+
+    def _clean(self, result: AlgCompound) -> AlgCompound:
+        self.cleaned += 1
+        result.clean()
+        result._clean_count = _count(result, result.dim)
+        return result
+
+
+def _count(shape: Shape, dim: int) -> int:
+    """number of faces (edges for lines) of shape"""
+    explorer = TopExp_Explorer(
+        shape.wrapped,
+        TopAbs_ShapeEnum.TopAbs_FACE if dim > 1 else TopAbs_ShapeEnum.TopAbs_EDGE,
+    )
+    count = 0
+    while explorer.More():
+        count += 1
+        explorer.Next()
+    return count
+
+
+def _cleaned(result: AlgCompound, reference: Shape = None) -> AlgCompound:
+    """clean the result of an operation according to SkipClean and CleanPolicy
+
+    reference is the shape the operation modified, e.g. the left operand
+    """
+    if not _clean.get():
+        return result
+
+    policy = _clean_policy.get()
+    if policy is None:
+        return result.clean()
+    return policy._apply(result, reference)
+
+
+def _restored(result: AlgCompound) -> AlgCompound:
+    """results of the caches still need the deferred clean"""
+    policy = _clean_policy.get()
+    if _clean.get() and policy is not None and policy.mode == CleanMode.DEFERRED:
+        result._unclean = policy
+    return result
+
+
+@contextmanager
+def _raw():
+    """read the shapes of AlgCompounds within operations without a deferred clean"""
+    token = _raw_shapes.set(True)
+    try:
+        yield
+    finally:
+        _raw_shapes.reset(token)
+
+
+class Copy(metaclass=_CopyState):
+    def __enter__(self):
+        self._token = _shallow.set(True)
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        _shallow.reset(self._token)
+
+
+class ParallelFuse:
+    """fuse list operands with at least min_operands elements in a process pool"""
+
+    def __init__(self, workers: int = None, min_operands: int = 64):
+        self._workers = os.cpu_count() if workers is None else workers
+        self._min_operands = min_operands
+
+    def __enter__(self):
+        self._token = _parallel_fuse.set((self._workers, self._min_operands))
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        _parallel_fuse.reset(self._token)
+
+
+class AutoBatch:
+    """defer +, - and & and run them as batched booleans when the shape is read"""
+
+    def __enter__(self):
+        self._token = _auto_batch.set(True)
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        _auto_batch.reset(self._token)
+
+
+class LazyExpressions:
+    """build an expression graph instead of shapes, evaluated when a shape is needed"""
+
+    def __init__(self, workers: int = None):
+        self._workers = workers
+
+    def __enter__(self):
+        self._token = _lazy_expressions.set((True, self._workers))
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        _lazy_expressions.reset(self._token)
+
+    @staticmethod
+    @contextmanager
+    def disabled():
+        token = _lazy_expressions.set((False, _lazy_expressions.get()[1]))
+        try:
+            yield
+        finally:
+            _lazy_expressions.reset(token)
+
+
+class PrimitiveCache:
+    """Reuse the objects of part.py, sketch.py and line.py created with equal parameters
+
+    A cache hit returns a new object sharing the TShape of the cached one, so only
+    the location is copied. The cache of a PrimitiveCache object is kept across
+    with-blocks, hits, misses and evictions are counted in cache.stats.
+
+    Args:
+        max_entries (int, optional): maximum number of cached objects. Defaults to 1024.
+        max_bytes (int, optional): maximum size of the cached objects as binary BRep.
+            Defaults to None.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = None):
+        self.cache = LRUCache(max_entries, max_bytes)
+
+    def __enter__(self):
+        self._token = _primitive_cache.set(self.cache)
+        return self.cache
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        _primitive_cache.reset(self._token)
+
+
+class BooleanCache:
+    """Reuse the results of +, -, & and of the functions of generic.py and part.py
+
+    Results are cached by the operation and its operands. By default operands are
+    keyed by identity (same TShape, location and orientation), which is cheap and
+    works for operands that are reused as objects. With fingerprint=True they are
+    keyed by the fingerprint of their BRep, which costs a serialization of every
+    operand, but also finds equal operands created independently, e.g. in
+    different requests of a service. A cache hit returns a new object sharing the
+    TShape of the cached result, so it cannot be changed through the cache.
+
+    Args:
+        max_entries (int, optional): maximum number of cached results. Defaults to 1024.
+        max_bytes (int, optional): maximum size of the cached results as binary BRep.
+            Defaults to None.
+        fingerprint (bool, optional): key operands by BRep fingerprint.
+            Defaults to False.
+    """
+
+    def __init__(
+        self, max_entries: int = 1024, max_bytes: int = None, fingerprint: bool = False
+    ):
+        self.cache = LRUCache(max_entries, max_bytes)
+        self._fingerprint = fingerprint
+
+    def __enter__(self):
+        self._token = _boolean_cache.set((self.cache, self._fingerprint))
+        return self.cache
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        _boolean_cache.reset(self._token)
+
+
+def _cache_put(cache: LRUCache, key, obj: AlgCompound):
+    shape = obj.wrapped.Moved(TopLoc_Location())
+    size = 0 if cache.max_bytes is None else shape_size(shape)
+    cache.put(key, (shape, obj.dim), size)
+
+
+def _cache_get(cache: LRUCache, key) -> Tuple[TopoDS_Shape, int]:
+    """a fresh copy (sharing the TShape) of the cached shape and its dim, or None"""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    shape, dim = entry
+    return shape.Moved(TopLoc_Location()), dim
+
+
+class DiskCache:
+    """Persist the results of the operations cached by BooleanCache in a directory
+
+    Entries are binary BRep files keyed by the operation, its parameters, the
+    fingerprints of the operands and the versions of alg123d, build123d and OCP.
+    Several processes can share one directory. DiskCache can be combined with
+    BooleanCache, then disk hits are also kept in memory.
+
+    Args:
+        directory (str): cache directory
+        max_bytes (int, optional): maximum size of the cache directory.
+            Defaults to 1 GB.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 2**30):
+        self.cache = BRepCache(directory, max_bytes)
+
+    def __enter__(self):
+        self._token = _disk_cache.set(self.cache)
+        return self.cache
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        _disk_cache.reset(self._token)
+
+
+def _memoized(op: tuple, operands, func: Callable[[], AlgCompound]) -> AlgCompound:
+    """result of func() for op and operands from the active caches, else computed"""
+    (memory, fingerprint), disk = _boolean_cache.get(), _disk_cache.get()
+    if memory is None and disk is None:
+        return func()
+
+    policy = _clean_policy.get()
+    op = op + (_boolean_options.get(), None if policy is None else policy.mode)
+
+    if memory is not None:
+        memory_key = (op, make_key(operands, not fingerprint))
+        entry = _cache_get(memory, memory_key)
+        if entry is not None:
+            return _restored(AlgCompound._from_wrapped(*entry))
+
+    if disk is not None:
+        operands_key = make_key(operands)
+        if is_persistent(operands_key):
+            disk_key = digest((op, operands_key, library_versions()))
+        else:  # parameters only known by identity: don't cache across processes
+            disk = None
+
+    if disk is not None:
+        entry = disk.get(disk_key)
+        if entry is not None:
+            result = AlgCompound._from_wrapped(*entry)
+            if memory is not None:
+                _cache_put(memory, memory_key, result)
+            return _restored(result)
+
+    result = func()
+    if memory is not None:
+        _cache_put(memory, memory_key, result)
+    if disk is not None:
+        disk.put(disk_key, result.wrapped, result.dim)
+    return result
+
+
+def _unpickle(cls, data: bytes, dim: int, state: dict) -> AlgCompound:
+    obj = cls.__new__(cls)
+    if data is None:
+        AlgCompound.__init__(obj)
+    else:
+        Compound.__init__(obj, downcast(deserialize(data)))
+        obj.dim = dim
+        if dim == 3:
+            obj.metadata = {}
+    obj.__dict__.update(state)
+    return obj
+
+
+def _dim(obj: Shape) -> int:
+    if isinstance(obj, AlgCompound):
+        return obj.dim
+    elif isinstance(obj, Solid):
+        return 3
+    elif isinstance(obj, Face):
+        return 2
+    elif isinstance(obj, (Edge, Wire)):
+        return 1
+    else:
+        raise TypeError(f"Unknown type {obj}")
+
+
+def _expression(op: str, obj: AlgCompound, other) -> AlgCompound:
+    from .expression import OPERATORS, node
+
+    dim = obj.dim if obj.dim != 0 else max(_dim(o) for o in to_list(other))
+    return node(OPERATORS[op], (obj, other), {}, dim)
+
+
+def _fuse_operands(objs: List[Shape]) -> List[Shape]:
+    """pre-fuse a long operand list as a parallel tree when ParallelFuse is active"""
+    workers, min_operands = _parallel_fuse.get()
+    if workers is not None and workers > 1 and len(objs) >= min_operands:
+        return [tree_fuse(objs, workers)]
+    else:
+        return objs
+
+
+def _fuse(objs: List[AlgCompound], dim: int) -> Shape:
+    """fuse objs, running booleans only for clusters of overlapping bounding boxes"""
+    fused = []
+    for cluster in overlap_clusters([bounds(obj) for obj in objs]):
+        first, *rest = [objs[i] for i in cluster]
+        fused.append(bool_op(Mode.ADD, first, _fuse_operands(rest)) if rest else first)
+
+    if len(fused) == 1:
+        return fused[0]
+
+    if dim == 3:
+        return Compound.make_compound([s for f in fused for s in f.solids()])
+    elif dim == 2:
+        return Compound.make_compound([s for f in fused for s in f.faces()])
+    else:
+        return Compound.make_compound([s for f in fused for s in f.edges()])
 
 
 #
@@ -43,6 +490,43 @@ class Copy:
 #
 
 
+def _snapshot(obj: AlgCompound) -> AlgCompound:
+    """shallow copy of obj sharing the TShape, unaffected by later in-place moves"""
+    return AlgCompound._from_wrapped(obj.wrapped.Moved(TopLoc_Location()), obj.dim)
+
+
+def _batches(pending) -> List:
+    """merge consecutive additions and consecutive subtractions into one operation
+
+    a + b + c == a + [b, c] and a - b - c == a - [b, c], however a & b & c is not
+    a & [b, c], since the operands of a list are treated as one (fused) shape
+    """
+    batches = []
+    for mode, objs in pending:
+        if batches and batches[-1][0] == mode and mode != Mode.INTERSECT:
+            batches[-1][1].extend(objs)
+        else:
+            batches.append((mode, list(objs)))
+    return batches
+
+
+def _align_location(obj: Shape, align, dim: int) -> Location:
+    """move for obj to align min, center or max of its bounding box with the origin"""
+    if isinstance(align, Align):
+        align = (align,) * dim
+
+    bbox = obj.bounding_box()
+    align_offset = []
+    for i in range(dim):
+        if align[i] == Align.MIN:
+            align_offset.append(-bbox.min.to_tuple()[i])
+        elif align[i] == Align.CENTER:
+            align_offset.append(-(bbox.min.to_tuple()[i] + bbox.max.to_tuple()[i]) / 2)
+        elif align[i] == Align.MAX:
+            align_offset.append(-bbox.max.to_tuple()[i])
+    return Location(Vector(*align_offset))
+
+
 def unwrap(compound: Compound) -> Compound:
     """remove enclosing Compound if it only holds one other Compund"""
     if (
@@ -89,11 +573,175 @@ class AlgCompound(Compound):
         else:
             raise RuntimeError(f"{objs} not supported")
 
+    #
+    # Deferred evaluation (AutoBatch): pending boolean operations run on first read
+    #
+
+    _deferred = False
+    _pending = ()
+
+    # CleanPolicy: the policy of a pending deferred clean and the face count after
+    # the last clean
+
+    _unclean = None
+    _clean_count = None
+
+    # History of the operation (+, -, &) that created the object
+
+    _history = None
+
+    @property
+    def wrapped(self):
+        if self._deferred:
+            self._resolve()
+        if self._unclean is not None and not _raw_shapes.get():
+            policy, self._unclean = self._unclean, None
+            policy._clean(self)
+        return self._wrapped
+
+    @wrapped.setter
+    def wrapped(self, value):
+        self._wrapped = value
+
+    def _resolve(self):
+        pending, self._pending, self._deferred = self._pending, (), False
+
+        result = self
+        for mode, objs in _batches(pending):
+            result = result._apply(mode, objs)
+
+        self.wrapped = result._wrapped
+        self._unclean, self._clean_count = result._unclean, result._clean_count
+        self._history = result._history
+
+    def _defer(self, mode: Mode, objs: List[AlgCompound]) -> AlgCompound:
+        if self.dim == 1 and mode != Mode.ADD:
+            raise RuntimeError("Lines can only be added")
+
+        result = AlgCompound._from_wrapped(
+            self._wrapped.Moved(TopLoc_Location()), self.dim
+        )
+        result._pending = self._pending + ((mode, [_snapshot(o) for o in objs]),)
+        result._deferred = True
+        return result
+
+    @classmethod
+    def _from_wrapped(cls, wrapped: TopoDS_Shape, dim: int) -> AlgCompound:
+        """wrap an OCCT compound of objects of dimension dim without re-building it"""
+        result = cls.__new__(cls)
+        Compound.__init__(result, downcast(wrapped))
+        result.dim = dim
+        if dim == 3:
+            result.metadata = {}
+        return result
+
+    #
+    # Pickle support: binary BRep plus dim, label and metadata
+    #
+
+    _pickle_class = None  # class to rebuild, None means the class of the object
+
+    def __reduce__(self):
+        cls = type(self) if self._pickle_class is None else self._pickle_class
+        data = None if self.wrapped is None else serialize(self.wrapped)
+        state = {
+            k: self.__dict__[k] for k in ("label", "metadata") if k in self.__dict__
+        }
+        return (_unpickle, (cls, data, self.dim, state))
+
     @classmethod
     def make_compound(cls, objs: Shape):
         compound = Compound.make_compound(objs)
         return cls(compound)
 
+    @traced()
+    def clean(self) -> AlgCompound:
+        history = self._history
+        if history is None:
+            history = _boolean_history.get()  # clean of the result of an operation
+        if history is None or not history.recorded:
+            return super().clean()
+
+        # like Shape.clean, but keep the history valid for the cleaned shape
+        upgrader = ShapeUpgrade_UnifySameDomain(self.wrapped, True, True, True)
+        upgrader.AllowInternalEdges(False)
+        try:
+            upgrader.Build()
+            self.wrapped = downcast(upgrader.Shape())
+            history.merge(upgrader.History())
+        except:  # pylint: disable=bare-except
+            warnings.warn(f"Unable to clean {self}")
+        return self
+
+    #
+    # Adjacency
+    #
+
+    @property
+    def adjacency(self) -> Adjacency:
+        """Adjacency graph of faces, edges and vertices, rebuilt after changes"""
+        return adjacency_graph(self)
+
+    #
+    # Operation history
+    #
+
+    @property
+    def history(self) -> History:
+        """History of the operation (+, -, &) that created the object
+
+        None for objects not created by an operation and results of the caches
+        """
+        self.wrapped  # run pending operations and a deferred clean first
+        return self._history
+
+    def _operation_history(self) -> History:
+        history = self.history
+        if history is None:
+            raise RuntimeError(
+                "Object is not the result of +, - or &, or was taken from a cache"
+            )
+        return history
+
+    def new_vertices(self) -> ShapeList[Vertex]:
+        """vertices of the object the first operand of its operation doesn't have"""
+        return self._operation_history().new(self, Vertex.__name__)
+
+    def new_edges(self) -> ShapeList[Edge]:
+        """edges of the object the first operand of its operation doesn't have"""
+        return self._operation_history().new(self, Edge.__name__)
+
+    def new_faces(self) -> ShapeList[Face]:
+        """faces of the object the first operand of its operation doesn't have"""
+        return self._operation_history().new(self, Face.__name__)
+
+    def modified_edges(self) -> ShapeList[Edge]:
+        """the modified edges of the first operand (within RecordHistory)"""
+        return self._operation_history().modified_in(self, Edge.__name__)
+
+    def modified_faces(self) -> ShapeList[Face]:
+        """the modified faces of the first operand (within RecordHistory)"""
+        return self._operation_history().modified_in(self, Face.__name__)
+
+    def deleted_edges(self) -> ShapeList[Edge]:
+        """edges of the first operand the operation removed (within RecordHistory)"""
+        return self._operation_history().deleted_in(Edge.__name__)
+
+    def deleted_faces(self) -> ShapeList[Face]:
+        """faces of the first operand the operation removed (within RecordHistory)"""
+        return self._operation_history().deleted_in(Face.__name__)
+
+    # topology queries, traced within Profile
+
+    vertices = traced("AlgCompound.vertices")(Compound.vertices)
+    edges = traced("AlgCompound.edges")(Compound.edges)
+    wires = traced("AlgCompound.wires")(Compound.wires)
+    faces = traced("AlgCompound.faces")(Compound.faces)
+    shells = traced("AlgCompound.shells")(Compound.shells)
+    solids = traced("AlgCompound.solids")(Compound.solids)
+    compounds = traced("AlgCompound.compounds")(Compound.compounds)
+
+    @traced()
     def _create(self, ctx, cls, objects=None, part=None, params=None):
         if params is None:
             params = {}
@@ -109,25 +757,12 @@ class AlgCompound(Compound):
 
         return result
 
+    @traced()
     def _align(
         self, align: Union[Align, Tuple(Align, Align), Tuple(Align, Align, Align)]
     ) -> AlgCompound:
         if align is not None:
-            if isinstance(align, Align):
-                align = (align,) * self.dim
-
-            bbox = self.bounding_box()
-            align_offset = []
-            for i in range(self.dim):
-                if align[i] == Align.MIN:
-                    align_offset.append(-bbox.min.to_tuple()[i])
-                elif align[i] == Align.CENTER:
-                    align_offset.append(
-                        -(bbox.min.to_tuple()[i] + bbox.max.to_tuple()[i]) / 2
-                    )
-                elif align[i] == Align.MAX:
-                    align_offset.append(-bbox.max.to_tuple()[i])
-            self.move(Location(Vector(*align_offset)))
+            self.move(_align_location(self, align, self.dim))
 
     def create_line(self, cls, objects=None, params=None):
         result = self._create(bd.BuildLine, cls, objects=objects, params=params)
@@ -139,6 +774,7 @@ class AlgCompound(Compound):
     def create_part(self, cls, part=None, params=None):
         return self._create(bd.BuildPart, cls, part=part, params=params)
 
+    @traced()
     def _place(self, mode: Mode, *objs: AlgCompound):
         objs = [o if isinstance(o, AlgCompound) else AlgCompound(o) for o in objs]
 
@@ -147,50 +783,166 @@ class AlgCompound(Compound):
                 f"Cannot combine objects of different dimensionality: {self.dim} and {objs[0].dim}"
             )
 
+        with _raw():
+            if _auto_batch.get() and self.dim != 0 and objs[0].dim != 0:
+                return self._defer(mode, objs)
+            else:
+                return self._apply(mode, objs)
+
+    def _apply(self, mode: Mode, objs: List[AlgCompound]) -> AlgCompound:
+        with _raw():
+            reference = None if self.dim == 0 else self.wrapped
+            if _record_history.get():  # cached results have no OCCT history
+                with recording(reference) as history:
+                    result = self._boolean(mode, objs)
+            else:
+                computed = []
+
+                def boolean():
+                    computed.append(True)
+                    return self._boolean(mode, objs)
+
+                result = _memoized(
+                    ("boolean", mode, _clean.get()), [self] + objs, boolean
+                )
+                # a cached result doesn't share sub-shapes with self, new_* would
+                # return all of them
+                history = History(reference) if computed else None
+        result._history = history
+        return result
+
+    def _boolean(self, mode: Mode, objs: List[AlgCompound]) -> AlgCompound:
         if self.dim == 0:  # Cover addition of empty AlgCompound with another object
             if mode == Mode.ADD:
                 if len(objs) == 1:
                     compound = copy.deepcopy(objs[0])
                 else:
-                    compound = copy.deepcopy(objs.pop()).fuse(*objs)
+                    compound = _fuse(objs, objs[0].dim)
             else:
                 raise RuntimeError("Can only add to an empty AlgCompound object")
         elif objs[0].dim == 0:  # Cover operation with empty AlgCompound object
             compound = self
         else:
             if mode == Mode.ADD:
-                compound = self.fuse(*objs)
+                compound = _fuse([self] + objs, self.dim)
 
             elif self.dim == 1:
                 raise RuntimeError("Lines can only be added")
 
             else:
+                box = bounds(self)
+                tools = [obj for obj in objs if overlap(box, bounds(obj))]
+
                 if mode == Mode.SUBTRACT:
-                    compound = self.cut(*objs)
-                elif mode == Mode.INTERSECT:
-                    compound = self.intersect(*objs)
+                    if not tools:  # nothing to cut away, but cleaned like any result
+                        compound = self
+                    else:
+                        compound = bool_op(Mode.SUBTRACT, self, _fuse_operands(tools))
 
-        if SkipClean.clean:
-            compound = compound.clean()
+                elif mode == Mode.INTERSECT:
+                    # keep the boolean for the empty result of disjoint objects
+                    compound = bool_op(
+                        Mode.INTERSECT, self, _fuse_operands(tools or objs)
+                    )
 
-        return AlgCompound(compound)
+        return _cleaned(AlgCompound(compound), self)
 
     def __add__(self, other: Union[AlgCompound, List[AlgCompound]]):
+        if _lazy_expressions.get()[0]:
+            return _expression("add", self, other)
         return self._place(Mode.ADD, *to_list(other))
 
     def __sub__(self, other: Union[AlgCompound, List[AlgCompound]]):
+        if _lazy_expressions.get()[0]:
+            return _expression("sub", self, other)
         return self._place(Mode.SUBTRACT, *to_list(other))
 
     def __and__(self, other: Union[AlgCompound, List[AlgCompound]]):
+        if _lazy_expressions.get()[0]:
+            return _expression("and", self, other)
         return self._place(Mode.INTERSECT, *to_list(other))
 
-    def __mul__(self, loc: Location):
+    def combine(
+        self,
+        other: Union[AlgCompound, List[AlgCompound]],
+        mode: Mode = Mode.ADD,
+        **options,
+    ) -> AlgCompound:
+        """self + other, self - other or self & other (mode ADD, SUBTRACT or INTERSECT)
+
+        options (parallel, fuzzy_value, glue, ...) override the active BooleanOptions
+        for this operation only.
+        """
+        with BooleanOptions(**options):
+            if mode == Mode.ADD:
+                return self + other
+            elif mode == Mode.SUBTRACT:
+                return self - other
+            elif mode == Mode.INTERSECT:
+                return self & other
+            else:
+                raise ValueError(f"Mode {mode} not supported for combine")
+
+    def _instances(
+        self, locations: Union[LocationArray, List[Location]], relative: bool
+    ) -> AlgCompound:
+        """one compound of copies of the objects of self at all locations
+
+        The copies only differ in location and share the TShapes of the objects of
+        self, hence creating them is cheap and the result can be used as a single
+        operand of a boolean operation.
+        """
+        if self.dim == 0:
+            return AlgCompound()
+
+        if isinstance(locations, LocationArray):
+            toplocs = locations.toplocs()
+        else:
+            toplocs = [
+                (loc.location if isinstance(loc, Plane) else loc).wrapped
+                for loc in locations
+            ]
+
+        if not relative:  # located: replace the location of self
+            inverted = self.wrapped.Location().Inverted()
+            toplocs = [loc.Multiplied(inverted) for loc in toplocs]
+
+        children = []
+        explorer = TopExp_Explorer(self.wrapped, _TOPABS[self.dim])
+        while explorer.More():
+            children.append(explorer.Current())
+            explorer.Next()
+
+        compound = TopoDS_Compound()
+        builder = BRep_Builder()
+        builder.MakeCompound(compound)
+        for loc in toplocs:
+            for child in children:
+                builder.Add(compound, child.Moved(loc))
+
+        return AlgCompound._from_wrapped(compound, self.dim)
+
+    def __mul__(self, loc: Union[Location, List[Location], LocationArray]):
+        if _lazy_expressions.get()[0]:
+            return _expression("mul", self, loc)
+        if isinstance(loc, (list, tuple, LocationArray)):
+            return self._instances(loc, relative=True)
         if self.dim == 3:
             return copy.copy(self).move(loc)
         else:
             return self.moved(loc)
 
-    def __matmul__(self, obj: Union[float, Location, Plane]):
+    def __matmul__(
+        self, obj: Union[float, Location, Plane, List[Location], LocationArray]
+    ):
+        if _lazy_expressions.get()[0] and isinstance(
+            obj, (Location, Plane, list, tuple, LocationArray)
+        ):
+            return _expression("matmul", self, obj)
+
+        if isinstance(obj, (list, tuple, LocationArray)):
+            return self._instances(obj, relative=False)
+
         if isinstance(obj, (int, float)):
             if self.dim == 1:
                 return Wire.make_wire(self.edges()).position_at(obj)
@@ -262,13 +1014,118 @@ class AlgCompound(Compound):
             raise RuntimeError("solid() exists for dim==3 only")
 
 
+#
+# Base classes of the objects in part.py, sketch.py and line.py
+#
+
+
+class _Primitive(AlgCompound):
+    """Within LazyExpressions, creating an object returns an expression node keyed
+    by its class and parameters, so equal objects are only built once"""
+
+    _primitive_dim = None
+
+    # PrimitiveCache: None caches the objects of alg123d only, True opts a subclass
+    # in (its __init__ must only build the shape, it doesn't run on a hit), False out
+    _cacheable = None
+
+    def __new__(cls, *args, **kwargs):
+        # copy and pickle call __new__ without arguments
+        if _lazy_expressions.get()[0] and (args or kwargs):
+            from .expression import primitive
+
+            return primitive(cls, args, kwargs)
+        return super().__new__(cls)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "__init__" in cls.__dict__:
+            init = traced(cls.__qualname__)(cls.__init__)
+            cacheable = cls.__dict__.get("_cacheable")
+            if cacheable is None:
+                cacheable = cls.__module__.split(".")[0] == __name__.split(".")[0]
+            cls.__init__ = _cached_init(init) if cacheable else init
+
+    @traced()
+    def aligned(self, obj: Union[Solid, Face], align) -> Union[Solid, Face]:
+        """Align a solid or face like build123d's BasePartObject / BaseSketchObject
+
+        Primitives built directly from Solid.make_* / Face.make_* use this instead of
+        create_part / create_sketch, which enter a builder context just to do the same.
+        """
+        if align is not None:
+            obj.move(_align_location(obj, align, self._primitive_dim))
+        return obj
+
+
+def _cached_init(init):
+    """look up the object in the active PrimitiveCache before running init"""
+    signature = inspect.signature(init)
+
+    @functools.wraps(init)
+    def wrapper(self, *args, **kwargs):
+        cache = _primitive_cache.get()
+        # super().__init__() calls of subclasses are not cached separately
+        if cache is None or type(self).__init__ is not wrapper:
+            return init(self, *args, **kwargs)
+
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        cls = type(self)
+        key = (
+            f"{cls.__module__}.{cls.__qualname__}",
+            make_key(bound.args[1:]),
+            make_key(bound.kwargs),
+        )
+
+        entry = _cache_get(cache, key)
+        if entry is None:
+            init(self, *args, **kwargs)
+            _cache_put(cache, key, self)
+        else:
+            shape, dim = entry
+            Compound.__init__(self, downcast(shape))
+            self.dim = dim
+            if dim == 3:
+                self.metadata = {}
+
+    return wrapper
+
+
+class PartObject(_Primitive):
+    _primitive_dim = 3
+
+
+class SketchObject(_Primitive):
+    _primitive_dim = 2
+
+
+class LineObject(_Primitive):
+    _primitive_dim = 1
+
+
 #
 # Function wrapper
 #
 
 
+@traced()
 def create_compound(
     cls, objects=None, part=None, dim=None, faces=None, planes=None, params=None
+) -> AlgCompound:
+    if isinstance(objects, Iterator):
+        objects = list(objects)
+
+    with _raw():
+        return _memoized(
+            (f"{cls.__module__}.{cls.__qualname__}", _clean.get()),
+            (objects, part, dim, faces, planes, params),
+            lambda: _create_compound(cls, objects, part, dim, faces, planes, params),
+        )
+
+
+def _create_compound(
+    cls, objects=None, part=None, dim=None, faces=None, planes=None, params=None
 ) -> AlgCompound:
     if objects is None:
         objs = None
@@ -323,14 +1180,11 @@ def create_compound(
 
     solids = compound.solids()
     if len(solids) > 1:
-        result = AlgCompound(solids[0].fuse(*solids[1:]))
+        result = AlgCompound(bool_op(Mode.ADD, solids[0], solids[1:]))
     else:
         result = AlgCompound(compound)
 
-    if SkipClean.clean:
-        return result.clean()
-    else:
-        return result
+    return _cleaned(result, part)
 
 
 #
@@ -339,36 +1193,98 @@ def create_compound(
 
 
 class LazyAlgCompound(AlgCompound):
+    """Collect +, - and & within the context and run them as batched booleans at exit
+
+    The operations keep their order, consecutive additions are fused at once and
+    consecutive subtractions are cut at once, so all pockets followed by all bosses
+    need two booleans. A LazyAlgCompound ending within another one stays unresolved
+    until it is read. If it only holds additions, adding it to or subtracting it
+    from the outer one merges its operands into the outer operations.
+    """
+
     def __init__(self):
         super().__init__()
 
     def __enter__(self):
-        self._collected_objects = []
+        self._collecting = True
+        self._operands = []  # (mode, obj) in the order of the operations
+        self._token = _lazy_scopes.set(_lazy_scopes.get() + (self,))
         return self
 
-    def __add__(self, other):
-        if hasattr(self, "_collected_objects"):
-            if other.solids():
-                dim = 3
-            elif other.faces():
-                dim = 2
-            else:
-                dim = 1
+    def _collect(self, mode: Mode, other) -> LazyAlgCompound:
+        for obj in to_list(other):
+            dim = _dim(obj)
+            if dim == 0:  # empty AlgCompound
+                continue
 
             if self.dim == 0:
                 self.dim = dim
+            elif dim != self.dim:
+                raise RuntimeError(
+                    "Cannot combine objects of different dimensionality: "
+                    f"{self.dim} and {dim}"
+                )
+            if dim == 1 and mode != Mode.ADD:
+                raise RuntimeError("Lines can only be added")
+
+            if (
+                mode != Mode.INTERSECT
+                and isinstance(obj, LazyAlgCompound)
+                and obj._deferred
+                and all(m == Mode.ADD for m, _ in obj._operands)
+            ):
+                self._operands.extend((mode, o) for _, o in obj._operands)
             else:
-                if dim != self.dim:
-                    raise RuntimeError("Cannot add objects with different dimensions")
+                self._operands.append((mode, obj))
 
-            self._collected_objects.append(other)
-            return self
+        return self
 
-        else:
-            return super().__add__(other)
+    def __add__(self, other):
+        if self.__dict__.get("_collecting"):
+            return self._collect(Mode.ADD, other)
+        return super().__add__(other)
+
+    def __sub__(self, other):
+        if self.__dict__.get("_collecting"):
+            return self._collect(Mode.SUBTRACT, other)
+        return super().__sub__(other)
+
+    def __and__(self, other):
+        if self.__dict__.get("_collecting"):
+            return self._collect(Mode.INTERSECT, other)
+        return super().__and__(other)
 
     def __exit__(self, exception_type, exception_value, traceback):
-        self.wrapped = (
-            self._collected_objects.pop().fuse(*self._collected_objects).clean().wrapped
-        )
-        del self._collected_objects
+        self._collecting = False
+        _lazy_scopes.reset(self._token)
+        if exception_type is not None:
+            return
+
+        if _lazy_scopes.get():  # nested: resolved on read or merged into the outer one
+            self._deferred = True
+        else:
+            self._resolve()
+
+    def _resolve(self):
+        self._deferred = False
+        batches = _batches((mode, [obj]) for mode, obj in self._operands)
+        if not batches:
+            return
+        if batches[0][0] != Mode.ADD:
+            raise RuntimeError("Can only add to an empty AlgCompound object")
+
+        result = AlgCompound()
+        for mode, objs in batches:
+            if mode == Mode.ADD:
+                result = result + objs
+            elif mode == Mode.SUBTRACT:
+                result = result - objs
+            else:
+                result = result & objs[0]  # intersections are never batched
+
+        with _raw():
+            self.wrapped = result.wrapped
+        self._unclean, self._clean_count = result._unclean, result._clean_count
+        self.dim = result.dim
+        if self.dim == 3:
+            self.metadata = {}
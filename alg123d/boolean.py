@@ -0,0 +1,152 @@
+from collections import namedtuple
+from contextvars import ContextVar
+from enum import Enum, auto
+from typing import List
+
+from OCP.BOPAlgo import BOPAlgo_GlueEnum
+from OCP.BRepAlgoAPI import BRepAlgoAPI_Common, BRepAlgoAPI_Cut, BRepAlgoAPI_Fuse
+from OCP.TopTools import TopTools_ListOfShape
+
+from .topology import *
+
+__all__ = ["Glue", "BooleanOptions"]
+
+#
+# Options of the OCCT boolean operations
+#
+
+
+class Glue(Enum):
+    """glue mode of OCCT booleans for shapes that touch, but don't overlap
+
+    OFF: normal boolean operation
+    SHIFT: shapes only share faces, edges or vertices (e.g. a grid of bricks)
+    FULL: shapes are (partially) coinciding, but don't intersect otherwise
+    """
+
+    OFF = auto()
+    SHIFT = auto()
+    FULL = auto()
+
+
+_GLUE = {
+    Glue.OFF: BOPAlgo_GlueEnum.BOPAlgo_GlueOff,
+    Glue.SHIFT: BOPAlgo_GlueEnum.BOPAlgo_GlueShift,
+    Glue.FULL: BOPAlgo_GlueEnum.BOPAlgo_GlueFull,
+}
+
+Options = namedtuple(
+    "Options", ["parallel", "fuzzy_value", "glue", "non_destructive", "use_obb"]
+)
+
+_DEFAULT = Options(
+    parallel=True, fuzzy_value=None, glue=Glue.OFF, non_destructive=False, use_obb=False
+)
+
+_boolean_options = ContextVar("boolean_options", default=_DEFAULT)
+
+# History collecting the BRepTools_History of the booleans of an operation
+_boolean_history = ContextVar("boolean_history", default=None)
+
+
+class BooleanOptions:
+    """Options of all boolean operations (+, -, &, fuse of results) within the context
+
+    Options that are None are taken from the enclosing context, so contexts can be
+    nested to override single options.
+
+    Args:
+        parallel (bool, optional): run OCCT's boolean in parallel threads.
+            Defaults to True.
+        fuzzy_value (float, optional): additional tolerance to treat nearly coinciding
+            geometry as coinciding. Defaults to None.
+        glue (Glue, optional): glue mode for touching, not overlapping shapes.
+            Defaults to Glue.OFF.
+        non_destructive (bool, optional): don't modify the operands (e.g. their
+            tolerances), which can save copies of shared shapes. Defaults to False.
+        use_obb (bool, optional): use oriented bounding boxes to filter the
+            sub-shapes to intersect. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        parallel: bool = None,
+        fuzzy_value: float = None,
+        glue: Glue = None,
+        non_destructive: bool = None,
+        use_obb: bool = None,
+    ):
+        self._overrides = dict(
+            parallel=parallel,
+            fuzzy_value=fuzzy_value,
+            glue=glue,
+            non_destructive=non_destructive,
+            use_obb=use_obb,
+        )
+
+    def __enter__(self):
+        current = _boolean_options.get()
+        options = current._replace(
+            **{k: v for k, v in self._overrides.items() if v is not None}
+        )
+        self._token = _boolean_options.set(options)
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        _boolean_options.reset(self._token)
+
+    @staticmethod
+    def current() -> Options:
+        return _boolean_options.get()
+
+
+#
+# Boolean operation
+#
+
+_OPERATIONS = {
+    Mode.ADD: BRepAlgoAPI_Fuse,
+    Mode.SUBTRACT: BRepAlgoAPI_Cut,
+    Mode.INTERSECT: BRepAlgoAPI_Common,
+}
+
+
+def bool_op(
+    mode: Mode, obj: Shape, tools: List[Shape], options: Options = None
+) -> Shape:
+    """Fuse, cut or intersect obj with tools like Shape.fuse/cut/intersect, with options
+
+    The objects of a Compound are the arguments of the operation, for fuse all but
+    the first are tools. options default to the ones of the active BooleanOptions.
+    """
+    if options is None:
+        options = _boolean_options.get()
+
+    args = list(obj) if isinstance(obj, Compound) else [obj]
+    if mode == Mode.ADD:
+        args, tools = args[:1], args[1:] + list(tools)
+        if not tools:
+            return args[0]
+
+    arguments = TopTools_ListOfShape()
+    for arg in args:
+        arguments.Append(arg.wrapped)
+    tool_list = TopTools_ListOfShape()
+    for tool in tools:
+        tool_list.Append(tool.wrapped)
+
+    operation = _OPERATIONS[mode]()
+    operation.SetArguments(arguments)
+    operation.SetTools(tool_list)
+    operation.SetRunParallel(options.parallel)
+    if options.fuzzy_value:
+        operation.SetFuzzyValue(options.fuzzy_value)
+    operation.SetGlue(_GLUE[options.glue])
+    operation.SetNonDestructive(options.non_destructive)
+    operation.SetUseOBB(options.use_obb)
+    operation.Build()
+
+    history = _boolean_history.get()
+    if history is not None:
+        history.add(operation.History())
+
+    return Shape.cast(operation.Shape())
@@ -0,0 +1,166 @@
+import functools
+import mmap
+import os
+import tempfile
+import threading
+from contextlib import contextmanager, suppress
+from importlib import metadata
+from typing import Tuple
+
+from OCP.BinTools import BinTools
+from OCP.TopoDS import TopoDS_Shape
+
+try:
+    import fcntl
+except ImportError:  # Windows: no inter-process lock, writes are still atomic
+    fcntl = None
+
+__all__ = ["BRepCache"]
+
+#
+# Content addressed BRep files
+#
+
+
+def _version(package: str) -> str:
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+@functools.lru_cache(maxsize=None)
+def library_versions() -> Tuple[str, ...]:
+    """versions that affect the results of operations, part of every disk cache key"""
+    return tuple(_version(p) for p in ("alg123d", "build123d", "cadquery-ocp"))
+
+
+class BRepCache:
+    """Cache of shapes as binary BRep files in a directory shared between processes
+
+    Every entry is a file named by its key, holding the dimension of the shape
+    (one byte) and the binary BRep. Files are written to a temporary file and
+    renamed, so readers never see partial entries and need no lock. Reads use
+    memory mapped files and update the modification time, which is used for the
+    least recently used eviction once the files exceed max_bytes. The directory
+    is only scanned again when the size at the last scan plus the bytes written
+    since by this process exceed max_bytes. Writing and evicting take an
+    exclusive lock on the directory, so several worker processes can safely use
+    the same cache. Unreadable entries (e.g. truncated files) are cache misses
+    and get removed.
+
+    Args:
+        directory (str): cache directory, created if it doesn't exist
+        max_bytes (int, optional): maximum size of all entries. Defaults to 1 GB.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 2**30):
+        self.directory = os.path.abspath(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size = None  # at the last scan plus the writes since, None: not scanned
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.brep")
+
+    @contextmanager
+    def _locked(self):
+        with self._lock, open(os.path.join(self.directory, ".lock"), "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def get(self, key: str) -> Tuple[TopoDS_Shape, int]:
+        """shape and dim stored for key, or None"""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as data:
+                dim = data[0]
+                data.seek(1)
+                shape = TopoDS_Shape()
+                BinTools.Read_s(shape, data)
+        except FileNotFoundError:  # missing or evicted
+            self.misses += 1
+            return None
+        except Exception:  # empty, truncated or corrupt file (e.g. Standard_Failure)
+            self.misses += 1
+            with self._locked(), suppress(FileNotFoundError):
+                os.remove(path)
+            return None
+
+        with suppress(FileNotFoundError):  # evicted by another process meanwhile
+            os.utime(path)
+        self.hits += 1
+        return shape, dim
+
+    def put(self, key: str, shape: TopoDS_Shape, dim: int):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(bytes([dim]))
+                BinTools.Write_s(shape, f)
+                size = f.tell()
+            with self._locked():
+                os.replace(tmp, path)
+                if self._size is not None:
+                    self._size += size
+                if self._size is None or self._size > self.max_bytes:
+                    self._size = self._evict()
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def _entries(self):
+        for sub in os.scandir(self.directory):
+            if sub.is_dir():
+                for entry in os.scandir(sub.path):
+                    if entry.name.endswith(".brep"):
+                        yield entry
+
+    def _evict(self) -> int:
+        """remove the least recently used entries beyond max_bytes, the size left"""
+        entries = []
+        for e in self._entries():
+            with suppress(FileNotFoundError):  # removed by another process meanwhile
+                stat = e.stat()
+                entries.append((stat.st_mtime, stat.st_size, e.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            with suppress(FileNotFoundError):
+                os.remove(path)
+            total -= size
+            self.evictions += 1
+        return total
+
+    def clear(self):
+        with self._locked():
+            for entry in list(self._entries()):
+                os.remove(entry.path)
+            self._size = 0
+
+    @property
+    def stats(self) -> dict:
+        entries = list(self._entries())
+        return dict(
+            entries=len(entries),
+            bytes=sum(e.stat().st_size for e in entries),
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+        )
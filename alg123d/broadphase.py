@@ -0,0 +1,81 @@
+from math import inf
+from typing import List, Tuple
+
+from OCP.Bnd import Bnd_Box
+from OCP.BRepBndLib import BRepBndLib
+from OCP.Precision import Precision
+
+from .boolean import BooleanOptions
+from .topology import *
+
+__all__ = ["bounds", "overlap", "overlap_clusters"]
+
+Bounds = Tuple[float, float, float, float, float, float]
+
+#
+# Axis aligned bounding boxes
+#
+
+
+def bounds(shape: Shape) -> Bounds:
+    """(xmin, ymin, zmin, xmax, ymax, zmax) of shape, enlarged by the tolerance
+
+    Within BooleanOptions(fuzzy_value=...) the box is enlarged by the fuzzy value,
+    too, since the booleans then also join shapes that nearly touch.
+    """
+    box = Bnd_Box()
+    BRepBndLib.Add_s(shape.wrapped, box, True)
+    if box.IsVoid():
+        # unknown extent, so it needs to be treated as overlapping everything
+        return (-inf, -inf, -inf, inf, inf, inf)
+
+    box.Enlarge(Precision.Confusion_s() + (BooleanOptions.current().fuzzy_value or 0))
+    return box.Get()
+
+
+def overlap(b1: Bounds, b2: Bounds) -> bool:
+    return all(b1[i] <= b2[i + 3] and b2[i] <= b1[i + 3] for i in range(3))
+
+
+#
+# Broad phase
+#
+
+
+def overlap_clusters(boxes: List[Bounds]) -> List[List[int]]:
+    """Group the indices of boxes into connected clusters of overlapping boxes
+
+    Sort and sweep along the axis of the largest extent, so only boxes whose
+    intervals on this axis overlap get compared. The clusters are the connected
+    components of the overlap graph (union find). Indices within a cluster and
+    the clusters themselves are ordered by index.
+    """
+    parent = list(range(len(boxes)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    finite = [b for b in boxes if b[0] != -inf] or boxes
+    extents = [
+        max(b[i + 3] for b in finite) - min(b[i] for b in finite) for i in range(3)
+    ]
+    axis = extents.index(max(extents))
+
+    active = []
+    for i in sorted(range(len(boxes)), key=lambda i: boxes[i][axis]):
+        active = [j for j in active if boxes[j][axis + 3] >= boxes[i][axis]]
+        for j in active:
+            if overlap(boxes[i], boxes[j]):
+                root_i, root_j = find(i), find(j)
+                if root_i != root_j:
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
+        active.append(i)
+
+    clusters = {}
+    for i in range(len(boxes)):
+        clusters.setdefault(find(i), []).append(i)
+
+    return list(clusters.values())
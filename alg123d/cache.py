@@ -0,0 +1,86 @@
+import io
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from OCP.BinTools import BinTools
+from OCP.TopoDS import TopoDS_Shape
+
+__all__ = ["LRUCache"]
+
+#
+# In-memory LRU cache
+#
+
+
+def shape_size(shape: TopoDS_Shape) -> int:
+    """size in bytes of the binary BRep of shape, an estimate of its memory footprint"""
+    stream = io.BytesIO()
+    BinTools.Write_s(shape, stream)
+    return len(stream.getvalue())
+
+
+class LRUCache:
+    """Thread safe least recently used cache, bounded by entries and/or bytes
+
+    Args:
+        max_entries (int, optional): maximum number of entries. Defaults to None
+            (unbounded).
+        max_bytes (int, optional): maximum sum of the entry sizes. Defaults to None
+            (unbounded).
+    """
+
+    def __init__(self, max_entries: int = None, max_bytes: int = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """value of key (marked as most recently used) or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: int = 0):
+        """store value and evict least recently used entries beyond the limits"""
+        with self._lock:
+            if key in self._entries:
+                self.bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self.bytes += size
+
+            while self._entries and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+                or (self.max_bytes is not None and self.bytes > self.max_bytes)
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    @property
+    def stats(self) -> dict:
+        return dict(
+            entries=len(self._entries),
+            bytes=self.bytes,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+        )
@@ -1,9 +1,17 @@
+from __future__ import annotations
+
+from math import sqrt
+
 import build123d as bd
 from build123d.build_common import CM, FT, IN, MM, M
+import numpy as np
+from OCP.gp import gp_Trsf
+from OCP.TopLoc import TopLoc_Location
 
 from .topology import *
 
 __all__ = [
+    "LocationArray",
     "LocationList",
     "Locations",
     "PolarLocations",
@@ -17,29 +25,149 @@ __all__ = [
 ]
 
 
-class LocationList:
-    def __init__(self, loclist):
-        bd.Workplanes(Plane.XY).__enter__()
-        self.locations = loclist.locations
-        self.index = 0
+#
+# Arrays of locations
+#
+
+
+def _matrix(loc: Union[Location, Plane]) -> np.ndarray:
+    """4x4 homogeneous matrix of a location or plane"""
+    if isinstance(loc, Plane):
+        loc = loc.location
+    trsf = loc.wrapped.Transformation()
+    m = np.eye(4)
+    for r in range(3):
+        for c in range(4):
+            m[r, c] = trsf.Value(r + 1, c + 1)
+    return m
+
+
+def _toploc(m: np.ndarray) -> TopLoc_Location:
+    trsf = gp_Trsf()
+    trsf.SetValues(*m[:3].ravel().tolist())
+    return TopLoc_Location(trsf)
+
+
+def _location(m: np.ndarray) -> Location:
+    return Location(_toploc(m))
+
+
+def _rotations_z(angles: np.ndarray) -> np.ndarray:
+    """N x 4 x 4 rotations around the z-axis by angles (in degrees)"""
+    a = np.radians(angles)
+    m = np.zeros((len(a), 4, 4))
+    m[:, 0, 0] = m[:, 1, 1] = np.cos(a)
+    m[:, 0, 1] = -np.sin(a)
+    m[:, 1, 0] = np.sin(a)
+    m[:, 2, 2] = m[:, 3, 3] = 1
+    return m
+
+
+class LocationArray:
+    """Locations as N x 4 x 4 array of homogeneous matrices
+
+    Masking, indexing and composition with a Location or Plane work on the
+    array, Location objects are only created when the locations are iterated
+    or an element is accessed by an int index:
+
+        locs = GridLocations(1, 1, 100, 100)
+        x, y = locs.positions[:, 0], locs.positions[:, 1]
+        locs = Plane.XZ * locs[x**2 + y**2 < 40**2]
+
+    Args:
+        matrices (np.ndarray): N x 4 x 4 array of homogeneous matrices
+    """
+
+    def __init__(self, matrices: np.ndarray):
+        self.matrices = np.asarray(matrices, dtype=float).reshape(-1, 4, 4)
+        self._locations = None
+
+    @classmethod
+    def from_locations(
+        cls, locations: Iterable[Union[Location, Plane]]
+    ) -> LocationArray:
+        return cls(np.array([_matrix(loc) for loc in locations]).reshape(-1, 4, 4))
+
+    @classmethod
+    def from_positions(cls, positions: np.ndarray) -> LocationArray:
+        """locations without rotation at the points of an N x 2 or N x 3 array"""
+        positions = np.asarray(positions, dtype=float)
+        matrices = np.tile(np.eye(4), (len(positions), 1, 1))
+        matrices[:, : positions.shape[1], 3] = positions
+        return cls(matrices)
+
+    @property
+    def positions(self) -> np.ndarray:
+        """N x 3 array of the positions (a view, not a copy)"""
+        return self.matrices[:, :3, 3]
+
+    @property
+    def locations(self) -> List[Location]:
+        if self._locations is None:
+            self._locations = [_location(m) for m in self.matrices]
+        return self._locations
+
+    def toplocs(self) -> List[TopLoc_Location]:
+        """the OCCT locations, without creating Location objects"""
+        if self._locations is not None:
+            return [loc.wrapped for loc in self._locations]
+        return [_toploc(m) for m in self.matrices]
+
+    def __len__(self):
+        return len(self.matrices)
 
     def __iter__(self):
-        self.index = 0
-        return self
+        return iter(self.locations)
+
+    def __getitem__(self, index) -> Union[Location, LocationArray]:
+        if isinstance(index, (int, np.integer)):
+            return self.locations[index]
+        return LocationArray(self.matrices[index])
+
+    def __mul__(self, other: Union[Location, LocationArray]) -> LocationArray:
+        """every location multiplied by other, i.e. other relative to the locations"""
+        if isinstance(other, LocationArray):
+            return LocationArray(self.matrices @ other.matrices)
+        return LocationArray(self.matrices @ _matrix(other))
+
+    def __rmul__(self, other: Union[Location, Plane]) -> LocationArray:
+        return LocationArray(_matrix(other) @ self.matrices)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(count={len(self)})"
+
 
-    def __next__(self):
-        if self.index < len(self.locations):
-            result = self.locations[self.index]
-            self.index += 1
-            return result
-        else:
-            raise StopIteration
+# Location * LocationArray and Plane * LocationArray
+
+
+def _patch_mul(cls):
+    mul = cls.__mul__
+
+    def __mul__(self, other):
+        if isinstance(other, LocationArray):
+            return other.__rmul__(self)
+        return mul(self, other)
+
+    cls.__mul__ = __mul__
+
+
+_patch_mul(Location)
+_patch_mul(Plane)
+
+
+class LocationList(LocationArray):
+    def __init__(self, loclist):
+        # scoped workplane instead of a global one, so threads don't share it
+        with bd.Workplanes(Plane.XY):
+            locations = loclist.locations
+        super().__init__(LocationArray.from_locations(locations).matrices)
+        self._locations = locations
 
 
 class Locations(LocationList):
     def __init__(self, *pts: Union[VectorLike, Vertex, Location]):
-        bd.Workplanes(Plane.XY).__enter__()
-        super().__init__(bd.Locations(*pts))
+        with bd.Workplanes(Plane.XY):
+            super().__init__(bd.Locations(*pts))
 
 
 class PolarLocations(LocationList):
@@ -51,10 +179,25 @@ class PolarLocations(LocationList):
         angular_range: float = 360.0,
         rotate: bool = True,
     ):
-        bd.Workplanes(Plane.XY).__enter__()
-        super().__init__(
-            bd.PolarLocations(radius, count, start_angle, angular_range, rotate)
-        )
+        angles = start_angle + angular_range / count * np.arange(count)
+        matrices = _rotations_z(angles)
+        matrices[:, 0, 3] = radius * np.cos(np.radians(angles))
+        matrices[:, 1, 3] = radius * np.sin(np.radians(angles))
+        if not rotate:
+            matrices[:, :3, :3] = np.eye(3)
+        LocationArray.__init__(self, matrices)
+
+
+def _align_offset(size: List[float], align: Tuple[Align, Align]) -> np.ndarray:
+    offset = []
+    for i in range(2):
+        if align[i] == Align.MIN:
+            offset.append(0.0)
+        elif align[i] == Align.CENTER:
+            offset.append(-size[i] / 2)
+        elif align[i] == Align.MAX:
+            offset.append(-size[i])
+    return np.array(offset)
 
 
 class GridLocations(LocationList):
@@ -69,10 +212,12 @@ class GridLocations(LocationList):
         if isinstance(align, Align):
             align = (align,) * 2
 
-        bd.Workplanes(Plane.XY).__enter__()
-        super().__init__(
-            bd.GridLocations(x_spacing, y_spacing, x_count, y_count, align)
-        )
+        size = [x_spacing * (x_count - 1), y_spacing * (y_count - 1)]
+        # same order as build123d: x outer, y inner loop
+        i, j = np.meshgrid(np.arange(x_count), np.arange(y_count), indexing="ij")
+        points = np.stack([i.ravel() * x_spacing, j.ravel() * y_spacing], axis=1)
+        points = points + _align_offset(size, align)
+        LocationArray.__init__(self, LocationArray.from_positions(points).matrices)
 
 
 class HexLocations(LocationList):
@@ -86,5 +231,22 @@ class HexLocations(LocationList):
         if isinstance(align, Align):
             align = (align,) * 2
 
-        bd.Workplanes(Plane.XY).__enter__()
-        super().__init__(bd.HexLocations(apothem, x_count, y_count, align))
+        diagonal = 4 * apothem / sqrt(3)
+        x_spacing = 3 * diagonal / 4
+        y_spacing = diagonal * sqrt(3) / 2
+
+        # same order as build123d: even columns first, then odd columns (shifted)
+        points = []
+        for first, shift in ((0, y_spacing / 2), (1, y_spacing)):
+            i, j = np.meshgrid(
+                np.arange(first, x_count, 2), np.arange(y_count), indexing="ij"
+            )
+            points.append(
+                np.stack([i.ravel() * x_spacing, j.ravel() * y_spacing + shift], axis=1)
+            )
+        points = np.concatenate(points)
+
+        min_corner = points.min(axis=0)
+        size = points.max(axis=0) - min_corner
+        points = points - min_corner + _align_offset(size, align)
+        LocationArray.__init__(self, LocationArray.from_positions(points).matrices)
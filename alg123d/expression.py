@@ -0,0 +1,369 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import operator
+import weakref
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from typing import Any, Callable, Dict, List
+
+from OCP.TopLoc import TopLoc_Location
+
+from .boolean import _boolean_options
+from .algcompound import (
+    AlgCompound,
+    LazyExpressions,
+    _clean,
+    _clean_policy,
+    _lazy_expressions,
+    _snapshot,
+)
+from .fingerprint import ObjectKey, digest, is_persistent, make_key
+from .topology import *
+
+__all__ = ["ExprCompound", "evaluate"]
+
+OPERATORS = {
+    "add": operator.add,
+    "sub": operator.sub,
+    "and": operator.and_,
+    "mul": operator.mul,
+    "matmul": operator.matmul,
+}
+
+#
+# Expression graph
+#
+
+
+class _Node:
+    """Operation in the expression graph, shared by all equal expressions
+
+    The key is a digest of the operation, the keys of all inputs, the boolean
+    options and the clean state (SkipClean, CleanPolicy) active at creation, so
+    equal sub-expressions map to the same node and get evaluated only once. The
+    node runs with these options and this clean state, whichever context is active
+    when it is read.
+    """
+
+    __slots__ = (
+        "func",
+        "args",
+        "kwargs",
+        "key",
+        "dim",
+        "options",
+        "clean",
+        "policy",
+        "persistent",
+        "result",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        func: Callable,
+        args: tuple,
+        kwargs: dict,
+        key: str,
+        dim: int,
+        options,
+        clean: bool,
+        policy,
+        persistent: bool,
+    ):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.key = key
+        self.dim = dim
+        self.options = options
+        self.clean = clean
+        self.policy = policy
+        self.persistent = persistent
+        self.result = None
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def ref(self) -> tuple:
+        """key of the node as input of other keys
+
+        A node with an input keyed by identity (ObjectKey) only has a meaning in this
+        process, so it is referred to by identity, too.
+        """
+        return ("node", self.key if self.persistent else ObjectKey(self))
+
+    def children(self) -> List[_Node]:
+        result = []
+
+        def collect(value):
+            if isinstance(value, _Node):
+                result.append(value)
+            elif isinstance(value, (list, tuple)):
+                for v in value:
+                    collect(v)
+
+        collect(self.args)
+        collect(list(self.kwargs.values()))
+        return result
+
+    def run(self):
+        def resolve(value):
+            if isinstance(value, _Node):
+                return value.value()
+            elif isinstance(value, (list, tuple)):
+                return type(value)(resolve(v) for v in value)
+            else:
+                return value
+
+        args = resolve(self.args)
+        kwargs = {k: resolve(v) for k, v in self.kwargs.items()}
+        tokens = (
+            _boolean_options.set(self.options),
+            _clean.set(self.clean),
+            _clean_policy.set(self.policy),
+        )
+        try:
+            result = self.func(*args, **kwargs)
+        finally:
+            for var, token in zip((_boolean_options, _clean, _clean_policy), tokens):
+                var.reset(token)
+        self.result = result.wrapped
+        self.dim = result.dim
+
+    def value(self) -> AlgCompound:
+        """a fresh AlgCompound of the result, in-place changes stay out of the graph"""
+        return AlgCompound._from_wrapped(self.result.Moved(TopLoc_Location()), self.dim)
+
+
+_nodes = weakref.WeakValueDictionary()
+
+
+def _freeze(value: Any) -> Any:
+    """replace expressions by their nodes and snapshot concrete AlgCompounds"""
+    if isinstance(value, ExprCompound) and value._key_node() is not None:
+        return value._node
+    elif isinstance(value, AlgCompound) and value.dim != 0:
+        return _snapshot(value)
+    elif isinstance(value, Iterator):
+        return [_freeze(v) for v in value]
+    elif isinstance(value, list):
+        return [_freeze(v) for v in value]
+    elif isinstance(value, tuple):
+        return tuple(_freeze(v) for v in value)
+    else:
+        return value
+
+
+def _key(value: Any) -> Any:
+    if isinstance(value, _Node):
+        return value.ref()
+    elif isinstance(value, (list, tuple)):
+        return tuple(_key(v) for v in value)
+    else:
+        return make_key(value)
+
+
+def _func_key(func: Callable) -> str:
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+def node(func: Callable, args: tuple, kwargs: dict, dim: int) -> ExprCompound:
+    """expression for func(*args, **kwargs), sharing the node of an equal expression"""
+    args = _freeze(args)
+    kwargs = {k: _freeze(v) for k, v in kwargs.items()}
+    options = _boolean_options.get()
+    clean, policy = _clean.get(), _clean_policy.get()
+    mode = None if policy is None else (policy.mode, policy.threshold)
+    inputs = (_key(args), _key(kwargs))
+    key = digest((_func_key(func), *inputs, options, clean, mode))
+
+    shared = _nodes.get(key)
+    if shared is None:
+        persistent = is_persistent(inputs)
+        shared = _Node(func, args, kwargs, key, dim, options, clean, policy, persistent)
+        _nodes[key] = shared
+
+    return ExprCompound(shared)
+
+
+def primitive(cls: type, args: tuple, kwargs: dict) -> ExprCompound:
+    """expression creating cls(*args, **kwargs) of part.py, sketch.py or line.py"""
+    bound = inspect.signature(cls).bind(*args, **kwargs)
+    bound.apply_defaults()
+    return node(cls, bound.args, bound.kwargs, cls._primitive_dim)
+
+
+class ExprCompound(AlgCompound):
+    """AlgCompound defined by an expression, evaluated on first read of the shape"""
+
+    def __init__(self, node: _Node):
+        # no super().__init__(), everything is set in _resolve
+        self._node = node
+        self.dim = node.dim
+        self._deferred = True
+
+    # pickled as the evaluated AlgCompound
+    _pickle_class = AlgCompound
+
+    def _key_node(self) -> _Node:
+        """the node of the object while it is deferred or equal to the node's result
+
+        A resolved object moved or located in place, or a copy of it that is moved
+        or deep copied, no longer is the result of the node. Then the node is dropped
+        and the object is keyed like every other AlgCompound, by its shape.
+        """
+        node = self.__dict__.get("_node")
+        if node is None or self._deferred:
+            return node
+        if not self._wrapped.IsEqual(node.result):
+            del self._node
+            return None
+        return node
+
+    def __getattr__(self, name):
+        # Shape attributes (label, color, ...) only exist after evaluation
+        if not name.startswith("__") and self.__dict__.get("_deferred"):
+            self._resolve()
+            return getattr(self, name)
+        raise AttributeError(name)
+
+    def _resolve(self):
+        if self._node.result is None:
+            evaluate(self, workers=_lazy_expressions.get()[1])
+
+        self._deferred = False
+        result = self._node.value()
+        Compound.__init__(self, result.wrapped)
+        self.dim = result.dim
+        if self.dim == 3:
+            self.metadata = {}
+
+    def __repr__(self):
+        if self._deferred:
+            name, op = self.__class__.__name__, self._node.func.__name__
+            return f"obj={name}; op={op}; dim={self.dim}"
+        return super().__repr__()
+
+
+#
+# Evaluation
+#
+
+
+def reachable(roots: List[_Node]) -> List[_Node]:
+    """all nodes below roots (including roots), evaluated or not"""
+    seen = {}
+    stack = list(roots)
+    while stack:
+        n = stack.pop()
+        if n.key not in seen:
+            seen[n.key] = n
+            stack.extend(n.children())
+    return list(seen.values())
+
+
+def _schedule(roots: List[_Node]) -> Dict[_Node, List[_Node]]:
+    """all unevaluated nodes below roots with their unevaluated children"""
+    graph = {}
+    stack = [n for n in roots if n.result is None]
+    while stack:
+        n = stack.pop()
+        if n not in graph:
+            graph[n] = [c for c in n.children() if c.result is None]
+            stack.extend(graph[n])
+    return graph
+
+
+def evaluate(*exprs: ExprCompound, workers: int = None):
+    """Evaluate the expressions, running every distinct operation once
+
+    With workers > 1, operations whose inputs are ready get run concurrently in a
+    thread pool, i.e. independent branches of the graph are computed in parallel.
+    """
+    graph = _schedule(
+        [e._node for e in exprs if isinstance(e, ExprCompound) and e._deferred]
+    )
+
+    waiting = {n: len(set(children)) for n, children in graph.items()}
+    parents = {n: [] for n in graph}
+    for n, children in graph.items():
+        for c in set(children):
+            parents[c].append(n)
+
+    def done(n):
+        for p in parents[n]:
+            waiting[p] -= 1
+            if waiting[p] == 0:
+                yield p
+
+    with LazyExpressions.disabled():
+        ready = [n for n, count in waiting.items() if count == 0]
+
+        if workers is None or workers < 2:
+            while ready:
+                n = ready.pop()
+                n.run()
+                ready.extend(done(n))
+        else:
+            # threads start with an empty context, so hand over the caller's one
+            context = copy_context()
+
+            def submit(n):
+                return executor.submit(context.copy().run, n.run)
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {submit(n): n for n in ready}
+                while futures:
+                    finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        n = futures.pop(future)
+                        future.result()
+                        for p in done(n):
+                            futures[submit(p)] = p
+
+
+#
+# Function wrapper
+#
+
+
+def _dim_of(args: tuple) -> int:
+    for arg in args:
+        if isinstance(arg, (list, tuple)) and len(arg) > 0:
+            arg = arg[0]
+        if isinstance(arg, AlgCompound):
+            return arg.dim
+    return None
+
+
+def expression(dim: int = None):
+    """Let the decorated function build an expression node within LazyExpressions
+
+    dim is the dimension of the result, None means the dimension of the first
+    AlgCompound argument. If it cannot be determined, the function runs eagerly.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _lazy_expressions.get()[0]:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                result_dim = _dim_of(bound.args) if dim is None else dim
+                if result_dim is not None:
+                    return node(func, bound.args, bound.kwargs, result_dim)
+
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
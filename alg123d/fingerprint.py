@@ -0,0 +1,160 @@
+import hashlib
+from enum import Enum
+from typing import Any, Hashable
+
+import numpy as np
+from OCP.TopoDS import TopoDS_Shape
+
+from .common import LocationArray
+from .serialize import serialize
+from .topology import *
+
+__all__ = [
+    "make_key",
+    "digest",
+    "is_persistent",
+    "shape_fingerprint",
+    "ShapeKey",
+    "ObjectKey",
+]
+
+#
+# Keys for operation inputs
+#
+
+
+def shape_fingerprint(shape: Shape) -> str:
+    """sha1 of the binary BRep (without triangulation) of shape and its location"""
+    return hashlib.sha1(serialize(shape.wrapped)).hexdigest()
+
+
+class ShapeKey:
+    """Exact key of a shape: equal for the same TShape, location and orientation
+
+    It holds a reference to the shape, so the TShape cannot be freed and its
+    address reused while the key exists.
+    """
+
+    __slots__ = ("shape", "_hash")
+
+    def __init__(self, shape: TopoDS_Shape):
+        self.shape = shape
+        self._hash = shape.HashCode(2**31 - 1)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        return isinstance(other, ShapeKey) and self.shape.IsEqual(other.shape)
+
+    def __repr__(self):
+        return f"ShapeKey({self._hash})"
+
+
+class ObjectKey:
+    """Identity key of an object without a value key: only equal to itself
+
+    It holds a reference to the object, so the object cannot be freed and its id
+    reused by another object while the key exists, e.g. in a cache entry.
+    """
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __hash__(self):
+        return id(self.obj)
+
+    def __eq__(self, other):
+        return isinstance(other, ObjectKey) and self.obj is other.obj
+
+    def __repr__(self):
+        return f"ObjectKey({type(self.obj).__name__}, {id(self.obj)})"
+
+
+def _location_key(loc: Location) -> tuple:
+    trsf = loc.wrapped.Transformation()
+    return tuple(trsf.Value(r, c) for r in range(1, 4) for c in range(1, 5))
+
+
+def make_key(value: Any, identity: bool = False) -> Hashable:
+    """Hashable key of an operation parameter
+
+    Numbers, strings and enums are taken as they are (NumPy scalars as the equal
+    Python numbers, arrays by dtype, shape and data), geometry objects by their
+    values and shapes by the fingerprint of their BRep. Equal keys mean equal
+    values, so the keys can be used to memoize operations. Unknown objects are
+    keyed by ObjectKey, i.e. they are only equal to themselves, and the key keeps
+    them alive.
+
+    With identity=True, shapes are keyed by ShapeKey instead of the fingerprint.
+    This is much cheaper, but only equal for shapes sharing the same TShape, and
+    such keys cannot be passed to digest.
+    """
+    if isinstance(value, np.generic):
+        return make_key(value.item(), identity)
+
+    elif value is None or isinstance(value, (bool, int, float, str, Enum)):
+        return value
+
+    elif isinstance(value, np.ndarray):
+        data = hashlib.sha1(np.ascontiguousarray(value).tobytes()).hexdigest()
+        return ("array", value.dtype.str, value.shape, data)
+
+    elif isinstance(value, Shape):
+        # expression node while the object is the result of the node, see expression.py
+        node = value._key_node() if hasattr(value, "_key_node") else None
+        if node is not None:
+            return node.ref()
+        elif value.wrapped is None:  # empty AlgCompound
+            return ("shape", None)
+        elif identity:
+            return ("shape", ShapeKey(value.wrapped))
+        return ("shape", shape_fingerprint(value))
+
+    elif isinstance(value, Location):
+        return ("location", _location_key(value))
+
+    elif isinstance(value, Plane):
+        return (
+            "plane",
+            value.origin.to_tuple(),
+            value.x_dir.to_tuple(),
+            value.z_dir.to_tuple(),
+        )
+
+    elif isinstance(value, Axis):
+        return ("axis", value.position.to_tuple(), value.direction.to_tuple())
+
+    elif isinstance(value, LocationArray):
+        return ("locations", hashlib.sha1(value.matrices.tobytes()).hexdigest())
+
+    elif isinstance(value, Vector):
+        return ("vector", value.to_tuple())
+
+    elif isinstance(value, (list, tuple)):
+        return tuple(make_key(v, identity) for v in value)
+
+    elif isinstance(value, dict):
+        return tuple((k, make_key(v, identity)) for k, v in sorted(value.items()))
+
+    else:
+        return ("object", ObjectKey(value))
+
+
+def is_persistent(key: Hashable) -> bool:
+    """whether key only holds values, i.e. its digest means the same in every process
+
+    Keys holding an ObjectKey or ShapeKey are only valid in this process.
+    """
+    if isinstance(key, (ObjectKey, ShapeKey)):
+        return False
+    elif isinstance(key, tuple):
+        return all(is_persistent(k) for k in key)
+    return True
+
+
+def digest(key: Hashable) -> str:
+    """short, stable string for a (possibly deeply nested) key"""
+    return hashlib.sha1(repr(key).encode()).hexdigest()
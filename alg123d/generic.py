@@ -1,12 +1,16 @@
-import copy
 from typing import List, Tuple, Union
 
 import build123d as bd
+from OCP.TopTools import TopTools_MapOfShape
 
 from .algcompound import AlgCompound, create_compound
+from .common import LocationArray
+from .expression import expression
+from .profiling import traced
 from .topology import *
+from .utils import to_list
 
-__all__ = ["chamfer", "fillet", "mirror", "offset", "scale", "split"]
+__all__ = ["chamfer", "fillet", "mirror", "offset", "scale", "split", "pattern"]
 
 
 #
@@ -112,30 +116,58 @@ class Fillet(Compound):
 #
 
 
+def _boundary_edges(part: AlgCompound, objects) -> list:
+    """objects with the faces of a part replaced by their edges (each edge once)"""
+    if (
+        part is None
+        or part.dim != 3
+        or not any(isinstance(obj, Face) for obj in to_list(objects))
+    ):
+        return objects
+
+    adjacency = part.adjacency
+    seen = TopTools_MapOfShape()
+    result = []
+    for obj in to_list(objects):
+        for edge in adjacency.edges_of(obj) if isinstance(obj, Face) else [obj]:
+            if seen.Add(edge.wrapped):
+                result.append(edge)
+    return result
+
+
+@expression()
+@traced()
 def chamfer(
     part: AlgCompound,
-    objects: Union[List[Union[Edge, Vertex]], Edge, Vertex],
+    objects: Union[List[Union[Edge, Face, Vertex]], Edge, Face, Vertex],
     length: float,
     length2: float = None,
 ) -> AlgCompound:
     return create_compound(
         Chamfer,
-        objects,
+        _boundary_edges(part, objects),
         params=dict(length=length, length2=length2, mode=Mode.PRIVATE),
         part=part,
     )
 
 
+@expression()
+@traced()
 def fillet(
     part: AlgCompound,
-    objects: Union[List[Union[Edge, Vertex]], Edge, Vertex],
+    objects: Union[List[Union[Edge, Face, Vertex]], Edge, Face, Vertex],
     radius: float,
 ) -> AlgCompound:
     return create_compound(
-        Fillet, objects, params=dict(radius=radius, mode=Mode.PRIVATE), part=part
+        Fillet,
+        _boundary_edges(part, objects),
+        params=dict(radius=radius, mode=Mode.PRIVATE),
+        part=part,
     )
 
 
+@expression()
+@traced()
 def mirror(
     objects: Union[List[AlgCompound], AlgCompound],
     about: Plane = Plane.XZ,
@@ -145,6 +177,8 @@ def mirror(
     )
 
 
+@expression()
+@traced()
 def offset(
     objects: Union[List[AlgCompound], AlgCompound],
     amount: float,
@@ -162,6 +196,8 @@ def offset(
         return result
 
 
+@expression()
+@traced()
 def scale(objects: Shape, by: Union[float, Tuple[float, float, float]]) -> AlgCompound:
     if isinstance(by, (list, tuple)) and len(by) == 2:
         by = (*by, 1)
@@ -169,6 +205,8 @@ def scale(objects: Shape, by: Union[float, Tuple[float, float, float]]) -> AlgCo
     return create_compound(bd.Scale, objects, params=dict(by=by, mode=Mode.PRIVATE))
 
 
+@expression()
+@traced()
 def split(
     objects: Union[List[AlgCompound], AlgCompound],
     by: Plane = Plane.XZ,
@@ -177,3 +215,23 @@ def split(
     return create_compound(
         bd.Split, objects, params=dict(bisect_by=by, keep=keep, mode=Mode.PRIVATE)
     )
+
+
+@expression()
+@traced()
+def pattern(
+    part: AlgCompound,
+    tool: AlgCompound,
+    locations: Union[LocationArray, List[Location]],
+    mode: Mode = Mode.SUBTRACT,
+) -> AlgCompound:
+    """add, subtract or intersect tool placed at all locations with one boolean"""
+    instances = tool @ locations
+    if mode == Mode.ADD:
+        return part + instances
+    elif mode == Mode.SUBTRACT:
+        return part - instances
+    elif mode == Mode.INTERSECT:
+        return part & instances
+    else:
+        raise ValueError(f"Mode {mode} not supported for pattern")
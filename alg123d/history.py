@@ -0,0 +1,180 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List
+
+from OCP.BRepTools import BRepTools_History
+from OCP.TopTools import TopTools_IndexedMapOfShape
+from OCP.TopoDS import TopoDS_Shape
+
+from .boolean import _boolean_history
+from .topology import *
+from .topology import _TopologyIndex, _WRAPPERS, _lazy
+
+__all__ = ["History", "RecordHistory"]
+
+#
+# History of boolean operations
+#
+
+_record_history = ContextVar("record_history", default=False)
+
+
+class RecordHistory:
+    """Record the OCCT history of the operations (+, -, &) within the context
+
+    Only results created within the context answer modified, generated and
+    is_deleted (and modified_*, deleted_* of AlgCompound). The boolean caches are
+    bypassed, since their results have no OCCT history. new_* works for all results.
+    """
+
+    def __enter__(self):
+        self._token = _record_history.set(True)
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        _record_history.reset(self._token)
+
+
+class History:
+    """New, modified, generated and deleted sub-shapes of one operation (+, -, &)
+
+    The reference is the first operand, e.g. base in base - tool. The new
+    sub-shapes are the ones of the result the reference doesn't have. Within
+    RecordHistory the OCCT history (BRepTools_History) of every boolean of the
+    operation is recorded as well and merged with the history of the clean
+    (ShapeUpgrade_UnifySameDomain) of the result, so the images are sub-shapes of
+    the final result.
+
+    Only the shape of the first operand is kept, its topology index is built by
+    the first query that needs it.
+
+    Args:
+        reference (TopoDS_Shape): the shape of the first operand, None for an
+            empty first operand
+        recorded (bool): whether the OCCT history is recorded. Defaults to False.
+    """
+
+    def __init__(self, reference: TopoDS_Shape = None, recorded: bool = False):
+        # a copy, later in-place moves of the operand don't change it
+        self._shape = (
+            None if reference is None else reference.Located(reference.Location())
+        )
+        self._reference = None
+        self.recorded = recorded
+        self.histories: List[BRepTools_History] = []
+
+    @property
+    def reference(self) -> _TopologyIndex:
+        """topology index of the first operand, None for an empty first operand"""
+        if self._reference is None and self._shape is not None:
+            self._reference = _TopologyIndex(self._shape)
+        return self._reference
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def add(self, history: BRepTools_History):
+        """add the history of a boolean of the operation"""
+        self.histories.append(history)
+
+    def merge(self, history: BRepTools_History):
+        """apply the history of a later modification of the result, e.g. clean"""
+        if not self.histories:  # no boolean ran, e.g. a cut without overlapping tools
+            self.histories.append(history)
+        else:
+            for h in self.histories:
+                h.Merge(history)
+
+    #
+    # Sub-shapes of the operands
+    #
+
+    def _recorded(self) -> List[BRepTools_History]:
+        if not self.recorded:
+            raise RuntimeError("History is only recorded within RecordHistory")
+        return self.histories
+
+    def modified(self, shape: Shape) -> ShapeList:
+        """the sub-shapes of the result shape of an operand was modified into"""
+        return self._images(shape, BRepTools_History.Modified)
+
+    def generated(self, shape: Shape) -> ShapeList:
+        """the sub-shapes of the result generated from shape of an operand
+
+        e.g. the intersection edges generated from faces
+        """
+        return self._images(shape, BRepTools_History.Generated)
+
+    def is_deleted(self, shape: Shape) -> bool:
+        """whether the sub-shape shape of an operand isn't part of the result"""
+        return any(h.IsRemoved(shape.wrapped) for h in self._recorded())
+
+    def _images(self, shape: Shape, relation) -> ShapeList:
+        images = TopTools_IndexedMapOfShape()
+        for h in self._recorded():
+            for image in relation(h, shape.wrapped):
+                images.Add(image)
+        return ShapeList(
+            [Shape.cast(images.FindKey(i)) for i in range(1, images.Extent() + 1)]
+        )
+
+    #
+    # Sub-shapes of the result
+    #
+
+    def _reference_map(self, topo_type: str) -> TopTools_IndexedMapOfShape:
+        if self.reference is None:
+            return TopTools_IndexedMapOfShape()
+        return self.reference.map(topo_type)
+
+    def _reference_entities(self, topo_type: str) -> List[TopoDS_Shape]:
+        if self.reference is None:
+            return []
+        return self.reference.get(topo_type)
+
+    def new(self, result: Shape, topo_type: str) -> LazyShapeList:
+        """the sub-shapes of type topo_type of result the first operand doesn't have
+
+        O(n) in the number of sub-shapes of result: every one is looked up in the
+        map of the first operand, but only the selected ones get wrapped.
+        """
+        reference = self._reference_map(topo_type)
+        shapes = _lazy(result, topo_type)
+        return shapes._subset(
+            [i for i, e in enumerate(shapes._entities) if not reference.Contains(e)]
+        )
+
+    def modified_in(self, result: Shape, topo_type: str) -> LazyShapeList:
+        """the sub-shapes of type topo_type of result modified from the first operand"""
+        images, histories = TopTools_IndexedMapOfShape(), self._recorded()
+        for e in self._reference_entities(topo_type):
+            for h in histories:
+                for image in h.Modified(e):
+                    images.Add(image)
+
+        shapes = _lazy(result, topo_type)
+        return shapes._subset(
+            [i for i, e in enumerate(shapes._entities) if images.Contains(e)]
+        )
+
+    def deleted_in(self, topo_type: str) -> LazyShapeList:
+        """the sub-shapes of type topo_type of the first operand the result lost"""
+        entities, histories = self._reference_entities(topo_type), self._recorded()
+        return LazyShapeList(
+            [e for e in entities if any(h.IsRemoved(e) for h in histories)],
+            _WRAPPERS[topo_type],
+        )
+
+
+@contextmanager
+def recording(reference: TopoDS_Shape = None):
+    """collect the history of the booleans within the context"""
+    history = History(reference, recorded=True)
+    token = _boolean_history.set(history)
+    try:
+        yield history
+    finally:
+        _boolean_history.reset(token)
@@ -2,7 +2,7 @@ from typing import List
 
 import build123d as bd
 
-from .algcompound import AlgCompound
+from .algcompound import LineObject
 from .topology import *
 
 __all__ = [
@@ -26,12 +26,12 @@ __all__ = [
 #
 
 
-class Line(AlgCompound):
+class Line(LineObject):
     def __init__(self, start: VectorLike, end: VectorLike):
         super().__init__(self.create_line(bd.Line, objects=[start, end]))
 
 
-class Bezier(AlgCompound):
+class Bezier(LineObject):
     def __init__(
         self,
         cntl_pts: Iterable[VectorLike],
@@ -42,7 +42,7 @@ class Bezier(AlgCompound):
         )
 
 
-class PolarLine(AlgCompound):
+class PolarLine(LineObject):
     def __init__(
         self,
         start: VectorLike,
@@ -54,13 +54,13 @@ class PolarLine(AlgCompound):
         super().__init__(self.create_line(bd.PolarLine, params=params))
 
 
-class Polyline(AlgCompound):
+class Polyline(LineObject):
     def __init__(self, pts: List[VectorLike], close: bool = False):
         params = dict(close=close)
         super().__init__(self.create_line(bd.Polyline, objects=pts, params=params))
 
 
-class Spline(AlgCompound):
+class Spline(LineObject):
     def __init__(
         self,
         pts: Iterable[VectorLike],
@@ -76,7 +76,7 @@ class Spline(AlgCompound):
         super().__init__(self.create_line(bd.Spline, objects=pts, params=params))
 
 
-class Helix(AlgCompound):
+class Helix(LineObject):
     def __init__(
         self,
         pitch: float,
@@ -97,7 +97,7 @@ class Helix(AlgCompound):
         super().__init__(self.create_line(bd.Helix, params=params))
 
 
-class CenterArc(AlgCompound):
+class CenterArc(LineObject):
     def __init__(
         self,
         center: VectorLike,
@@ -111,7 +111,7 @@ class CenterArc(AlgCompound):
         super().__init__(self.create_line(bd.CenterArc, params=params))
 
 
-class EllipticalCenterArc(AlgCompound):
+class EllipticalCenterArc(LineObject):
     def __init__(
         self,
         center: VectorLike,
@@ -132,7 +132,7 @@ class EllipticalCenterArc(AlgCompound):
         super().__init__(self.create_line(bd.EllipticalCenterArc, params=params))
 
 
-class RadiusArc(AlgCompound):
+class RadiusArc(LineObject):
     def __init__(
         self,
         start_point: VectorLike,
@@ -143,7 +143,7 @@ class RadiusArc(AlgCompound):
         super().__init__(self.create_line(bd.RadiusArc, params=params))
 
 
-class SagittaArc(AlgCompound):
+class SagittaArc(LineObject):
     def __init__(
         self,
         start_point: VectorLike,
@@ -154,7 +154,7 @@ class SagittaArc(AlgCompound):
         super().__init__(self.create_line(bd.SagittaArc, params=params))
 
 
-class TangentArc(AlgCompound):
+class TangentArc(LineObject):
     def __init__(
         self,
         start_point: VectorLike,
@@ -173,12 +173,12 @@ class TangentArc(AlgCompound):
         )
 
 
-class ThreePointArc(AlgCompound):
+class ThreePointArc(LineObject):
     def __init__(self, p1: VectorLike, p2: VectorLike, p3: VectorLike):
         super().__init__(self.create_line(bd.ThreePointArc, objects=(p1, p2, p3)))
 
 
-class JernArc(AlgCompound):
+class JernArc(LineObject):
     def __init__(
         self,
         start: VectorLike,
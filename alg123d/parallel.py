@@ -0,0 +1,312 @@
+import atexit
+import itertools
+import multiprocessing
+import os
+import threading
+import time
+import traceback
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing.connection import wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+try:
+    import resource
+except ImportError:  # Windows: no memory limits
+    resource = None
+
+from .boolean import BooleanOptions, Options, bool_op
+from .serialize import deserialize, serialize
+from .topology import *
+
+__all__ = ["tree_fuse", "parallel_map", "parameter_grid", "TaskResult"]
+
+#
+# Process pool
+#
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def _mp_context():
+    """multiprocessing context starting fresh worker processes instead of forking
+
+    Forking a process with running threads (OCCT parallel booleans, the thread
+    pools of evaluate) can deadlock the child. As with spawn on Windows and macOS,
+    scripts starting workers need an if __name__ == "__main__" guard.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def get_executor(workers: int) -> ProcessPoolExecutor:
+    """process pool with the given number of workers, created once and reused"""
+    with _executors_lock:
+        executor = _executors.get(workers)
+        if executor is None:
+            executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=_mp_context()
+            )
+            _executors[workers] = executor
+        return executor
+
+
+@atexit.register
+def _shutdown_executors():
+    for executor in _executors.values():
+        executor.shutdown(wait=False, cancel_futures=True)
+    _executors.clear()
+
+
+#
+# Tree reduction
+#
+
+
+def _fuse_bytes(blobs: List[bytes], options: Options) -> bytes:
+    shapes = [Shape.cast(deserialize(blob)) for blob in blobs]
+    if len(shapes) == 1:
+        return blobs[0]
+    return serialize(bool_op(Mode.ADD, shapes[0], shapes[1:], options).wrapped)
+
+
+def _chunks(items: List, count: int) -> List[List]:
+    """split items into count contiguous chunks of (almost) equal size"""
+    size, rest = divmod(len(items), count)
+    result = []
+    start = 0
+    for i in range(count):
+        end = start + size + (1 if i < rest else 0)
+        result.append(items[start:end])
+        start = end
+    return result
+
+
+def tree_fuse(objs: List[Shape], workers: int) -> Shape:
+    """Fuse objs in a process pool: one flat fuse per chunk, then a pairwise reduction
+
+    The operands are split into one contiguous chunk per worker (neighbouring
+    operands tend to be neighbours in space, e.g. for GridLocations). Every chunk is
+    fused with a single boolean of all its operands in a worker process, the
+    partial results are then fused pairwise, level by level, until one shape is
+    left.
+    """
+    if len(objs) == 1:
+        return objs[0]
+
+    executor = get_executor(workers)
+    # context variables don't reach the worker processes
+    options = BooleanOptions.current()
+
+    blobs = [serialize(obj.wrapped) for obj in objs]
+    level = _chunks(blobs, min(workers, len(blobs) // 2))
+    while True:
+        blobs = list(executor.map(_fuse_bytes, level, repeat(options)))
+        if len(blobs) == 1:
+            break
+        level = [blobs[i : i + 2] for i in range(0, len(blobs), 2)]
+
+    return Shape.cast(deserialize(blobs[0]))
+
+
+#
+# Parameter sweeps
+#
+
+TaskResult = namedtuple(
+    "TaskResult", ["index", "params", "result", "path", "error", "duration"]
+)
+TaskResult.__doc__ = """Outcome of one task of parallel_map
+
+result is the object returned by the model function (None if written to a file
+or failed), path the written file, error the formatted exception or None and
+duration the run time in seconds.
+"""
+
+
+def parameter_grid(**axes: Iterable) -> Iterator[Dict[str, Any]]:
+    """all combinations of the parameter values
+
+    e.g. parameter_grid(length=[1, 2], width=[3, 4])
+    """
+    names = list(axes)
+    for values in itertools.product(*axes.values()):
+        yield dict(zip(names, values))
+
+
+def _call(func: Callable, params: Any) -> Any:
+    if isinstance(params, dict):
+        return func(**params)
+    elif isinstance(params, tuple):
+        return func(*params)
+    else:
+        return func(params)
+
+
+def _write(obj: Shape, path: str):
+    """write obj as binary BRep (.brep), STEP (.step, .stp) or STL (.stl)"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".brep":
+        with open(path, "wb") as f:
+            f.write(serialize(obj.wrapped))
+    elif ext in (".step", ".stp"):
+        obj.export_step(path)
+    elif ext == ".stl":
+        obj.export_stl(path)
+    else:
+        raise ValueError(f"Unknown file type {ext}")
+
+
+def _work(conn, max_memory: int):
+    """worker loop: run tasks received from conn until None is received"""
+    if max_memory is not None and resource is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (max_memory, max_memory))
+
+    import alg123d  # noqa: F401, import OCP and build123d once per worker
+
+    while True:
+        task = conn.recv()
+        if task is None:
+            break
+
+        index, func, params, path = task
+        start = time.perf_counter()
+        try:
+            result = _call(func, params)
+            if path is not None:
+                _write(result, path)
+                result = None
+            message = (index, result, path, None)
+            conn.send(message + (time.perf_counter() - start,))
+        except Exception:  # the task failed, the worker keeps running
+            message = (index, None, None, traceback.format_exc())
+            conn.send(message + (time.perf_counter() - start,))
+
+
+class _Worker:
+    def __init__(self, context, max_memory: int):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(
+            target=_work, args=(child, max_memory), daemon=True
+        )
+        self.process.start()
+        child.close()
+        self.task = None
+        self.started = None
+
+    def submit(self, task):
+        self.task = task
+        self.started = time.monotonic()
+        self.conn.send(task)
+
+    def stop(self, kill: bool = False):
+        if kill or self.task is not None:
+            self.process.kill()
+        else:
+            try:
+                self.conn.send(None)
+            except OSError:
+                pass
+        self.process.join()
+        self.conn.close()
+
+
+def parallel_map(
+    func: Callable,
+    params: Iterable,
+    workers: int = None,
+    timeout: float = None,
+    max_memory: int = None,
+    filename: str = None,
+    mp_context=None,
+) -> Iterator[TaskResult]:
+    """Run func for every parameter set in a pool of worker processes
+
+    The results are yielded as TaskResult in the order the tasks finish. The
+    workers import alg123d once and run many tasks. A failing task yields its
+    error, a task running longer than timeout seconds or a worker exceeding
+    max_memory bytes of address space (Unix) kills its worker only, which is
+    replaced by a new one. Hence failures never stop the batch.
+
+    Args:
+        func (Callable): model function, importable by the workers (module level)
+        params (Iterable): parameter sets, dicts are passed as keyword arguments,
+            tuples as positional arguments, anything else as single argument
+        workers (int, optional): number of processes. Defaults to os.cpu_count().
+        timeout (float, optional): seconds per task. Defaults to None.
+        max_memory (int, optional): address space limit per worker in bytes.
+            Defaults to None.
+        filename (str, optional): write results to files instead of sending them
+            back, a format string filled with index and the parameters, e.g.
+            "out/rail_{length}.step" (.brep, .step, .stp or .stl). Defaults to None.
+        mp_context (optional): multiprocessing context. Defaults to forkserver
+            (spawn where it isn't available), see _mp_context.
+    """
+    context = _mp_context() if mp_context is None else mp_context
+    workers = os.cpu_count() if workers is None else workers
+
+    def path(index, p):
+        if filename is None:
+            return None
+        return filename.format(index=index, **(p if isinstance(p, dict) else {}))
+
+    tasks = ((i, func, p, path(i, p)) for i, p in enumerate(params))
+    pool = [_Worker(context, max_memory) for _ in range(workers)]
+
+    def next_task(worker):
+        task = next(tasks, None)
+        if task is None:
+            worker.task = None
+        else:
+            worker.submit(task)
+
+    try:
+        for worker in pool:
+            next_task(worker)
+
+        while True:
+            busy = [w for w in pool if w.task is not None]
+            if not busy:
+                break
+
+            wait_time = None
+            if timeout is not None:
+                deadline = min(w.started for w in busy) + timeout
+                wait_time = max(0, deadline - time.monotonic())
+            ready = wait([w.conn for w in busy], wait_time)
+
+            for i, worker in enumerate(pool):
+                if worker.task is None:
+                    continue
+
+                index, _, p, _ = worker.task
+                if worker.conn in ready:
+                    try:
+                        _, result, written, error, duration = worker.conn.recv()
+                    except (EOFError, OSError):  # killed, e.g. out of memory
+                        worker.stop(kill=True)
+                        error = f"worker died (exit code {worker.process.exitcode})"
+                        yield TaskResult(index, p, None, None, error, None)
+                        worker = pool[i] = _Worker(context, max_memory)
+                    else:
+                        yield TaskResult(index, p, result, written, error, duration)
+                    next_task(worker)
+
+                elif (
+                    timeout is not None and time.monotonic() - worker.started > timeout
+                ):
+                    worker.stop(kill=True)
+                    error = f"timeout after {timeout}s"
+                    yield TaskResult(index, p, None, None, error, timeout)
+                    worker = pool[i] = _Worker(context, max_memory)
+                    next_task(worker)
+    finally:
+        for worker in pool:
+            worker.stop()
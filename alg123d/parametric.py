@@ -0,0 +1,80 @@
+from typing import Any, Callable, Dict, List, Union
+
+from .algcompound import AlgCompound, LazyExpressions
+from .expression import ExprCompound, evaluate, reachable
+
+__all__ = ["ParametricModel"]
+
+#
+# Incremental rebuild of parametric models
+#
+
+
+def _exprs(result: Any) -> List[ExprCompound]:
+    if isinstance(result, ExprCompound):
+        return [result]
+    elif isinstance(result, (list, tuple)):
+        return [e for r in result for e in _exprs(r)]
+    elif isinstance(result, dict):
+        return [e for r in result.values() for e in _exprs(r)]
+    else:
+        return []
+
+
+class ParametricModel:
+    """Model function with named parameters that gets rebuilt incrementally
+
+    func is called with the parameters within LazyExpressions, so every primitive,
+    operator and function of part.py / generic.py becomes a node of an expression
+    graph, keyed by its operation and inputs. The nodes of the last build are kept,
+    hence after changing a parameter only the operations depending on it get a new
+    key and are recomputed, everything upstream is reused.
+
+    func can return an AlgCompound or a list, tuple or dict of AlgCompounds.
+
+    Example:
+        def plate(length, width, diam):
+            p = Box(length, width, 5)
+            p -= [Cylinder(diam / 2, 5) @ loc for loc in GridLocations(20, 20, 3, 3)]
+            return fillet(p, p.edges().filter_by(Axis.Z), 2)
+
+        model = ParametricModel(plate, length=100, width=80, diam=6)
+        p1 = model.build()
+        p2 = model.build(diam=8)  # Box is reused, only holes, cut and fillet run
+        print(model.stats)
+
+    Args:
+        func (Callable): function creating the model from keyword parameters
+        workers (int, optional): threads for independent operations. Defaults to None.
+        params: initial parameter values
+    """
+
+    def __init__(self, func: Callable[..., Any], workers: int = None, **params):
+        self.func = func
+        self.workers = workers
+        self.params = params
+        self.stats = dict(operations=0, computed=0, reused=0)
+        self._nodes = {}
+
+    def build(self, **changes) -> Union[AlgCompound, List, Dict]:
+        """build the model with the changed parameters, reusing unchanged operations"""
+        self.params.update(changes)
+
+        with LazyExpressions(workers=self.workers):
+            result = self.func(**self.params)
+
+        exprs = _exprs(result)
+        nodes = reachable([n for n in (e._key_node() for e in exprs) if n is not None])
+        # nodes already evaluated, e.g. by an earlier build or another model, are
+        # reused by evaluate
+        computed = [n for n in nodes if n.result is None]
+        evaluate(*exprs, workers=self.workers)
+
+        # pin the nodes of this build for the next one, drop the older ones
+        self._nodes = {n.key: n for n in nodes}
+        self.stats = dict(
+            operations=len(nodes),
+            computed=len(computed),
+            reused=len(nodes) - len(computed),
+        )
+        return result
@@ -2,7 +2,11 @@ from typing import List
 
 import build123d as bd
 
-from .algcompound import AlgCompound, create_compound
+from .algcompound import AlgCompound, PartObject, create_compound
+from .common import LocationArray
+from .expression import expression
+from .profiling import traced
+from .generic import pattern
 from .topology import *
 from .utils import to_tuple
 
@@ -16,6 +20,9 @@ __all__ = [
     "CounterBore",
     "CounterSink",
     "Bore",
+    "bore_pattern",
+    "counter_bore_pattern",
+    "counter_sink_pattern",
     "extrude",
     "extrude_until",
     "loft",
@@ -30,7 +37,7 @@ __all__ = [
 #
 
 
-class Box(AlgCompound):
+class Box(PartObject):
     def __init__(
         self,
         length: float,
@@ -45,16 +52,11 @@ class Box(AlgCompound):
         if isinstance(align, Align):
             align = (align,) * 3
 
-        params = dict(
-            length=length,
-            width=width,
-            height=height,
-            align=align,
-        )
-        super().__init__(self.create_part(bd.Box, params=params))
+        solid = Solid.make_box(length, width, height)
+        super().__init__(self.aligned(solid, align))
 
 
-class Cylinder(AlgCompound):
+class Cylinder(PartObject):
     def __init__(
         self,
         radius: float,
@@ -69,16 +71,11 @@ class Cylinder(AlgCompound):
         if isinstance(align, Align):
             align = (align,) * 3
 
-        params = dict(
-            radius=radius,
-            height=height,
-            arc_size=arc_size,
-            align=align,
-        )
-        super().__init__(self.create_part(bd.Cylinder, params=params))
+        solid = Solid.make_cylinder(radius, height, angle=arc_size)
+        super().__init__(self.aligned(solid, align))
 
 
-class Cone(AlgCompound):
+class Cone(PartObject):
     def __init__(
         self,
         bottom_radius: float,
@@ -94,17 +91,11 @@ class Cone(AlgCompound):
         if isinstance(align, Align):
             align = (align,) * 3
 
-        params = dict(
-            bottom_radius=bottom_radius,
-            top_radius=top_radius,
-            height=height,
-            arc_size=arc_size,
-            align=align,
-        )
-        super().__init__(self.create_part(bd.Cone, params=params))
+        solid = Solid.make_cone(bottom_radius, top_radius, height, angle=arc_size)
+        super().__init__(self.aligned(solid, align))
 
 
-class Sphere(AlgCompound):
+class Sphere(PartObject):
     def __init__(
         self,
         radius: float,
@@ -120,17 +111,13 @@ class Sphere(AlgCompound):
         if isinstance(align, Align):
             align = (align,) * 3
 
-        params = dict(
-            radius=radius,
-            arc_size1=arc_size1,
-            arc_size2=arc_size2,
-            arc_size3=arc_size3,
-            align=align,
+        solid = Solid.make_sphere(
+            radius, angle1=arc_size1, angle2=arc_size2, angle3=arc_size3
         )
-        super().__init__(self.create_part(bd.Sphere, params=params))
+        super().__init__(self.aligned(solid, align))
 
 
-class Torus(AlgCompound):
+class Torus(PartObject):
     def __init__(
         self,
         major_radius: float,
@@ -147,18 +134,17 @@ class Torus(AlgCompound):
         if isinstance(align, Align):
             align = (align,) * 3
 
-        params = dict(
-            major_radius=major_radius,
-            minor_radius=minor_radius,
-            minor_start_angle=minor_start_angle,
-            minor_end_angle=minor_end_angle,
+        solid = Solid.make_torus(
+            major_radius,
+            minor_radius,
+            start_angle=minor_start_angle,
+            end_angle=minor_end_angle,
             major_angle=major_angle,
-            align=align,
         )
-        super().__init__(self.create_part(bd.Torus, params=params))
+        super().__init__(self.aligned(solid, align))
 
 
-class Wedge(AlgCompound):
+class Wedge(PartObject):
     def __init__(
         self,
         xsize: float,
@@ -174,20 +160,13 @@ class Wedge(AlgCompound):
             Align.CENTER,
         ),
     ):
-        params = dict(
-            xsize=xsize,
-            ysize=ysize,
-            zsize=zsize,
-            xmin=xmin,
-            zmin=zmin,
-            xmax=xmax,
-            zmax=zmax,
-            align=align,
-        )
-        super().__init__(self.create_part(bd.Wedge, params=params))
+        solid = Solid.make_wedge(xsize, ysize, zsize, xmin, zmin, xmax, zmax)
+        super().__init__(self.aligned(solid, align))
 
 
-class CounterBore(AlgCompound):
+class CounterBore(PartObject):
+    _cacheable = False  # keyed by the whole part, a key costs more than the hole
+
     def __init__(
         self,
         part: AlgCompound,
@@ -205,7 +184,9 @@ class CounterBore(AlgCompound):
         super().__init__(self.create_part(bd.CounterBoreHole, part, params=params))
 
 
-class CounterSink(AlgCompound):
+class CounterSink(PartObject):
+    _cacheable = False  # keyed by the whole part, a key costs more than the hole
+
     def __init__(
         self,
         part: AlgCompound,
@@ -223,7 +204,9 @@ class CounterSink(AlgCompound):
         super().__init__(self.create_part(bd.CounterSinkHole, part, params=params))
 
 
-class Bore(AlgCompound):
+class Bore(PartObject):
+    _cacheable = False  # keyed by the whole part, a key costs more than the hole
+
     def __init__(
         self,
         part: AlgCompound,
@@ -237,11 +220,60 @@ class Bore(AlgCompound):
         super().__init__(self.create_part(bd.Hole, part, params=params))
 
 
+#
+# Hole patterns
+#
+
+
+@expression(3)
+@traced()
+def bore_pattern(
+    part: AlgCompound,
+    locations: Union[LocationArray, List[Location]],
+    radius: float,
+    depth: float = None,
+) -> AlgCompound:
+    """cut Bore(part, radius, depth) at all locations with one boolean operation"""
+    return pattern(part, Bore(part, radius, depth), locations)
+
+
+@expression(3)
+@traced()
+def counter_bore_pattern(
+    part: AlgCompound,
+    locations: Union[LocationArray, List[Location]],
+    radius: float,
+    counter_bore_radius: float,
+    counter_bore_depth: float,
+    depth: float = None,
+) -> AlgCompound:
+    """cut CounterBore(part, ...) at all locations with one boolean operation"""
+    tool = CounterBore(part, radius, counter_bore_radius, counter_bore_depth, depth)
+    return pattern(part, tool, locations)
+
+
+@expression(3)
+@traced()
+def counter_sink_pattern(
+    part: AlgCompound,
+    locations: Union[LocationArray, List[Location]],
+    radius: float,
+    counter_sink_radius: float,
+    counter_sink_angle: float = 82,
+    depth: float = None,
+) -> AlgCompound:
+    """cut CounterSink(part, ...) at all locations with one boolean operation"""
+    tool = CounterSink(part, radius, counter_sink_radius, counter_sink_angle, depth)
+    return pattern(part, tool, locations)
+
+
 #
 # Functions
 #
 
 
+@expression(3)
+@traced()
 def extrude(
     to_extrude: Union[Face, Compound, List[Union[Face, Compound]]],
     amount: float = None,
@@ -275,6 +307,8 @@ def extrude(
     )
 
 
+@expression(3)
+@traced()
 def extrude_until(
     face: Union[Face, AlgCompound],
     limit: AlgCompound,
@@ -300,6 +334,8 @@ def extrude_until(
         return AlgCompound(Solid.extrude_until(face, limit, dir, until))
 
 
+@expression(3)
+@traced()
 def loft(sections: List[Union[AlgCompound, Face]], ruled: bool = False) -> AlgCompound:
     faces = []
     for s in to_tuple(sections):
@@ -311,6 +347,8 @@ def loft(sections: List[Union[AlgCompound, Face]], ruled: bool = False) -> AlgCo
     return create_compound(bd.Loft, faces, dim=3, params=dict(ruled=ruled))
 
 
+@expression(3)
+@traced()
 def revolve(
     profiles: Union[List[Union[Compound, Face]], Compound, Face],
     axis: Axis,
@@ -331,6 +369,8 @@ def revolve(
     )
 
 
+@expression(3)
+@traced()
 def sweep(
     sections: List[Union[Face, Compound]],
     path: Union[Edge, Wire] = None,
@@ -356,6 +396,8 @@ def sweep(
     )
 
 
+@expression(2)
+@traced()
 def section(
     part: AlgCompound,
     by: List[Plane],
@@ -366,6 +408,8 @@ def section(
     )
 
 
+@expression()
+@traced()
 def shell(
     objects: Union[List[AlgCompound], AlgCompound],
     amount: float,
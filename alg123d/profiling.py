@@ -0,0 +1,217 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Tuple
+
+from OCP.TopAbs import TopAbs_ShapeEnum
+from OCP.TopExp import TopExp
+from OCP.TopTools import TopTools_IndexedMapOfShape
+
+from .topology import *
+
+__all__ = ["Profile", "traced"]
+
+#
+# Spans
+#
+
+Span = namedtuple(
+    "Span",
+    ["name", "start", "duration", "self_time", "thread", "depth", "inputs", "outputs"],
+)
+Span.__doc__ = """Timing of one traced call, times in ns relative to the Profile start
+
+inputs and outputs are (faces, edges, solids) of the shapes passed to and returned
+by the call, or None if the Profile doesn't count topology.
+"""
+
+_profile = ContextVar("profile", default=None)
+
+_KINDS = (
+    TopAbs_ShapeEnum.TopAbs_FACE,
+    TopAbs_ShapeEnum.TopAbs_EDGE,
+    TopAbs_ShapeEnum.TopAbs_SOLID,
+)
+
+
+def _shapes(value: Any) -> List:
+    """the OCCT shapes of value without resolving deferred or lazy AlgCompounds"""
+    if isinstance(value, Shape):
+        if value.__dict__.get("_deferred"):  # pending AutoBatch or expression
+            return []
+        # the raw shape, reading AlgCompound.wrapped would run a deferred clean
+        shape = value.__dict__.get("_wrapped", value.__dict__.get("wrapped"))
+        return [] if shape is None else [shape]
+    elif isinstance(value, (list, tuple)):
+        return [s for v in value for s in _shapes(v)]
+    elif isinstance(value, dict):
+        return [s for v in value.values() for s in _shapes(v)]
+    return []
+
+
+def _topology(value: Any) -> Tuple[int, int, int]:
+    """number of distinct faces, edges and solids of the shapes in value"""
+    counts = [0, 0, 0]
+    for shape in _shapes(value):
+        for i, kind in enumerate(_KINDS):
+            shape_map = TopTools_IndexedMapOfShape()
+            TopExp.MapShapes_s(shape, kind, shape_map)
+            counts[i] += shape_map.Extent()
+    return tuple(counts)
+
+
+def traced(name: str = None):
+    """Record a span for every call of the decorated function within a Profile
+
+    name defaults to the qualified name of the function. Without an active
+    Profile the only cost is one context variable lookup per call.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        label = func.__qualname__ if name is None else name
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profile = _profile.get()
+            if profile is None:
+                return func(*args, **kwargs)
+            return profile._run(label, func, args, kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+#
+# Profile
+#
+
+
+class Profile:
+    """Collect the spans of all traced operations within the context
+
+    Traced are the boolean operations (AlgCompound._place), builder calls
+    (AlgCompound._create, create_compound), clean, alignment, topology queries,
+    the objects and functions of part.py, sketch.py, line.py and generic.py and
+    StepReader.load. Nested calls get nested spans, so the self time of a span
+    excludes the time of the spans it contains.
+
+    Args:
+        counts (bool, optional): record faces, edges and solids of the inputs and
+            outputs of every span. Counting takes time, which is added to the
+            enclosing spans. Defaults to True.
+    """
+
+    def __init__(self, counts: bool = True):
+        self.counts = counts
+        self.spans: List[Span] = []
+        self._local = threading.local()
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        self._token = _profile.set(self)
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        _profile.reset(self._token)
+
+    def _stack(self) -> List[int]:
+        """durations of the child spans of the open spans of the current thread"""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _run(self, name: str, func: Callable, args: tuple, kwargs: dict):
+        inputs = _topology((args, kwargs)) if self.counts else None
+
+        stack = self._stack()
+        stack.append(0)
+        start = time.perf_counter_ns()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            duration = time.perf_counter_ns() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += duration
+
+        outputs = None
+        if self.counts:
+            # __init__ and in-place methods return None, their output is self
+            outputs = _topology(args[0] if result is None and args else result)
+
+        self.spans.append(
+            Span(
+                name,
+                start - self._start,
+                duration,
+                duration - children,
+                threading.get_ident(),
+                len(stack),
+                inputs,
+                outputs,
+            )
+        )
+        return result
+
+    #
+    # Report
+    #
+
+    def totals(self) -> Dict[str, dict]:
+        """calls, total and self time (in s) per operation, sorted by total time"""
+        result = {}
+        for span in self.spans:
+            entry = result.setdefault(span.name, dict(calls=0, total=0, self=0))
+            entry["calls"] += 1
+            entry["total"] += span.duration
+            entry["self"] += span.self_time
+
+        for entry in result.values():
+            entry["total"] /= 1e9
+            entry["self"] /= 1e9
+
+        return dict(sorted(result.items(), key=lambda item: -item[1]["total"]))
+
+    def report(self, top: int = 20) -> str:
+        """table of the top operations by total time"""
+        lines = [
+            f"{'operation':40s} {'calls':>7s} {'total':>10s}"
+            f" {'self':>10s} {'mean':>10s}"
+        ]
+        for name, entry in list(self.totals().items())[:top]:
+            lines.append(
+                f"{name[:40]:40s} {entry['calls']:7d}"
+                f" {entry['total'] * 1e3:8.1f}ms {entry['self'] * 1e3:8.1f}ms"
+                f" {entry['total'] / entry['calls'] * 1e3:8.2f}ms"
+            )
+        return "\n".join(lines)
+
+    def export_chrome_trace(self, filename: str):
+        """write the spans as Chrome trace JSON (chrome://tracing, Perfetto)"""
+        pid = os.getpid()
+        events = []
+        for span in self.spans:
+            event = dict(
+                name=span.name,
+                cat="alg123d",
+                ph="X",
+                ts=span.start / 1e3,
+                dur=span.duration / 1e3,
+                pid=pid,
+                tid=span.thread,
+            )
+            if span.inputs is not None:
+                event["args"] = {
+                    "in": dict(zip(("faces", "edges", "solids"), span.inputs)),
+                    "out": dict(zip(("faces", "edges", "solids"), span.outputs)),
+                }
+            events.append(event)
+
+        with open(filename, "w") as f:
+            json.dump(dict(traceEvents=events, displayTimeUnit="ms"), f)
@@ -0,0 +1,349 @@
+import operator
+from math import cos
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+from OCP.Bnd import Bnd_Box
+from OCP.BRep import BRep_Tool
+from OCP.BRepAdaptor import (
+    BRepAdaptor_CompCurve,
+    BRepAdaptor_Curve,
+    BRepAdaptor_Surface,
+)
+from OCP.BRepBndLib import BRepBndLib
+from OCP.BRepGProp import BRepGProp, BRepGProp_Face
+from OCP.BRepTools import BRepTools
+from OCP.GCPnts import GCPnts_AbscissaPoint
+from OCP.GeomAbs import GeomAbs_CurveType, GeomAbs_SurfaceType
+from OCP.GProp import GProp_GProps
+from OCP.gp import gp_Pnt, gp_Vec
+from OCP.Standard import Standard_Failure, Standard_NoSuchObject
+from OCP.TopAbs import TopAbs_ShapeEnum
+from OCP.TopoDS import TopoDS, TopoDS_Shape
+
+from build123d.build_enums import *
+from build123d.topology import Axis
+
+__all__ = ["ShapeProperties"]
+
+#
+# Properties of shape lists as arrays
+#
+
+
+def _direction(shape: TopoDS_Shape) -> tuple:
+    """normal of a planar face or direction of a linear edge, else NaN"""
+    shape_type = shape.ShapeType()
+    if shape_type == TopAbs_ShapeEnum.TopAbs_FACE:
+        surface = BRepAdaptor_Surface(TopoDS.Face_s(shape))
+        if surface.GetType() == GeomAbs_SurfaceType.GeomAbs_Plane:
+            d = surface.Plane().Axis().Direction()
+            return (d.X(), d.Y(), d.Z())
+    elif shape_type == TopAbs_ShapeEnum.TopAbs_EDGE:
+        curve = BRepAdaptor_Curve(TopoDS.Edge_s(shape))
+        if curve.GetType() == GeomAbs_CurveType.GeomAbs_Line:
+            d = curve.Line().Direction()
+            return (d.X(), d.Y(), d.Z())
+    return (np.nan, np.nan, np.nan)
+
+
+def _bounds(shape: TopoDS_Shape) -> tuple:
+    box = Bnd_Box()
+    BRepBndLib.Add_s(shape, box, True)
+    if box.IsVoid():
+        return (-np.inf, -np.inf, -np.inf, np.inf, np.inf, np.inf)
+    return box.Get()
+
+
+# The functions below compute the values of Shape.center(), geom_type(), length,
+# area, volume and radius from the OCCT shape without wrapping it. They return
+# None for the shape types they don't cover, these are taken from the object.
+
+_VERTEX, _EDGE, _WIRE, _FACE, _SHELL, _SOLID, _COMPSOLID, _COMPOUND = (
+    TopAbs_ShapeEnum.TopAbs_VERTEX,
+    TopAbs_ShapeEnum.TopAbs_EDGE,
+    TopAbs_ShapeEnum.TopAbs_WIRE,
+    TopAbs_ShapeEnum.TopAbs_FACE,
+    TopAbs_ShapeEnum.TopAbs_SHELL,
+    TopAbs_ShapeEnum.TopAbs_SOLID,
+    TopAbs_ShapeEnum.TopAbs_COMPSOLID,
+    TopAbs_ShapeEnum.TopAbs_COMPOUND,
+)
+
+_CURVE_TYPES = {
+    GeomAbs_CurveType.GeomAbs_Line: "LINE",
+    GeomAbs_CurveType.GeomAbs_Circle: "CIRCLE",
+    GeomAbs_CurveType.GeomAbs_Ellipse: "ELLIPSE",
+    GeomAbs_CurveType.GeomAbs_Hyperbola: "HYPERBOLA",
+    GeomAbs_CurveType.GeomAbs_Parabola: "PARABOLA",
+    GeomAbs_CurveType.GeomAbs_BezierCurve: "BEZIER",
+    GeomAbs_CurveType.GeomAbs_BSplineCurve: "BSPLINE",
+    GeomAbs_CurveType.GeomAbs_OffsetCurve: "OFFSET",
+    GeomAbs_CurveType.GeomAbs_OtherCurve: "OTHER",
+}
+
+_SURFACE_TYPES = {
+    GeomAbs_SurfaceType.GeomAbs_Plane: "PLANE",
+    GeomAbs_SurfaceType.GeomAbs_Cylinder: "CYLINDER",
+    GeomAbs_SurfaceType.GeomAbs_Cone: "CONE",
+    GeomAbs_SurfaceType.GeomAbs_Sphere: "SPHERE",
+    GeomAbs_SurfaceType.GeomAbs_Torus: "TORUS",
+    GeomAbs_SurfaceType.GeomAbs_BezierSurface: "BEZIER",
+    GeomAbs_SurfaceType.GeomAbs_BSplineSurface: "BSPLINE",
+    GeomAbs_SurfaceType.GeomAbs_SurfaceOfRevolution: "REVOLUTION",
+    GeomAbs_SurfaceType.GeomAbs_SurfaceOfExtrusion: "EXTRUSION",
+    GeomAbs_SurfaceType.GeomAbs_OffsetSurface: "OFFSET",
+    GeomAbs_SurfaceType.GeomAbs_OtherSurface: "OTHER",
+}
+
+_TOPO_TYPES = {
+    _VERTEX: "Vertex",
+    _WIRE: "Wire",
+    _SHELL: "Shell",
+    _SOLID: "Solid",
+    _COMPSOLID: "Compound",
+    _COMPOUND: "Compound",
+}
+
+_PROPERTIES = {
+    _EDGE: BRepGProp.LinearProperties_s,
+    _WIRE: BRepGProp.LinearProperties_s,
+    _FACE: BRepGProp.SurfaceProperties_s,
+    _SHELL: BRepGProp.SurfaceProperties_s,
+    _SOLID: BRepGProp.VolumeProperties_s,
+    _COMPSOLID: BRepGProp.VolumeProperties_s,
+    _COMPOUND: BRepGProp.VolumeProperties_s,
+}
+
+
+def _curve(shape: TopoDS_Shape):
+    """adaptor of an edge or wire, None for other shapes"""
+    shape_type = shape.ShapeType()
+    if shape_type == _EDGE:
+        return BRepAdaptor_Curve(TopoDS.Edge_s(shape))
+    elif shape_type == _WIRE:
+        return BRepAdaptor_CompCurve(TopoDS.Wire_s(shape))
+    return None
+
+
+def _gprops(shape: TopoDS_Shape, calc: Callable) -> GProp_GProps:
+    properties = GProp_GProps()
+    calc(shape, properties)
+    return properties
+
+
+def _center(shape: TopoDS_Shape) -> Optional[tuple]:
+    """Shape.center(): the point at half the length of edges and wires, the center of
+    mass of planar faces and solids, the point at the middle of the uv bounds of
+    other faces and the center of the edges of shells (as Shell.center())
+    """
+    shape_type = shape.ShapeType()
+    if shape_type == _VERTEX:
+        point = BRep_Tool.Pnt_s(TopoDS.Vertex_s(shape))
+    elif shape_type in (_EDGE, _WIRE):
+        curve = _curve(shape)
+        half = GCPnts_AbscissaPoint.Length_s(curve) / 2
+        param = GCPnts_AbscissaPoint(curve, half, curve.FirstParameter()).Parameter()
+        point = curve.Value(param)
+    elif shape_type == _FACE:
+        face = TopoDS.Face_s(shape)
+        if BRepAdaptor_Surface(face).GetType() == GeomAbs_SurfaceType.GeomAbs_Plane:
+            point = _gprops(face, BRepGProp.SurfaceProperties_s).CentreOfMass()
+        else:
+            u_min, u_max, v_min, v_max = BRepTools.UVBounds_s(face)
+            point = gp_Pnt()
+            BRepGProp_Face(face).Normal(
+                (u_min + u_max) / 2, (v_min + v_max) / 2, point, gp_Vec()
+            )
+    elif shape_type == _SHELL:
+        point = _gprops(shape, BRepGProp.LinearProperties_s).CentreOfMass()
+    elif shape_type in (_SOLID, _COMPSOLID):
+        point = _gprops(shape, BRepGProp.VolumeProperties_s).CentreOfMass()
+    else:  # compounds use the type of their children
+        return None
+    return (point.X(), point.Y(), point.Z())
+
+
+def _geom_type(shape: TopoDS_Shape) -> str:
+    shape_type = shape.ShapeType()
+    if shape_type == _EDGE:
+        return _CURVE_TYPES[BRepAdaptor_Curve(TopoDS.Edge_s(shape)).GetType()]
+    elif shape_type == _FACE:
+        return _SURFACE_TYPES[BRepAdaptor_Surface(TopoDS.Face_s(shape)).GetType()]
+    return _TOPO_TYPES[shape_type]
+
+
+def _length(shape: TopoDS_Shape) -> Optional[float]:
+    curve = _curve(shape)
+    return None if curve is None else GCPnts_AbscissaPoint.Length_s(curve)
+
+
+def _area(shape: TopoDS_Shape) -> float:
+    return _gprops(shape, BRepGProp.SurfaceProperties_s).Mass()
+
+
+def _volume(shape: TopoDS_Shape) -> Optional[float]:
+    calc = _PROPERTIES.get(shape.ShapeType())
+    return None if calc is None else _gprops(shape, calc).Mass()
+
+
+def _radius(shape: TopoDS_Shape) -> Optional[float]:
+    curve = _curve(shape)
+    if curve is None:
+        return None
+    try:
+        return curve.Circle().Radius()
+    except (Standard_NoSuchObject, Standard_Failure) as err:
+        raise ValueError("Shape could not be reduced to a circle") from err
+
+
+class ShapeProperties:
+    """Properties of a list of OCCT shapes as NumPy arrays for vectorized selection
+
+    Every property is computed in one pass over all shapes when it is used first:
+    centers (n, 3), bounds (n, 6) as (xmin, ymin, zmin, xmax, ymax, zmax),
+    directions (n, 3) with the normal of planar faces and the direction of linear
+    edges (NaN for all other shapes), geom_types (n,) and lengths, areas, volumes,
+    radii (n,). Centers, geometry types and measures are computed from the OCCT
+    shapes the way Face, Edge, ... compute them, so they are the values
+    ShapeList.sort_by and filter_by use.
+
+    Args:
+        entities (List[TopoDS_Shape]): the OCCT shapes
+        wrap (Callable): creates the object of an OCCT shape
+    """
+
+    def __init__(self, entities: List[TopoDS_Shape], wrap: Callable):
+        self.entities = entities
+        self.wrap = wrap
+        self._columns: Dict[str, np.ndarray] = {}
+
+    def __len__(self):
+        return len(self.entities)
+
+    def take(self, rows: Sequence[int], entities: List[TopoDS_Shape] = None):
+        """the properties of the shapes at rows, keeping the computed arrays"""
+        if entities is None:
+            entities = [self.entities[i] for i in rows]
+        result = ShapeProperties(entities, self.wrap)
+        rows = np.asarray(rows, dtype=int)
+        result._columns = {k: v[rows] for k, v in self._columns.items()}
+        return result
+
+    def _column(self, name: str, func: Callable, fallback: Callable = None, **kwargs):
+        """values of func for all shapes, of fallback(object) where func returns None"""
+        column = self._columns.get(name)
+        if column is None:
+            values = []
+            for e in self.entities:
+                value = func(e)
+                if value is None:
+                    value = fallback(self.wrap(e))
+                values.append(value)
+            column = self._columns[name] = np.array(values, **kwargs)
+        return column
+
+    @property
+    def centers(self) -> np.ndarray:
+        return self._column(
+            "centers", _center, lambda obj: obj.center().to_tuple(), dtype=float
+        ).reshape(-1, 3)
+
+    @property
+    def bounds(self) -> np.ndarray:
+        return self._column("bounds", _bounds, dtype=float).reshape(-1, 6)
+
+    @property
+    def directions(self) -> np.ndarray:
+        return self._column("directions", _direction, dtype=float).reshape(-1, 3)
+
+    @property
+    def geom_types(self) -> np.ndarray:
+        return self._column("geom_types", _geom_type, dtype=object)
+
+    @property
+    def lengths(self) -> np.ndarray:
+        return self._column(
+            "lengths", _length, operator.attrgetter("length"), dtype=float
+        )
+
+    @property
+    def areas(self) -> np.ndarray:
+        return self._column("areas", _area, dtype=float)
+
+    @property
+    def volumes(self) -> np.ndarray:
+        return self._column(
+            "volumes", _volume, operator.attrgetter("volume"), dtype=float
+        )
+
+    @property
+    def radii(self) -> np.ndarray:
+        return self._column(
+            "radii", _radius, operator.attrgetter("radius"), dtype=float
+        )
+
+    #
+    # Selection
+    #
+
+    def keys(self, sort_by: Union[Axis, SortBy]) -> Optional[np.ndarray]:
+        """the keys of ShapeList.sort_by, None for criteria that aren't vectorized"""
+        if isinstance(sort_by, Axis):
+            origin = np.array(sort_by.position.to_tuple())
+            direction = np.array(sort_by.direction.to_tuple())
+            return (self.centers - origin) @ direction
+        elif sort_by == SortBy.DISTANCE:
+            return np.linalg.norm(self.centers, axis=1)
+        elif sort_by == SortBy.LENGTH:
+            return self.lengths
+        elif sort_by == SortBy.RADIUS:
+            return self.radii
+        elif sort_by == SortBy.AREA:
+            return self.areas
+        elif sort_by == SortBy.VOLUME:
+            return self.volumes
+        return None
+
+    def mask(
+        self,
+        filter_by: Union[Axis, GeomType],
+        reverse: bool = False,
+        tolerance: float = 1e-5,
+    ) -> Optional[np.ndarray]:
+        """the selection of ShapeList.filter_by, None for criteria not vectorized
+
+        Axis selects planar faces with normal and linear edges with direction
+        parallel to the axis within the angular tolerance (in radians).
+        """
+        if isinstance(filter_by, Axis):
+            direction = np.array(filter_by.direction.to_tuple())
+            with np.errstate(invalid="ignore"):
+                mask = np.abs(self.directions @ direction) >= cos(tolerance)
+        elif isinstance(filter_by, GeomType):
+            mask = self.geom_types == filter_by.name
+        else:
+            return None
+        return ~mask if reverse else mask
+
+    @staticmethod
+    def order(keys: np.ndarray, reverse: bool = False) -> np.ndarray:
+        """stable order of keys like sorted(..., reverse=reverse)"""
+        return np.argsort(-keys if reverse else keys, kind="stable")
+
+    @staticmethod
+    def argmin(keys: np.ndarray) -> int:
+        """first minimal key, the first element of the stable sort"""
+        return int(np.argmin(keys))
+
+    @staticmethod
+    def argmax(keys: np.ndarray) -> int:
+        """last maximal key, the last element of the stable sort"""
+        return len(keys) - 1 - int(np.argmax(keys[::-1]))
+
+    @staticmethod
+    def group(keys: np.ndarray, last: bool = False, tol_digits: int = 6) -> np.ndarray:
+        """rows of the first (or last) group of keys rounded to tol_digits"""
+        rounded = np.round(keys, tol_digits)
+        value = rounded.max() if last else rounded.min()
+        return np.flatnonzero(rounded == value)
@@ -0,0 +1,34 @@
+import io
+
+from OCP.BinTools import BinTools, BinTools_FormatVersion
+from OCP.TopoDS import TopoDS_Shape
+
+__all__ = ["serialize", "deserialize"]
+
+#
+# Binary BRep
+#
+
+
+def serialize(shape: TopoDS_Shape) -> bytes:
+    """Binary BRep of shape
+
+    It keeps the location of shape and stores shared sub-shapes (e.g. the TShape
+    of instances placed with @ or *) only once. Triangulations are not written.
+    """
+    stream = io.BytesIO()
+    BinTools.Write_s(
+        shape,
+        stream,
+        False,
+        False,
+        BinTools_FormatVersion.BinTools_FormatVersion_CURRENT,
+    )
+    return stream.getvalue()
+
+
+def deserialize(data: bytes) -> TopoDS_Shape:
+    """shape of the binary BRep created by serialize"""
+    shape = TopoDS_Shape()
+    BinTools.Read_s(shape, io.BytesIO(data))
+    return shape
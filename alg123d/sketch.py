@@ -2,7 +2,7 @@ from typing import List, Tuple, Union
 
 import build123d as bd
 
-from .algcompound import AlgCompound
+from .algcompound import AlgCompound, SketchObject
 from .topology import *
 
 __all__ = [
@@ -27,7 +27,7 @@ __all__ = [
 #
 
 
-class Circle(AlgCompound):
+class Circle(SketchObject):
     def __init__(
         self,
         radius: float,
@@ -36,14 +36,11 @@ class Circle(AlgCompound):
         if isinstance(align, Align):
             align = (align,) * 2
 
-        params = dict(
-            radius=radius,
-            align=align,
-        )
-        super().__init__(self.create_sketch(bd.Circle, params=params))
+        face = Face.make_from_wires(Wire.make_circle(radius))
+        super().__init__(self.aligned(face, align))
 
 
-class Ellipse(AlgCompound):
+class Ellipse(SketchObject):
     def __init__(
         self,
         x_radius: float,
@@ -53,15 +50,11 @@ class Ellipse(AlgCompound):
         if isinstance(align, Align):
             align = (align,) * 2
 
-        params = dict(
-            x_radius=x_radius,
-            y_radius=y_radius,
-            align=align,
-        )
-        super().__init__(self.create_sketch(bd.Ellipse, params=params))
+        face = Face.make_from_wires(Wire.make_ellipse(x_radius, y_radius))
+        super().__init__(self.aligned(face, align))
 
 
-class Rectangle(AlgCompound):
+class Rectangle(SketchObject):
     def __init__(
         self,
         width: float,
@@ -71,15 +64,12 @@ class Rectangle(AlgCompound):
         if isinstance(align, Align):
             align = (align,) * 2
 
-        params = dict(
-            width=width,
-            height=height,
-            align=align,
-        )
-        super().__init__(self.create_sketch(bd.Rectangle, params=params))
+        # same argument order as build123d's Rectangle
+        face = Face.make_rect(height, width)
+        super().__init__(self.aligned(face, align))
 
 
-class RectangleRounded(AlgCompound):
+class RectangleRounded(SketchObject):
     def __init__(
         self,
         width: float,
@@ -90,16 +80,12 @@ class RectangleRounded(AlgCompound):
         if isinstance(align, Align):
             align = (align,) * 2
 
-        params = dict(
-            width=width,
-            height=height,
-            align=align,
-            radius=radius,
-        )
-        super().__init__(self.create_sketch(bd.RectangleRounded, params=params))
+        face = Face.make_rect(height, width)
+        face = face.fillet_2d(radius, face.vertices())
+        super().__init__(self.aligned(face, align))
 
 
-class Polygon(AlgCompound):
+class Polygon(SketchObject):
     def __init__(
         self,
         pts: List[VectorLike],
@@ -108,13 +94,13 @@ class Polygon(AlgCompound):
         if isinstance(align, Align):
             align = (align,) * 2
 
-        params = dict(
-            align=align,
+        face = Face.make_from_wires(
+            Wire.make_polygon([Vector(p) for p in pts], close=True)
         )
-        super().__init__(self.create_sketch(bd.Polygon, objects=pts, params=params))
+        super().__init__(self.aligned(face, align))
 
 
-class RegularPolygon(AlgCompound):
+class RegularPolygon(SketchObject):
     def __init__(
         self,
         radius: float,
@@ -132,7 +118,7 @@ class RegularPolygon(AlgCompound):
         super().__init__(self.create_sketch(bd.RegularPolygon, params=params))
 
 
-class Text(AlgCompound):
+class Text(SketchObject):
     def __init__(
         self,
         txt: str,
@@ -160,7 +146,7 @@ class Text(AlgCompound):
         super().__init__(self.create_sketch(bd.Text, params=params))
 
 
-class Trapezoid(AlgCompound):
+class Trapezoid(SketchObject):
     def __init__(
         self,
         width: float,
@@ -182,7 +168,7 @@ class Trapezoid(AlgCompound):
         super().__init__(self.create_sketch(bd.Trapezoid, params=params))
 
 
-class SlotArc(AlgCompound):
+class SlotArc(SketchObject):
     def __init__(
         self,
         arc: Union[Edge, Wire],
@@ -195,7 +181,7 @@ class SlotArc(AlgCompound):
         super().__init__(self.create_sketch(bd.SlotArc, params=params))
 
 
-class SlotCenterPoint(AlgCompound):
+class SlotCenterPoint(SketchObject):
     def __init__(
         self,
         center: VectorLike,
@@ -210,7 +196,7 @@ class SlotCenterPoint(AlgCompound):
         super().__init__(self.create_sketch(bd.SlotCenterPoint, params=params))
 
 
-class SlotCenterToCenter(AlgCompound):
+class SlotCenterToCenter(SketchObject):
     def __init__(
         self,
         center_separation: float,
@@ -223,7 +209,7 @@ class SlotCenterToCenter(AlgCompound):
         super().__init__(self.create_sketch(bd.SlotCenterToCenter, params=params))
 
 
-class SlotOverall(AlgCompound):
+class SlotOverall(SketchObject):
     def __init__(
         self,
         width: float,
@@ -19,13 +19,33 @@ from OCP.XCAFDoc import (
     XCAFDoc_ColorSurf,
     XCAFDoc_DocumentTool,
 )
+from OCP.gp import gp_Trsf
 
-# from ocp_tessellate.ocp_utils import deserialize, loc_to_tq, serialize, tq_to_loc
 from ocp_tessellate.utils import warn
 
+from .profiling import traced
+from .serialize import deserialize, serialize
+
 DEFAULT_COLOR = (0.8, 0.8, 0.8, 1)
 
 
+def loc_to_tuple(loc):
+    """12 values of the transformation matrix of a TopLoc_Location (or None)"""
+    if loc is None:
+        return None
+    trsf = loc.Transformation()
+    return tuple(trsf.Value(r, c) for r in range(1, 4) for c in range(1, 5))
+
+
+def tuple_to_loc(values):
+    """TopLoc_Location of the 12 values created by loc_to_tuple (or None)"""
+    if values is None:
+        return None
+    trsf = gp_Trsf()
+    trsf.SetValues(*values)
+    return TopLoc_Location(trsf)
+
+
 def clean_string(s):
     return (
         "".join(ch for ch in s if unicodedata.category(ch)[0] != "C")
@@ -227,6 +247,7 @@ class StepReader:
 
         return result
 
+    @traced()
     def load(self, filename, cache_name=None, clear_cache=False):
         """
         Load a STEP file
@@ -305,9 +326,11 @@ class StepReader:
                 name = f"{obj['name']}_{names[name]}"
 
                 a.add(
-                    to_workplane(obj["shape"])
-                    if obj["shapes"] is None
-                    else walk(obj["shapes"]),
+                    (
+                        to_workplane(obj["shape"])
+                        if obj["shapes"] is None
+                        else walk(obj["shapes"])
+                    ),
                     name=name,
                     color=None if obj["color"] is None else cq.Color(*obj["color"]),
                     loc=cq.Location(obj.get("loc")),
@@ -342,54 +365,54 @@ class StepReader:
 
         return result
 
-    # def save_assembly(self, filename):
-    #     """
-    #     Cache the STEP file in a pickle file with binary BRep buffers
-    #     :param filename: name of the cache object
-    #     """
-
-    #     def _save_assembly(assemblies):
-    #         if assemblies is None:
-    #             return None
-
-    #         result = []
-    #         for assembly in assemblies:
-    #             obj = self._create_assembly_object(
-    #                 assembly["name"],
-    #                 loc_to_tq(assembly["loc"]),
-    #                 assembly["color"],
-    #                 serialize(assembly["shape"]),
-    #                 _save_assembly(assembly["shapes"]),
-    #             )
-    #             result.append(obj)
-    #         return result
-
-    #     objs = _save_assembly(self.assemblies)
-    #     with open(filename, "wb") as fd:
-    #         pickle.dump(objs, fd)
-
-    # def load_assembly(self, filename):
-    #     """
-    #     Load the STEP file from a pickle file with binary BRep buffers.
-    #     The result will be stores as a list of AssemblyObjects in self.assemblies
-    #     :param filename: name of the cache object
-    #     """
-
-    #     def _load_assembly(objs):
-    #         if objs is None:
-    #             return None
-
-    #         result = []
-    #         for obj in objs:
-    #             assembly = self._create_assembly_object(
-    #                 obj["name"],
-    #                 tq_to_loc(*obj["loc"]),
-    #                 obj["color"],
-    #                 deserialize(obj["shape"]),
-    #                 _load_assembly(obj["shapes"]),
-    #             )
-    #             result.append(assembly)
-    #         return result
-
-    #     with open(filename, "rb") as fd:
-    #         self.assemblies = _load_assembly(pickle.load(fd))
+    def save_assembly(self, filename):
+        """
+        Cache the STEP file in a pickle file with binary BRep buffers
+        :param filename: name of the cache object
+        """
+
+        def _save_assembly(assemblies):
+            if assemblies is None:
+                return None
+
+            result = []
+            for assembly in assemblies:
+                obj = self._create_assembly_object(
+                    assembly["name"],
+                    loc_to_tuple(assembly["loc"]),
+                    assembly["color"],
+                    None if assembly["shape"] is None else serialize(assembly["shape"]),
+                    _save_assembly(assembly["shapes"]),
+                )
+                result.append(obj)
+            return result
+
+        objs = _save_assembly(self.assemblies)
+        with open(filename, "wb") as fd:
+            pickle.dump(objs, fd)
+
+    def load_assembly(self, filename):
+        """
+        Load the STEP file from a pickle file with binary BRep buffers.
+        The result will be stores as a list of AssemblyObjects in self.assemblies
+        :param filename: name of the cache object
+        """
+
+        def _load_assembly(objs):
+            if objs is None:
+                return None
+
+            result = []
+            for obj in objs:
+                assembly = self._create_assembly_object(
+                    obj["name"],
+                    tuple_to_loc(obj["loc"]),
+                    obj["color"],
+                    None if obj["shape"] is None else deserialize(obj["shape"]),
+                    _load_assembly(obj["shapes"]),
+                )
+                result.append(assembly)
+            return result
+
+        with open(filename, "rb") as fd:
+            self.assemblies = _load_assembly(pickle.load(fd))
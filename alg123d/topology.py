@@ -1,8 +1,17 @@
-from typing import List
+import operator
+from typing import Callable, Dict, List
+
+from OCP.TopAbs import TopAbs_ShapeEnum
+from OCP.TopExp import TopExp_Explorer
+from OCP.TopTools import TopTools_IndexedMapOfShape, TopTools_MapOfShape
+from OCP.TopoDS import TopoDS_Shape
+import numpy as np
 
 from build123d.build_enums import *
 from build123d.topology import *
 
+from .selectors import ShapeProperties
+
 # Classes coverage:
 #  - Mixin1D
 #  - Mixin3D
@@ -91,13 +100,364 @@ def _filter(
         return objs.filter_by(filter_by, reverse, tolerance)
 
 
+#
+# Topology index
+#
+
+_SHAPE_ENUMS = {
+    Vertex.__name__: TopAbs_ShapeEnum.TopAbs_VERTEX,
+    Edge.__name__: TopAbs_ShapeEnum.TopAbs_EDGE,
+    Wire.__name__: TopAbs_ShapeEnum.TopAbs_WIRE,
+    Face.__name__: TopAbs_ShapeEnum.TopAbs_FACE,
+    Shell.__name__: TopAbs_ShapeEnum.TopAbs_SHELL,
+    Solid.__name__: TopAbs_ShapeEnum.TopAbs_SOLID,
+    Compound.__name__: TopAbs_ShapeEnum.TopAbs_COMPOUND,
+}
+
+
+class _TopologyIndex:
+    """Indexed maps of the distinct sub-shapes of a shape per type, built on first use
+
+    The index keeps a copy of the shape it was built for. Shape.move and
+    Shape.locate change the location of wrapped in place, the copy doesn't change,
+    so comparing both detects a new wrapped as well as a moved one.
+    """
+
+    __slots__ = ("shape", "maps", "occurrences", "entities", "properties", "adjacency")
+
+    def __init__(self, shape: TopoDS_Shape):
+        self.shape = shape.Located(shape.Location())
+        self.maps: Dict[str, TopTools_IndexedMapOfShape] = {}
+        self.occurrences: Dict[str, List[TopoDS_Shape]] = {}
+        self.entities: Dict[str, List[TopoDS_Shape]] = {}
+        self.properties: Dict[str, ShapeProperties] = {}
+        self.adjacency = None  # adjacency.Adjacency, built on first use
+
+    def __copy__(self):
+        return None  # copies of a Shape build their own index
+
+    def __deepcopy__(self, memo):
+        return None
+
+    def valid(self, shape: TopoDS_Shape) -> bool:
+        return self.shape.IsEqual(shape)
+
+    def map(self, topo_type: str) -> TopTools_IndexedMapOfShape:
+        shape_map = self.maps.get(topo_type)
+        if shape_map is None:
+            # the map keeps the first occurrence of a sub-shape, Shape._entities
+            # returned the last one, e.g. the reversed occurrence of a seam edge
+            shape_map, occurrences = TopTools_IndexedMapOfShape(), []
+            explorer = TopExp_Explorer(self.shape, _SHAPE_ENUMS[topo_type])
+            while explorer.More():
+                current = explorer.Current()
+                i = shape_map.Add(current)  # index of the first occurrence
+                if i > len(occurrences):
+                    occurrences.append(current)
+                else:
+                    occurrences[i - 1] = current
+                explorer.Next()
+            self.maps[topo_type] = shape_map
+            self.occurrences[topo_type] = occurrences
+        return shape_map
+
+    def get(self, topo_type: str) -> List[TopoDS_Shape]:
+        """the sub-shapes of type topo_type in exploration order, no degenerated edges
+
+        Every sub-shape has the orientation of its last occurrence, like Shape._entities
+        """
+        entities = self.entities.get(topo_type)
+        if entities is None:
+            self.map(topo_type)
+            entities = list(self.occurrences[topo_type])
+            if topo_type == Edge.__name__:
+                entities = [
+                    e for e in entities if not BRep_Tool.Degenerated_s(TopoDS.Edge_s(e))
+                ]
+            self.entities[topo_type] = entities
+        return entities
+
+    def get_properties(self, topo_type: str, wrap: Callable) -> ShapeProperties:
+        """the array properties of the sub-shapes of get(topo_type)"""
+        properties = self.properties.get(topo_type)
+        if properties is None:
+            properties = ShapeProperties(self.get(topo_type), wrap)
+            self.properties[topo_type] = properties
+        return properties
+
+
+def topology_index(shape: Shape) -> _TopologyIndex:
+    """The cached topology index of shape, rebuilt if wrapped was replaced or moved"""
+    wrapped = shape.wrapped
+    index = shape.__dict__.get("_topology_index")
+    if index is None or not index.valid(wrapped):
+        index = _TopologyIndex(wrapped)
+        shape.__dict__["_topology_index"] = index
+    return index
+
+
+def _lazy(shape: Shape, topo_type: str) -> "LazyShapeList":
+    """the sub-shapes of type topo_type of shape as LazyShapeList"""
+    if shape.wrapped is None:
+        return LazyShapeList([], _WRAPPERS[topo_type])
+    return _indexed(topology_index(shape), topo_type)
+
+
+def _indexed(index: _TopologyIndex, topo_type: str, rows=None) -> "LazyShapeList":
+    """the sub-shapes of type topo_type of index, only the ones at rows if given"""
+    wrap = _WRAPPERS[topo_type]
+    shapes = LazyShapeList(
+        index.get(topo_type), wrap, index.get_properties(topo_type, wrap)
+    )
+    return shapes if rows is None else shapes._subset(rows)
+
+
+#
+# Lazy ShapeList
+#
+
+
+def _sort_key(sort_by: Union[Axis, SortBy]) -> Callable:
+    """key of ShapeList.sort_by for one object, None for other criteria"""
+    if isinstance(sort_by, Axis):
+        return lambda obj: (obj.center() - sort_by.position).dot(sort_by.direction)
+    elif sort_by == SortBy.DISTANCE:
+        return lambda obj: obj.center().length
+    elif sort_by in (SortBy.LENGTH, SortBy.RADIUS, SortBy.AREA, SortBy.VOLUME):
+        return operator.attrgetter(sort_by.name.lower())
+    return None
+
+
+class LazyShapeList(ShapeList):
+    """ShapeList of OCCT shapes that are wrapped as Face, Edge, ... when accessed
+
+    Indexing, slicing, len and iteration don't wrap more objects than accessed.
+    filter_by, sort_by, min, max, min_group and max_group select with the NumPy
+    arrays of ShapeProperties (kept in the topology index for the lists returned
+    by faces(), edges(), ...), so min and max are O(n) and repeated selections
+    don't create any objects. Criteria that aren't vectorized fall back to
+    ShapeList. Methods that change the list (append, sort, ...) turn it into an
+    ordinary ShapeList holding all objects.
+
+    Args:
+        entities (List[TopoDS_Shape]): the OCCT shapes, not copied
+        wrap (Callable): creates the object of an OCCT shape
+        properties (ShapeProperties, optional): the properties of entities.
+            Defaults to None.
+    """
+
+    def __init__(
+        self,
+        entities: List[TopoDS_Shape],
+        wrap: Callable,
+        properties: ShapeProperties = None,
+    ):
+        super().__init__()
+        self._entities = entities
+        self._wrap = wrap
+        self._properties = properties
+        self._items = {}
+
+    @property
+    def properties(self) -> ShapeProperties:
+        """the properties of the objects as NumPy arrays"""
+        if self._entities is None:
+            return ShapeProperties([obj.wrapped for obj in self], Shape.cast)
+        if self._properties is None:
+            self._properties = ShapeProperties(self._entities, self._wrap)
+        return self._properties
+
+    def _item(self, i: int) -> Shape:
+        obj = self._items.get(i)
+        if obj is None:
+            obj = self._items[i] = self._wrap(self._entities[i])
+        return obj
+
+    def _subset(self, rows) -> "LazyShapeList":
+        entities = [self._entities[i] for i in rows]
+        properties = self._properties
+        if properties is not None:
+            properties = properties.take(rows, entities)
+        return LazyShapeList(entities, self._wrap, properties)
+
+    def _materialize(self):
+        if self._entities is not None:
+            items = [self._item(i) for i in range(len(self._entities))]
+            self._entities = self._items = self._properties = None
+            list.extend(self, items)
+
+    def __len__(self):
+        if self._entities is None:
+            return super().__len__()
+        return len(self._entities)
+
+    def __getitem__(self, key):
+        if self._entities is None:
+            return super().__getitem__(key)
+        if isinstance(key, slice):
+            return self._subset(range(len(self._entities))[key])
+        n = len(self._entities)
+        if not -n <= key < n:
+            raise IndexError("list index out of range")
+        return self._item(key % n)
+
+    def __iter__(self):
+        if self._entities is None:
+            return super().__iter__()
+        return (self._item(i) for i in range(len(self._entities)))
+
+    def __reversed__(self):
+        if self._entities is None:
+            return super().__reversed__()
+        return (self._item(i) for i in reversed(range(len(self._entities))))
+
+    def __contains__(self, obj):
+        if self._entities is None:
+            return super().__contains__(obj)
+        return isinstance(obj, Shape) and any(
+            e.IsSame(obj.wrapped) for e in self._entities
+        )
+
+    def __repr__(self):
+        return repr(ShapeList(self))
+
+    def __sub__(self, other: List[Shape]) -> ShapeList:
+        if self._entities is None:
+            return super().__sub__(other)
+        others = TopTools_MapOfShape()
+        if isinstance(other, LazyShapeList) and other._entities is not None:
+            for e in other._entities:
+                others.Add(e)
+        else:
+            for obj in other:
+                others.Add(obj.wrapped)
+        return self._subset(
+            [i for i, e in enumerate(self._entities) if not others.Contains(e)]
+        )
+
+    def __reduce__(self):
+        return (ShapeList, (list(self),))
+
+    def filter_by(
+        self,
+        filter_by: Union[Axis, GeomType],
+        reverse: bool = False,
+        tolerance: float = 1e-5,
+    ) -> ShapeList:
+        if self._entities is None:
+            return super().filter_by(filter_by, reverse, tolerance)
+        mask = self.properties.mask(filter_by, reverse, tolerance)
+        if mask is None:
+            # the criteria of ShapeList.filter_by only depend on the object itself
+            mask = [
+                bool(
+                    ShapeList([self._wrap(e)]).filter_by(filter_by, reverse, tolerance)
+                )
+                for e in self._entities
+            ]
+        return self._subset(np.flatnonzero(mask))
+
+    def sort_by(
+        self, sort_by: Union[Axis, SortBy] = Axis.Z, reverse: bool = False
+    ) -> ShapeList:
+        keys = None if self._entities is None else self.properties.keys(sort_by)
+        if keys is None:
+            return super().sort_by(sort_by, reverse)
+        return self._subset(ShapeProperties.order(keys, reverse))
+
+    def min(self, sort_by: Union[Axis, SortBy] = Axis.Z) -> Shape:
+        keys = self._keys(sort_by)
+        if keys is None:
+            return super().min(sort_by)
+        return self[ShapeProperties.argmin(keys)]
+
+    def max(self, sort_by: Union[Axis, SortBy] = Axis.Z, wrapped=False) -> Shape:
+        keys = self._keys(sort_by)
+        if keys is None:
+            return super().max(sort_by)
+        return self[ShapeProperties.argmax(keys)]
+
+    def min_group(self, sort_by: Union[Axis, SortBy] = Axis.Z) -> ShapeList:
+        keys = self._keys(sort_by)
+        if keys is None:
+            return super().min_group(sort_by)
+        return self._subset(ShapeProperties.group(keys))
+
+    def max_group(self, sort_by: Union[Axis, SortBy] = Axis.Z) -> ShapeList:
+        keys = self._keys(sort_by)
+        if keys is None:
+            return super().max_group(sort_by)
+        return self._subset(ShapeProperties.group(keys, last=True))
+
+    def _keys(self, sort_by: Union[Axis, SortBy]) -> np.ndarray:
+        """vectorized keys of sort_by for a non empty lazy list, else None"""
+        if not self._entities:
+            return None
+        return self.properties.keys(sort_by)
+
+
+def _materializing(name: str):
+    method = getattr(ShapeList, name)
+
+    def wrapper(self, *args, **kwargs):
+        self._materialize()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "__add__",
+    "__mul__",
+    "__rmul__",
+    "__eq__",
+    "__ne__",
+    "__lt__",
+    "__le__",
+    "__gt__",
+    "__ge__",
+    "append",
+    "extend",
+    "insert",
+    "remove",
+    "pop",
+    "clear",
+    "sort",
+    "reverse",
+    "index",
+    "count",
+    "copy",
+):
+    setattr(LazyShapeList, _name, _materializing(_name))
+
+
+def _vertex(shape: TopoDS_Shape) -> Vertex:
+    return Vertex(downcast(shape))
+
+
+_WRAPPERS = {
+    Vertex.__name__: _vertex,
+    Edge.__name__: Edge,
+    Wire.__name__: Wire,
+    Face.__name__: Face,
+    Shell.__name__: Shell,
+    Solid.__name__: Solid,
+    Compound.__name__: Compound,
+}
+
+
 def _shape_vertices(
     self,
     filter_by: Union[Axis, GeomType] = None,
     reverse: bool = False,
     tolerance: float = 1e-5,
 ):
-    vertices = ShapeList([Vertex(downcast(i)) for i in self._entities(Vertex.__name__)])
+    vertices = _lazy(self, Vertex.__name__)
     return _filter(vertices, filter_by, reverse, tolerance)
 
 
@@ -107,13 +467,7 @@ def _shape_edges(
     reverse: bool = False,
     tolerance: float = 1e-5,
 ):
-    edges = ShapeList(
-        [
-            Edge(i)
-            for i in self._entities(Edge.__name__)
-            if not BRep_Tool.Degenerated_s(TopoDS.Edge_s(i))
-        ]
-    )
+    edges = _lazy(self, Edge.__name__)
     return _filter(edges, filter_by, reverse, tolerance)
 
 
@@ -123,7 +477,7 @@ def _shape_compounds(
     reverse: bool = False,
     tolerance: float = 1e-5,
 ):
-    compounds = ShapeList([Compound(i) for i in self._entities(Compound.__name__)])
+    compounds = _lazy(self, Compound.__name__)
     return _filter(compounds, filter_by, reverse, tolerance)
 
 
@@ -133,7 +487,7 @@ def _shape_wires(
     reverse: bool = False,
     tolerance: float = 1e-5,
 ):
-    wires = ShapeList([Wire(i) for i in self._entities(Wire.__name__)])
+    wires = _lazy(self, Wire.__name__)
     return _filter(wires, filter_by, reverse, tolerance)
 
 
@@ -143,7 +497,7 @@ def _shape_faces(
     reverse: bool = False,
     tolerance: float = 1e-5,
 ):
-    faces = ShapeList([Face(i) for i in self._entities(Face.__name__)])
+    faces = _lazy(self, Face.__name__)
     return _filter(faces, filter_by, reverse, tolerance)
 
 
@@ -153,7 +507,7 @@ def _shape_shells(
     reverse: bool = False,
     tolerance: float = 1e-5,
 ):
-    shells = ShapeList([Shell(i) for i in self._entities(Shell.__name__)])
+    shells = _lazy(self, Shell.__name__)
     return _filter(shells, filter_by, reverse, tolerance)
 
 
@@ -163,7 +517,7 @@ def _shape_solids(
     reverse: bool = False,
     tolerance: float = 1e-5,
 ):
-    solids = ShapeList([Solid(i) for i in self._entities(Solid.__name__)])
+    solids = _lazy(self, Solid.__name__)
     return _filter(solids, filter_by, reverse, tolerance)
 
 
@@ -182,7 +536,7 @@ Shape.solids = _shape_solids
 
 
 def _shapelist_sub(self, other: List[Shape]) -> ShapeList:
-    d2 = [hash(o) for o in other]
+    d2 = {hash(o) for o in other}
     d1 = {hash(o): o for o in self if hash(o) not in d2}
     return ShapeList(d1.values())
 
@@ -190,13 +544,20 @@ def _shapelist_sub(self, other: List[Shape]) -> ShapeList:
 def _shapelist_max(
     self, sort_by: Union[Axis, SortBy] = Axis.Z, wrapped=False
 ) -> Union[Solid, Face, Wire, Edge, Vertex]:
-    return self.sort_by(sort_by)[-1]
+    key = _sort_key(sort_by)
+    if key is None or not self:
+        return self.sort_by(sort_by)[-1]
+    # the last maximum like the last element of the stable sort
+    return max(reversed(self), key=key)
 
 
 def _shapelist_min(
     self, sort_by: Union[Axis, SortBy] = Axis.Z
 ) -> Union[Solid, Face, Wire, Edge, Vertex]:
-    return self.sort_by(sort_by)[0]
+    key = _sort_key(sort_by)
+    if key is None or not self:
+        return self.sort_by(sort_by)[0]
+    return min(self, key=key)
 
 
 def _shapelist_min_group(self, sort_by: Union[Axis, SortBy] = Axis.Z) -> ShapeList:
@@ -0,0 +1,88 @@
+# %%
+import os
+import runpy
+import timeit
+
+from alg123d import *
+
+# Boolean options: OCCT's glue mode for operands that only touch and running the
+# boolean in parallel threads, on a brick grid and on the LEGO example.
+
+N = 3
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "examples")
+
+
+def measure(func, **options):
+    with BooleanOptions(**options):
+        result = func()
+        return result, timeit.timeit(func, number=N) / N
+
+
+def report(name, cases, reference):
+    print(f"\n{name}")
+    base, t_base = measure(reference[1], **reference[0])
+    for options, func in cases:
+        result, t = measure(func, **options)
+        assert abs(result.volume - base.volume) < 1e-6 * base.volume, options
+        label = ", ".join(f"{k}={v}" for k, v in options.items())
+        print(f"  {label:32s} {t * 1e3:8.1f}ms {t_base / t:6.1f}x")
+
+
+# %% Grid of touching bricks
+
+brick = Box(8, 4, 3, align=(Align.MIN, Align.MIN, Align.MIN))
+bricks = [
+    brick @ Pos(8 * i + 4 * (j % 2), 4 * j, 3 * k)
+    for i in range(10)
+    for j in range(10)
+    for k in range(2)
+]
+
+
+def grid():
+    return AlgCompound() + bricks
+
+
+off = dict(glue=Glue.OFF, parallel=False)
+report(
+    "brick grid (200 bricks)",
+    [
+        (off, grid),
+        (dict(glue=Glue.OFF, parallel=True), grid),
+        (dict(glue=Glue.SHIFT, parallel=False), grid),
+        (dict(glue=Glue.SHIFT, parallel=True), grid),
+    ],
+    (off, grid),
+)
+
+# %% LEGO block
+
+# the pips touch the top face of the block only
+block = Box(48, 16, 9.6, align=(Align.CENTER, Align.CENTER, Align.MIN))
+pips = Cylinder(2.4, 1.8, align=(Align.CENTER, Align.CENTER, Align.MIN)) @ [
+    Plane(block.faces().max()) * loc for loc in GridLocations(8, 8, 6, 2)
+]
+
+
+def example():
+    return runpy.run_path(os.path.join(EXAMPLES, "lego.py"))["lego"]
+
+
+def add_pips():
+    return block + pips
+
+
+report(
+    "lego example",
+    [(off, example), (dict(parallel=True), example)],
+    (off, example),
+)
+report(
+    "lego pips",
+    [
+        (off, add_pips),
+        (dict(glue=Glue.SHIFT, parallel=False), add_pips),
+        (dict(glue=Glue.SHIFT, parallel=True), add_pips),
+    ],
+    (off, add_pips),
+)
@@ -0,0 +1,266 @@
+import contextlib
+import io
+import os
+import runpy
+from collections import namedtuple
+
+import alg123d
+from alg123d import *
+
+# Cases of the benchmark suite (run with benchmarks/suite.py)
+#
+# @case registers a function timed as a whole, @scaling a function timed for every
+# size n to fit the exponent k of t ~ n^k. setup runs untimed before every repeat and
+# its result is passed to the function: a fresh shape per repeat, otherwise only the
+# first repeat builds the topology index of the shape and the others time cache hits.
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+Case = namedtuple("Case", ["name", "func", "setup", "repeat"])
+Scaling = namedtuple("Scaling", ["name", "func", "setup", "sizes", "expected"])
+
+CASES = []
+SCALING = []
+
+
+def case(name: str, setup=None, repeat: int = 3):
+    def decorator(func):
+        CASES.append(Case(name, func, setup, repeat))
+        return func
+
+    return decorator
+
+
+def scaling(name: str, sizes, expected: float = 1.0, setup=None):
+    """expected is the exponent k of t ~ n^k the implementation should achieve"""
+
+    def decorator(func):
+        SCALING.append(Scaling(name, func, setup, tuple(sizes), expected))
+        return func
+
+    return decorator
+
+
+#
+# Grid of holes (docs/performance.md)
+#
+
+DIAM = 80
+
+
+def _inside(loc):
+    return loc.position.X**2 + loc.position.Y**2 < (DIAM / 2 - 1.8) ** 2
+
+
+@case("grid_holes/naive", repeat=1)
+def grid_holes_naive():
+    holes = AlgCompound()
+    r = Rectangle(2, 2)
+    for loc in GridLocations(4, 4, 20, 20):
+        if _inside(loc):
+            holes += r @ loc
+    return Circle(DIAM / 2) - holes
+
+
+@case("grid_holes/lazy")
+def grid_holes_lazy():
+    with LazyAlgCompound() as holes:
+        r = Rectangle(2, 2)
+        for loc in GridLocations(4, 4, 20, 20):
+            if _inside(loc):
+                holes += r @ loc
+    return Circle(DIAM / 2) - holes
+
+
+@case("grid_holes/vectorized")
+def grid_holes_vectorized():
+    r = Rectangle(2, 2)
+    holes = [r @ loc for loc in GridLocations(4, 4, 20, 20) if _inside(loc)]
+    return Circle(DIAM / 2) - holes
+
+
+@case("grid_holes/autobatch")
+def grid_holes_autobatch():
+    with AutoBatch():
+        holes = AlgCompound()
+        r = Rectangle(2, 2)
+        for loc in GridLocations(4, 4, 20, 20):
+            if _inside(loc):
+                holes += r @ loc
+        c = Circle(DIAM / 2) - holes
+    return c.wrapped
+
+
+@case("grid_holes/instanced")
+def grid_holes_instanced():
+    locs = GridLocations(4, 4, 20, 20)
+    x, y = locs.positions[:, 0], locs.positions[:, 1]
+    inside = x**2 + y**2 < (DIAM / 2 - 1.8) ** 2
+    return Circle(DIAM / 2) - Rectangle(2, 2) @ locs[inside]
+
+
+#
+# Examples
+#
+
+
+def _ignore(*args, **kwargs):
+    pass
+
+
+@contextlib.contextmanager
+def _no_viewer():
+    """replace show and show_object, which alg123d imports from an installed viewer
+
+    The examples get them with "from alg123d import *" and call them if they exist,
+    so the cases would time (or hang on) the round trip to the viewer.
+    """
+    saved = {
+        n: getattr(alg123d, n) for n in ("show", "show_object") if hasattr(alg123d, n)
+    }
+    for n in saved:
+        setattr(alg123d, n, _ignore)
+    try:
+        yield
+    finally:
+        for n, func in saved.items():
+            setattr(alg123d, n, func)
+
+
+def _example(name):
+    def run():
+        with _no_viewer():
+            return runpy.run_path(os.path.join(ROOT, "examples", f"{name}.py"))
+
+    return run
+
+
+for _name, _repeat in [
+    ("lego", 3),
+    ("pcb", 3),
+    ("hexapod", 1),
+    ("roller_coaster", 3),
+    ("clock", 3),
+]:
+    case(f"examples/{_name}", repeat=_repeat)(_example(_name))
+
+
+#
+# Primitives
+#
+
+
+@case("primitives/part")
+def primitives_part():
+    for i in range(100):
+        Box(1, 2, 3 + i)
+        Cylinder(1, 2 + i)
+        Sphere(1 + i)
+
+
+@case("primitives/sketch")
+def primitives_sketch():
+    for i in range(100):
+        Rectangle(1, 2 + i)
+        Circle(1 + i)
+        Polygon([(0, 0), (1, 0), (1, 1 + i)])
+
+
+#
+# Topology queries
+#
+
+
+def _plate(n=10):
+    plate = Box(10 * n, 10 * n, 5)
+    return plate - Cylinder(2, 5) @ GridLocations(10, 10, n, n)
+
+
+def _row(n):
+    plate = Box(10 * n, 10, 5)
+    return plate - Cylinder(2, 5) @ GridLocations(10, 10, n, 1)
+
+
+@case("topology/faces_edges_vertices", setup=_plate)
+def topology_queries(plate):
+    for _ in range(10):
+        plate.faces()
+        plate.edges()
+        plate.vertices()
+
+
+@case("topology/select", setup=_plate)
+def topology_select(plate):
+    for _ in range(10):
+        plate.faces().sort_by(Axis.Z)[-1]
+        plate.edges().filter_by(GeomType.CIRCLE)
+        plate.edges().group_by(Axis.Z)
+
+
+@case("topology/first_and_max", setup=_plate)
+def topology_first_and_max(plate):
+    for _ in range(10):
+        plate.faces()[0]
+        plate.edges().max()
+
+
+@case("topology/adjacency", setup=_plate)
+def topology_adjacency(plate):
+    for face in plate.faces():
+        plate.adjacency.neighbors(face)
+
+
+#
+# STEP loading
+#
+
+STEP_FILE = os.path.join(ROOT, "tests", "M6-1x12-countersunk-screw.step")
+
+
+@case("step/import_step")
+def step_import():
+    return import_step(STEP_FILE)
+
+
+@case("step/step_reader")
+def step_reader():
+    from alg123d.stepreader import StepReader
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        reader = StepReader()
+        reader.load(STEP_FILE)
+    return reader
+
+
+#
+# Scaling
+#
+
+
+def _bar(n):
+    return Box(10 * n, 10, 5)
+
+
+@scaling("scaling/cut_holes", sizes=(4, 8, 16, 32), setup=_bar)
+def scaling_cut_holes(plate, n):
+    return plate - [Cylinder(2, 5) @ loc for loc in GridLocations(10, 10, n, 1)]
+
+
+@scaling("scaling/fuse_disjoint_boxes", sizes=(25, 50, 100, 200))
+def scaling_fuse_disjoint(_, n):
+    return AlgCompound() + [Box(1, 1, 1) @ Pos(2 * i, 0, 0) for i in range(n)]
+
+
+@scaling("scaling/fuse_overlapping_boxes", sizes=(25, 50, 100, 200))
+def scaling_fuse_overlapping(_, n):
+    return AlgCompound() + [Box(1.5, 1, 1) @ Pos(i, 0, 0) for i in range(n)]
+
+
+@scaling("scaling/instances", sizes=(100, 400, 1600, 6400))
+def scaling_instances(_, n):
+    return Box(1, 1, 1) @ GridLocations(2, 2, n // 10, 10)
+
+
+@scaling("scaling/topology_faces", sizes=(8, 16, 32, 64), setup=_row)
+def scaling_topology(plate, n):
+    return plate.faces()
@@ -0,0 +1,59 @@
+# %%
+import timeit
+
+import build123d as bd
+from alg123d import *
+
+# Builder-free primitives vs. the build123d builder path (BuildPart/BuildSketch
+# context with a Mode.PRIVATE object), which the primitives used before.
+
+N = 200
+
+CASES = [
+    (Box, bd.Box, dict(length=1, width=2, height=3)),
+    (Cylinder, bd.Cylinder, dict(radius=1, height=2)),
+    (Cone, bd.Cone, dict(bottom_radius=2, top_radius=1, height=2)),
+    (Sphere, bd.Sphere, dict(radius=1)),
+    (Torus, bd.Torus, dict(major_radius=3, minor_radius=1)),
+    (
+        Wedge,
+        bd.Wedge,
+        dict(xsize=2, ysize=3, zsize=4, xmin=0.5, zmin=0.5, xmax=1.5, zmax=3.5),
+    ),
+    (Circle, bd.Circle, dict(radius=1)),
+    (Ellipse, bd.Ellipse, dict(x_radius=2, y_radius=1)),
+    (Rectangle, bd.Rectangle, dict(width=2, height=1)),
+    (RectangleRounded, bd.RectangleRounded, dict(width=2, height=1, radius=0.2)),
+    (Polygon, bd.Polygon, dict(pts=[(0, 0), (3, 0), (3, 1), (1, 2), (0, 1)])),
+]
+
+
+def builder(cls, bd_cls, params):
+    obj = AlgCompound()
+    if issubclass(cls, PartObject):
+        return AlgCompound(obj.create_part(bd_cls, params=params))
+    elif cls is Polygon:  # bd.Polygon takes the points as positional arguments
+        params = dict(params)
+        pts = params.pop("pts")
+        return AlgCompound(obj.create_sketch(bd_cls, objects=pts, params=params))
+    else:
+        return AlgCompound(obj.create_sketch(bd_cls, params=params))
+
+
+def size(obj):
+    return obj.volume if obj.dim == 3 else obj.area
+
+
+print(f"{'primitive':18s} {'builder':>10s} {'fast':>10s} {'speedup':>8s}")
+for cls, bd_cls, params in CASES:
+    fast, slow = cls(**params), builder(cls, bd_cls, params)
+    assert abs(size(fast) - size(slow)) < 1e-6, cls.__name__
+    assert (fast.bounding_box().min - slow.bounding_box().min).length < 1e-6
+    assert (fast.bounding_box().max - slow.bounding_box().max).length < 1e-6
+
+    t_slow = timeit.timeit(lambda: builder(cls, bd_cls, params), number=N) / N
+    t_fast = timeit.timeit(lambda: cls(**params), number=N) / N
+    print(
+        f"{cls.__name__:18s} {t_slow * 1e6:8.0f}us {t_fast * 1e6:8.0f}us"
+        f" {t_slow / t_fast:7.1f}x"
+    )
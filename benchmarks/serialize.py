@@ -0,0 +1,56 @@
+# %%
+import os
+import pickle
+import tempfile
+import timeit
+
+from alg123d import *
+
+# Round trip of parts through pickle (binary BRep) vs. STEP export/import
+
+N = 5
+DIRECTORY = tempfile.mkdtemp()
+
+
+def plate(n):
+    p = Box(10 * n, 10 * n, 5)
+    p -= Cylinder(2, 5) @ GridLocations(10, 10, n, n)
+    return fillet(p, p.edges().filter_by(Axis.Z).group_by(Axis.X)[0], 1)
+
+
+def via_pickle(obj):
+    return pickle.loads(pickle.dumps(obj))
+
+
+def via_step(obj):
+    filename = os.path.join(DIRECTORY, "part.step")
+    obj.export_step(filename)
+    return AlgCompound(import_step(filename))
+
+
+print(
+    f"{'part':24s} {'pickle':>10s} {'size':>10s} {'step':>10s} {'size':>10s}"
+    f" {'speedup':>8s}"
+)
+for n in (2, 8, 16):
+    obj = plate(n)
+    assert abs(via_pickle(obj).volume - obj.volume) < 1e-6
+    assert abs(via_step(obj).volume - obj.volume) < 1e-3 * obj.volume
+
+    t_pickle = timeit.timeit(lambda: via_pickle(obj), number=N) / N
+    t_step = timeit.timeit(lambda: via_step(obj), number=N) / N
+    size_pickle = len(pickle.dumps(obj))
+    size_step = os.path.getsize(os.path.join(DIRECTORY, "part.step"))
+    print(
+        f"{f'plate {n}x{n} holes':24s}"
+        f" {t_pickle * 1e3:8.1f}ms {size_pickle / 1e3:8.1f}kB"
+        f" {t_step * 1e3:8.1f}ms {size_step / 1e3:8.1f}kB {t_step / t_pickle:7.1f}x"
+    )
+
+# instances share their TShape, which is only stored once
+
+boxes = Box(1, 1, 1) @ GridLocations(2, 2, 30, 30)
+print(
+    f"\n900 instances: {len(pickle.dumps(boxes)) / 1e3:.1f}kB"
+    f" vs one box {len(pickle.dumps(Box(1, 1, 1))) / 1e3:.1f}kB"
+)
@@ -0,0 +1,223 @@
+"""Benchmark suite with JSON history and regression thresholds
+
+    python benchmarks/suite.py                  # run all, compare, append to history
+    python benchmarks/suite.py -k grid_holes    # only cases containing "grid_holes"
+    python benchmarks/suite.py --threshold 0.1  # fail for cases > 10% slower
+
+Every case is compared with the median of the last runs of the same machine in the
+history file. The run fails (exit code 1) if a case is slower than this baseline by
+more than the threshold or if the fitted exponent k of a scaling case (t ~ n^k)
+exceeds its expected exponent by more than the scaling tolerance.
+"""
+
+import argparse
+import datetime
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable
+
+from alg123d.brepcache import library_versions
+
+import cases
+
+HISTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history.json")
+
+#
+# Measurement
+#
+
+
+def _time(func, make_args: Callable[[], tuple], repeat: int) -> float:
+    """best of repeat runs in seconds, make_args() builds the arguments of each run"""
+    best = math.inf
+    for _ in range(repeat):
+        args = make_args()
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_case(case: cases.Case) -> float:
+    if case.setup is None:
+        return _time(case.func, tuple, case.repeat)
+    return _time(case.func, lambda: (case.setup(),), case.repeat)
+
+
+def run_scaling(scaling: cases.Scaling, repeat: int) -> dict:
+    """times per size and the exponent k of the least squares fit
+
+    log t = k log n + c
+    """
+    times = {}
+    for n in scaling.sizes:
+        setup = scaling.setup or (lambda n: None)
+        times[n] = _time(scaling.func, lambda: (setup(n), n), repeat)
+
+    xs = [math.log(n) for n in times]
+    ys = [math.log(max(t, 1e-9)) for t in times.values()]
+    mx, my = statistics.mean(xs), statistics.mean(ys)
+    exponent = sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sum(
+        (x - mx) ** 2 for x in xs
+    )
+    return dict(times={str(n): t for n, t in times.items()}, exponent=exponent)
+
+
+#
+# History
+#
+
+
+def _machine() -> str:
+    return f"{platform.node()}/{platform.machine()}/{platform.python_version()}"
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(filename: str) -> list:
+    if not os.path.exists(filename):
+        return []
+    with open(filename) as f:
+        return json.load(f)
+
+
+def save_history(filename: str, history: list):
+    tmp = f"{filename}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(history, f, indent=1)
+    os.replace(tmp, filename)
+
+
+def baseline(history: list, name: str, runs: int) -> float:
+    """median time of name in the last passed runs of this machine, or None"""
+    times = [
+        run["cases"][name]
+        for run in history
+        if run["machine"] == _machine()
+        and not run.get("failed")
+        and name in run["cases"]
+    ]
+    return statistics.median(times[-runs:]) if times else None
+
+
+#
+# Main
+#
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="alg123d benchmark suite")
+    parser.add_argument(
+        "-k", dest="filter", default="", help="only cases containing this text"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.25, help="allowed relative slowdown"
+    )
+    parser.add_argument(
+        "--scaling-tolerance", type=float, default=0.3, help="allowed excess exponent"
+    )
+    parser.add_argument(
+        "--baseline-runs", type=int, default=5, help="runs of the baseline median"
+    )
+    parser.add_argument(
+        "--scaling-repeat", type=int, default=2, help="repeats per scaling size"
+    )
+    parser.add_argument("--history", default=HISTORY, help="JSON history file")
+    parser.add_argument(
+        "--no-save", action="store_true", help="don't append to the history"
+    )
+    parser.add_argument(
+        "--no-scaling", action="store_true", help="skip the scaling runs"
+    )
+    args = parser.parse_args(argv)
+
+    history = load_history(args.history)
+    failures = []
+    results = {}
+    scaling_results = {}
+
+    print(f"{'case':40s} {'time':>10s} {'baseline':>10s} {'change':>8s}")
+    for case in cases.CASES:
+        if args.filter not in case.name:
+            continue
+        t = run_case(case)
+        results[case.name] = t
+        base = baseline(history, case.name, args.baseline_runs)
+        if base is None:
+            print(f"{case.name:40s} {t * 1e3:8.1f}ms {'-':>10s} {'-':>8s}")
+            continue
+
+        change = t / base - 1
+        flag = ""
+        if change > args.threshold:
+            failures.append(
+                f"{case.name}: {change:+.0%} slower than {base * 1e3:.1f}ms"
+            )
+            flag = " REGRESSION"
+        print(
+            f"{case.name:40s} {t * 1e3:8.1f}ms {base * 1e3:8.1f}ms {change:+7.0%}{flag}"
+        )
+
+    if not args.no_scaling:
+        print(f"\n{'scaling':40s} {'exponent':>10s} {'expected':>10s}")
+        for scaling in cases.SCALING:
+            if args.filter not in scaling.name:
+                continue
+            result = run_scaling(scaling, args.scaling_repeat)
+            scaling_results[scaling.name] = result
+            flag = ""
+            if result["exponent"] > scaling.expected + args.scaling_tolerance:
+                failures.append(
+                    f"{scaling.name}: t ~ n^{result['exponent']:.2f},"
+                    f" expected n^{scaling.expected:.2f}"
+                )
+                flag = " SUPER-LINEAR"
+            times = ", ".join(
+                f"{n}: {t * 1e3:.1f}ms" for n, t in result["times"].items()
+            )
+            print(
+                f"{scaling.name:40s} {result['exponent']:10.2f}"
+                f" {scaling.expected:10.2f}{flag}  ({times})"
+            )
+
+    if not args.no_save:
+        history.append(
+            dict(
+                date=datetime.datetime.now().isoformat(timespec="seconds"),
+                commit=_commit(),
+                machine=_machine(),
+                versions=list(library_versions()),
+                cases=results,
+                scaling=scaling_results,
+                failed=bool(failures),
+            )
+        )
+        save_history(args.history, history)
+
+    if failures:
+        print("\nRegressions:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+# %%
+import os
+import tempfile
+import time
+import tracemalloc
+
+from alg123d import *
+
+# Memory and time of topology queries on a large imported STEP part: lazy
+# ShapeLists only wrap the faces that are accessed, selections use the NumPy
+# arrays of the topology index after the first query.
+
+N = 141  # N x N holes, 6 + N * N (about 20000) faces
+
+filename = os.path.join(tempfile.mkdtemp(), "plate.step")
+plate = Box(5 * N, 5 * N, 3) - Cylinder(1, 3) @ GridLocations(5, 5, N, N)
+plate.export_step(filename)
+part = AlgCompound(import_step(filename))
+part.faces()  # build the topology index
+
+
+def measure(name, func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:40s} {duration * 1e3:8.1f}ms {peak / 1e6:8.2f}MB")
+    return result
+
+
+print(f"{len(part.faces())} faces, {len(part.edges())} edges\n")
+print(f"{'query':40s} {'time':>10s} {'peak':>10s}")
+measure("faces()", lambda: part.faces())
+measure("faces()[0]", lambda: part.faces()[0])
+measure("faces().max() (first)", lambda: part.faces().max())
+measure("faces().max()", lambda: part.faces().max())
+measure("faces().min_group(Axis.Z)", lambda: part.faces().min_group(Axis.Z))
+measure("faces().filter_by(Axis.Z) (first)", lambda: part.faces().filter_by(Axis.Z))
+measure("faces().filter_by(Axis.Z)", lambda: part.faces().filter_by(Axis.Z))
+measure(
+    "faces().filter_by(CYLINDER) (first)",
+    lambda: part.faces().filter_by(GeomType.CYLINDER),
+)
+measure(
+    "faces().filter_by(CYLINDER).sort_by()",
+    lambda: part.faces().filter_by(GeomType.CYLINDER).sort_by(Axis.X),
+)
+measure("ShapeList(faces()).max() (eager)", lambda: ShapeList(part.faces()).max())
+measure("faces()[:100]", lambda: list(part.faces()[:100]))
+measure("ShapeList(faces()) (eager)", lambda: ShapeList(part.faces()))
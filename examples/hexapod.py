@@ -42,7 +42,6 @@ class Base:
         base -= Box(2 * width, 20, 3 * thickness) @ Pos(y=-length + 5)
 
         for name, pos in self.base_hinges.items():
-            last = base.edges()
             base -= (
                 Cylinder(
                     diam / 2 + tol,
@@ -51,12 +50,11 @@ class Base:
                 )
                 @ pos
             )
-            self.base_edges[name] = (base.edges() - last).min()
+            self.base_edges[name] = base.new_edges().min()
 
         for name, pos in self.stand_holes.items():
-            last = base.edges()
             base -= Box(width / 2 + 2 * tol, thickness + 2 * tol, 5 * thickness) @ pos
-            self.stand_edges[name] = (base.edges() - last).min_group()
+            self.stand_edges[name] = base.new_edges().min_group()
 
         base.mates = {
             f"{name}_hole": Mate(edge, name=name)
@@ -138,9 +136,8 @@ class UpperLeg:
         upper_leg = extrude(face, thickness / 2, both=True)
         upper_leg = fillet(upper_leg, upper_leg.edges().max(Axis.X), radius=4)
 
-        last = upper_leg.edges()
         upper_leg -= Bore(upper_leg, diam / 2 + tol) @ leg_hole
-        self.knee_hole = upper_leg.edges(GeomType.CIRCLE) - last
+        self.knee_hole = upper_leg.new_edges().filter_by(GeomType.CIRCLE)
 
         upper_leg += Cylinder(diam / 2, 2 * (height / 2 + thickness + tol)) @ Rot(
             90, 0, 0
@@ -172,9 +169,8 @@ class LowerLeg:
         lower_leg = extrude(face, thickness / 2, both=True)
         lower_leg = fillet(lower_leg, lower_leg.edges(Axis.Z), radius=4)
 
-        last = lower_leg.edges()
         lower_leg -= Bore(lower_leg, diam / 2 + tol) @ leg_hole
-        self.knee_hole = (lower_leg.edges(GeomType.CIRCLE) - last).sort_by()
+        self.knee_hole = lower_leg.new_edges().filter_by(GeomType.CIRCLE).sort_by()
 
         lower_leg.mates = {
             "knee_bottom": Mate(self.knee_hole.min(), name="knee_bottom"),
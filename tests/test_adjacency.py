@@ -0,0 +1,95 @@
+# %%
+import time
+
+from alg123d import *
+
+set_defaults(axes=True, axes0=True, transparent=True)
+
+# %%
+
+# neighbor queries of a box with a hole
+
+base = Box(40, 30, 10) - Cylinder(4, 10) @ Pos(5, 5)
+adjacency = base.adjacency
+assert adjacency is base.adjacency  # cached until the object changes
+
+top = base.faces().max()
+assert len(adjacency.edges_of(top)) == 5  # 4 lines and the circle of the hole
+assert len(adjacency.neighbors(top)) == 5  # 4 side faces and the wall of the hole
+
+wall = base.faces().filter_by(GeomType.CYLINDER)[0]
+neighbors = adjacency.neighbors(wall)
+assert len(neighbors) == 2
+assert all(abs(abs(f.center().Z) - 5) < 1e-6 for f in neighbors)
+
+seam = wall.edges().filter_by(GeomType.LINE)[0]  # an edge of the wall only
+for edge in base.edges():
+    assert len(adjacency.faces_of(edge)) == (
+        1 if edge.wrapped.IsSame(seam.wrapped) else 2
+    )
+    for face in adjacency.faces_of(edge):
+        assert edge in adjacency.edges_of(face)
+
+corner = base.vertices().sort_by(SortBy.DISTANCE)[-1]
+assert len(adjacency.edges_at(corner)) == 3
+assert len(adjacency.vertices_of(adjacency.edges_at(corner)[0])) == 2
+
+try:
+    adjacency.neighbors(Box(1, 1, 1).faces()[0])
+    raise AssertionError("ValueError expected")
+except ValueError:
+    pass
+
+show(base, adjacency.neighbors(top))
+
+# %%
+
+# CSR arrays
+
+indptr, indices = adjacency.face_faces
+assert len(indptr) == len(base.faces()) + 1
+assert indptr[-1] == len(indices)
+rows = indices[indptr[0] : indptr[1]]
+assert len(rows) == len(adjacency.neighbors(base.faces()[0]))
+
+indptr, indices = adjacency.edge_faces
+assert len(indptr) == len(base.edges()) + 1
+assert sorted(indptr[1:] - indptr[:-1])[1:] == [2] * (len(indptr) - 2)
+
+# moving the object rebuilds the graph
+base.move(Pos(0, 0, 1))
+assert adjacency is not base.adjacency
+
+# %%
+
+# fillet and chamfer accept faces of parts: their edges are used
+
+box = Box(20, 20, 10)
+a = fillet(box, box.faces().max(), 2)
+b = fillet(box, box.faces().max().edges(), 2)
+assert abs(a.volume - b.volume) < 1e-6
+assert len(a.faces()) == len(b.faces())
+
+faces = box.faces().sort_by(Axis.Z)[-2:]  # a side face and the top face
+edges = faces[0].edges() + [e for e in faces[1].edges() if e not in faces[0].edges()]
+assert len(edges) == 7
+c = chamfer(box, faces, 1)
+assert abs(c.volume - chamfer(box, edges, 1).volume) < 1e-6
+
+show(a, c @ Pos(30, 0, 0))
+
+# %%
+
+# neighbors of every face of a plate with 400 holes
+
+plate = Box(200, 200, 5) - Cylinder(2, 5) @ GridLocations(10, 10, 20, 20)
+
+t = time.time()
+indptr, indices = plate.adjacency.face_faces
+print("face_faces", time.time() - t)
+
+t = time.time()
+neighbors = [plate.adjacency.neighbors(face) for face in plate.faces()]
+print("neighbors", time.time() - t)
+
+assert sum(len(n) for n in neighbors) == len(indices)
@@ -0,0 +1,63 @@
+# %%
+import time
+from alg123d import *
+
+# %%
+
+plate = Box(50, 50, 5)
+tools = [Cylinder(2, 5) @ loc for loc in GridLocations(8, 8, 5, 5)]
+
+with BooleanCache() as cache:
+    a = time.time()
+    r1 = plate - tools
+    print("miss", time.time() - a)
+
+    a = time.time()
+    r2 = plate - tools
+    print("hit", time.time() - a)
+
+    r2.move(Pos(60, 0, 0))  # doesn't change the cached result
+    r3 = plate - tools
+
+print(cache.stats, r1.volume, r3.volume)
+show(r1, r2, r3)
+
+# %%
+
+# independently created, but equal operands
+with BooleanCache(max_bytes=10_000_000, fingerprint=True) as cache:
+    for i in range(3):
+        b = Box(10, 10, 10)
+        b = fillet(b, b.edges(), 1) - Cylinder(3, 10)
+
+print(cache.stats)
+show(b)
+
+# %%
+
+# parameters without a value key are keyed by identity and kept alive by the key,
+# so a later object can't reuse their id and get a false hit
+
+import gc
+import weakref
+
+from alg123d.fingerprint import make_key
+
+
+class Param:
+    pass
+
+
+param = Param()
+key = make_key(dict(param=param))
+assert key == make_key(dict(param=param))
+assert key != make_key(dict(param=Param()))
+
+ref = weakref.ref(param)
+del param
+gc.collect()
+assert ref() is not None  # held by key
+
+del key
+gc.collect()
+assert ref() is None
@@ -0,0 +1,63 @@
+# %%
+import time
+from alg123d import *
+
+set_defaults(axes=True, axes0=True, transparent=True)
+
+# %%
+
+brick = Box(8, 4, 3, align=(Align.MIN, Align.MIN, Align.MIN))
+bricks = [brick @ Pos(8 * i, 4 * j, 0) for i in range(8) for j in range(8)]
+
+t = time.time()
+a = AlgCompound() + bricks
+print("glue off", time.time() - t)
+
+t = time.time()
+with BooleanOptions(glue=Glue.SHIFT):
+    b = AlgCompound() + bricks
+print("glue shift", time.time() - t)
+
+assert abs(a.volume - b.volume) < 1e-6
+assert len(a.solids()) == len(b.solids()) == 1
+show(b)
+
+# %%
+
+# nested contexts only override the given options
+
+with BooleanOptions(glue=Glue.SHIFT, parallel=False):
+    with BooleanOptions(fuzzy_value=1e-5):
+        options = BooleanOptions.current()
+        assert options.glue == Glue.SHIFT
+        assert not options.parallel
+        assert options.fuzzy_value == 1e-5
+
+assert BooleanOptions.current().glue == Glue.OFF
+
+# %%
+
+# per call override, the pips only touch the box
+
+a = Box(48, 16, 9.6, align=(Align.CENTER, Align.CENTER, Align.MIN))
+pips = Cylinder(2.4, 1.8, align=(Align.CENTER, Align.CENTER, Align.MIN)) @ [
+    Plane(a.faces().max()) * loc for loc in GridLocations(8, 8, 6, 2)
+]
+b = a.combine(pips, glue=Glue.SHIFT)
+c = a + pips
+
+assert abs(b.volume - c.volume) < 1e-6
+show(b)
+
+# %%
+
+# nearly touching boxes are fused with a fuzzy value
+
+a = Box(1, 1, 1)
+b = a.combine(Box(1, 1, 1) @ Pos(1 + 1e-6, 0, 0), fuzzy_value=1e-5)
+assert len(b.solids()) == 1
+
+c = a.combine(Box(0.5, 0.5, 0.5), Mode.SUBTRACT, parallel=False)
+assert abs(c.volume - 0.875) < 1e-6
+
+show(b, reset_camera=False)
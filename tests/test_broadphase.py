@@ -0,0 +1,83 @@
+# %%
+from math import inf
+
+from alg123d import *
+from alg123d.broadphase import bounds, overlap, overlap_clusters
+
+set_defaults(axes=True, axes0=True, transparent=True)
+
+
+def box(x0, x1):
+    return (x0, 0, 0, x1, 1, 1)
+
+
+# %%
+
+# clusters are the connected components of the overlap graph, ordered by index
+
+boxes = [box(0, 1), box(10, 11), box(0.5, 2), box(20, 21), box(1.5, 3), box(10.5, 12)]
+assert overlap_clusters(boxes) == [[0, 2, 4], [1, 5], [3]]
+assert overlap_clusters([box(i, i + 0.5) for i in range(5)]) == [[i] for i in range(5)]
+assert overlap_clusters([box(i, i + 1) for i in range(5)]) == [list(range(5))]
+
+# boxes of unknown extent overlap everything
+infinite = (-inf, -inf, -inf, inf, inf, inf)
+assert overlap_clusters([box(0, 1), box(10, 11), infinite]) == [[0, 1, 2]]
+
+# %%
+
+# disjoint operands are combined without a boolean
+
+parts = [Box(1, 1, 1) @ Pos(2 * i, 0, 0) for i in range(5)]
+a = AlgCompound() + parts
+assert len(a.solids()) == 5
+assert abs(a.volume - 5) < 1e-6
+
+b = AlgCompound() + parts + [Box(2, 0.5, 0.5) @ Pos(1, 0, 0)]
+assert len(b.solids()) == 4  # the bar joins the first two boxes
+
+show(a, b @ Pos(0, 3, 0))
+
+# %%
+
+# a cut with tools outside the base object is a no-op, but still a cleaned result
+
+plate = Box(10, 10, 2) + Box(10, 10, 2) @ Pos(10, 0, 0)  # top faces get merged
+with SkipClean():
+    unclean = Box(10, 10, 2) + Box(10, 10, 2) @ Pos(10, 0, 0)
+assert len(unclean.faces()) > len(plate.faces())
+
+far = Cylinder(1, 2) @ Pos(100, 0, 0)
+with RecordHistory():
+    c = unclean - far
+assert abs(c.volume - unclean.volume) < 1e-6
+assert len(c.faces()) == len(plate.faces())
+top = c.history.modified(unclean.faces().sort_by(Axis.Z)[-1])  # merged by clean
+assert len(top) == 1 and top[0].wrapped.IsSame(c.faces().max().wrapped)
+
+with CleanPolicy(CleanMode.ALWAYS) as policy:
+    plate - far
+assert policy.stats == dict(operations=1, cleaned=1, skipped=0)
+
+with SkipClean():
+    d = unclean - far
+assert len(d.faces()) == len(unclean.faces())
+
+show(c)
+
+# %%
+
+# the fuzzy value widens the bounds, so nearly touching shapes are fused
+
+a = Box(1, 1, 1)
+b = Box(1, 1, 1) @ Pos(1 + 1e-6, 0, 0)
+assert not overlap(bounds(a), bounds(b))
+
+with BooleanOptions(fuzzy_value=1e-5):
+    wide = bounds(a)
+    assert overlap(wide, bounds(b))
+    assert len(overlap_clusters([bounds(a), bounds(b)])) == 1
+
+assert all(abs(w - n) > 0.9e-5 for w, n in zip(wide, bounds(a)))
+assert len((a + b).solids()) == 2
+assert len(a.combine(b, fuzzy_value=1e-5).solids()) == 1
@@ -0,0 +1,48 @@
+# %%
+from alg123d import *
+
+set_defaults(axes=True, axes0=True, transparent=True)
+
+
+def plate():
+    p = Box(100, 100, 5)
+    for loc in GridLocations(10, 10, 8, 8):
+        p -= Cylinder(2, 5) @ loc
+    return p
+
+
+a = plate()
+faces = len(a.faces())
+
+# %%
+
+with CleanPolicy(CleanMode.DEFERRED) as policy:
+    b = plate()
+    assert policy.stats["cleaned"] == 0
+
+    # the first topology query cleans once
+    assert len(b.faces()) == faces
+    assert policy.stats["cleaned"] == 1
+
+print(policy.stats)
+assert policy.stats["operations"] == 64
+assert abs(a.volume - b.volume) < 1e-6
+show(b)
+
+# %%
+
+with CleanPolicy(CleanMode.THRESHOLD, threshold=0.5) as policy:
+    c = plate()
+
+print(policy.stats)
+assert 0 < policy.stats["skipped"] < 64
+assert abs(a.volume - c.volume) < 1e-6
+show(c)
+
+# %%
+
+with CleanPolicy(CleanMode.ALWAYS) as policy:
+    d = Sphere(1) - Box(0.5, 2, 2)
+
+assert policy.stats == dict(operations=1, cleaned=1, skipped=0)
+show(d)
@@ -0,0 +1,69 @@
+# %%
+import math
+from concurrent.futures import ThreadPoolExecutor
+from alg123d import *
+
+# %%
+
+
+def plate(size, skip_clean):
+    def build():
+        p = Box(size, size, 2)
+        p -= [Cylinder(1, 2) @ loc for loc in GridLocations(5, 5, 3, 3)]
+        return fillet(p, p.edges().filter_by(Axis.Z), 0.5)
+
+    if skip_clean:
+        with SkipClean():
+            return build(), len(build().faces())
+    return build(), len(build().faces())
+
+
+args = [(20 + i, i % 2 == 0) for i in range(8)]
+
+expected = [plate(*a) for a in args]
+
+with ThreadPoolExecutor(max_workers=4) as executor:
+    results = list(executor.map(lambda a: plate(*a), args))
+
+for (p1, n1), (p2, n2) in zip(expected, results):
+    assert abs(p1.volume - p2.volume) < 1e-6
+    assert n1 == n2
+
+# the contexts of the threads didn't leak into the main thread
+assert len((Sphere(1) - Box(0.5, 2, 2)).faces()) == len(
+    (Sphere(1) - Box(0.5, 2, 2)).clean().faces()
+)
+
+show(*[p @ Pos(30 * i) for i, (p, _) in enumerate(results)])
+
+# %%
+
+
+def lazy_part(radius):
+    with LazyExpressions():
+        b = Box(10, 10, 10) - Cylinder(radius, 10)
+        assert isinstance(b, ExprCompound)
+    return b._node.key, b.volume
+
+
+radii = [1, 2, 3, 4] * 2
+with ThreadPoolExecutor(max_workers=4) as executor:
+    results = list(executor.map(lazy_part, radii))
+
+# every thread got the volume of its own radius
+for radius, (_, volume) in zip(radii, results):
+    assert abs(volume - (1000 - math.pi * radius**2 * 10)) < 1e-6
+
+# equal expressions share a node key, the ones of other threads don't leak in
+keys = [key for key, _ in results]
+assert keys[:4] == keys[4:]
+assert len(set(keys[:4])) == 4
+
+# the serial run gives the same keys and volumes
+for (key, volume), (serial_key, serial_volume) in zip(
+    results, [lazy_part(r) for r in radii[:4]]
+):
+    assert key == serial_key and abs(volume - serial_volume) < 1e-9
+
+# LazyExpressions of the threads didn't leak into the main thread
+assert not isinstance(Box(1, 1, 1) - Cylinder(0.2, 1), ExprCompound)
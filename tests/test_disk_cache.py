@@ -0,0 +1,75 @@
+# %%
+import tempfile
+import time
+from alg123d import *
+
+# %%
+
+directory = tempfile.mkdtemp()
+
+
+def model():
+    b = Box(20, 20, 20)
+    b = fillet(b, b.edges(), 2)
+    b -= [Cylinder(3, 20) @ loc for loc in GridLocations(8, 8, 2, 2)]
+    return shell(b, -1, openings=b.faces().max())
+
+
+with DiskCache(directory) as cache:
+    a = time.time()
+    m1 = model()
+    print("cold", time.time() - a, cache.stats)
+
+# e.g. after a restart of the worker process
+with DiskCache(directory, max_bytes=100_000_000) as cache:
+    a = time.time()
+    m2 = model()
+    print("warm", time.time() - a, cache.stats)
+
+print(m1.volume, m2.volume)
+show(m2)
+
+# %%
+
+with BooleanCache(), DiskCache(directory):
+    m3 = model()
+
+show(m3)
+
+# %%
+
+# NumPy scalars are keyed like the equal Python numbers, objects known only by
+# identity give keys that are not persistent, so they aren't cached on disk
+
+import numpy as np
+
+from alg123d.fingerprint import is_persistent, make_key
+
+assert make_key(np.float64(2.5)) == 2.5 and make_key(np.int32(3)) == 3
+assert make_key(np.arange(3.0)) == make_key(np.array([0.0, 1.0, 2.0]))
+assert is_persistent(make_key([Box(1, 1, 1), np.float64(2.5), Pos(1, 2, 3)]))
+assert not is_persistent(make_key([Box(1, 1, 1), object()]))
+
+with DiskCache(tempfile.mkdtemp()) as cache:
+    b = Box(10, 10, 10)
+    f1 = fillet(b, b.edges(), 1.0)
+    f2 = fillet(b, b.edges(), np.float64(1.0))
+    assert cache.stats["hits"] == 1
+
+show(f2)
+
+# %%
+
+# a truncated entry is a cache miss and gets removed, the operation still runs
+
+import os
+
+with DiskCache(tempfile.mkdtemp()) as cache:
+    b = Box(10, 10, 10) - Cylinder(2, 10)
+    (entry,) = [e.path for e in cache._entries()]
+    with open(entry, "r+b") as f:
+        f.truncate(100)
+
+    b2 = Box(10, 10, 10) - Cylinder(2, 10)
+    assert abs(b2.volume - b.volume) < 1e-6
+    assert cache.stats["hits"] == 0 and cache.stats["entries"] == 1  # written again
@@ -0,0 +1,84 @@
+# %%
+import time
+from alg123d import *
+
+# %%
+
+c0 = Text(
+    "|―|―|―|―|",
+    font="Times New Roman",
+    font_size=15,
+    font_style=FontStyle.BOLD,
+    align=(Align.MIN, Align.CENTER),
+)
+
+a = time.time()
+with LazyExpressions():
+    c = [offset(c0, 1.2 * i) for i in range(0, 14)]
+
+    def func(idx):
+        return c[idx] if idx == 0 else c[idx] - func(idx - 1)
+
+    mainp = extrude(func(13), 1) @ Pos(0, 2.25)
+    mainp2 = extrude(func(13), 1) @ Pos(0, 2.25)
+
+print(mainp, mainp._node is mainp2._node)
+evaluate(mainp, mainp2)
+print(time.time() - a)
+
+show(mainp, axes=True, axes0=True)
+
+# %%
+
+with LazyExpressions(workers=4):
+    b = Box(2, 2, 2)
+    left = fillet(b, b.edges(), 0.2) @ Pos(-3)
+    right = chamfer(b, b.edges(), 0.2) @ Pos(3)
+    both = left + right
+
+show(both)
+# %%
+
+# an evaluated expression moved in place or placed elsewhere isn't keyed by its node
+
+from alg123d.fingerprint import make_key
+
+with LazyExpressions():
+    tool = Cylinder(1, 10) + Box(1, 1, 1)
+
+assert make_key(tool)[0] == "node"  # deferred
+tool.faces()  # evaluate
+assert make_key(tool)[0] == "node"  # unchanged result
+
+base = Box(20, 4, 4)
+with BooleanCache():
+    a = base - tool
+    b = base - tool @ Pos(5, 0, 0)
+    assert abs(a.center().X - b.center().X) > 1e-3
+
+    tool.move(Pos(-5, 0, 0))
+    assert make_key(tool)[0] == "shape"
+    c = base - tool
+    assert abs(a.center().X - c.center().X) > 1e-3
+
+show(a, b @ Pos(0, 10, 0), c @ Pos(0, 20, 0))
+
+# %%
+
+# SkipClean and CleanPolicy are part of the key and restored on evaluation
+
+with LazyExpressions():
+    with SkipClean():
+        raw = Box(1, 1, 1) + Box(1, 1, 1) @ Pos(1, 0, 0)
+    cleaned = Box(1, 1, 1) + Box(1, 1, 1) @ Pos(1, 0, 0)
+
+assert raw._node is not cleaned._node
+assert len(raw.faces()) == 10  # evaluated outside of SkipClean, but not cleaned
+assert len(cleaned.faces()) == 6
+
+with LazyExpressions():
+    with CleanPolicy(CleanMode.DEFERRED) as policy:
+        deferred = Box(1, 1, 1) + Box(1, 1, 1) @ Pos(1, 0, 0)
+assert deferred._node is not cleaned._node
+assert len(deferred.faces()) == 6
+assert policy.stats["operations"] == 1
@@ -0,0 +1,118 @@
+# %%
+import time
+
+from alg123d import *
+
+set_defaults(axes=True, axes0=True, transparent=True)
+
+# %%
+
+# new, modified and deleted sub-shapes of a cut
+
+box = Box(40, 30, 10)
+last = box.edges()
+hole = Cylinder(4, 10) @ Pos(5, 5)
+with RecordHistory():
+    base = box - hole
+
+new = base.new_edges()
+assert len(new) == len(base.edges() - last)
+assert all(e.wrapped.IsSame(o.wrapped) for e, o in zip(new, base.edges() - last))
+assert len(new.filter_by(GeomType.CIRCLE)) == 2
+assert abs(new.min().center().Z + 5) < 1e-6
+
+assert len(base.new_faces()) == 3  # the wall of the hole, top and bottom face
+assert len(base.modified_faces()) == 2  # top and bottom face
+assert len(base.modified_edges()) == 0
+assert len(base.deleted_faces()) == 0
+
+# history of the sub-shapes of the operands
+top = base.history.modified(box.faces().max())
+assert len(top) == 1
+assert top[0].wrapped.IsSame(base.faces().max().wrapped)
+assert not base.history.is_deleted(box.faces().min(Axis.X))
+
+show(base, new)
+
+# %%
+
+# the history stays valid through clean: the boxes' top faces are merged
+
+a = Box(10, 10, 10)
+b = Box(10, 10, 10) @ Pos(10, 0, 0)
+with RecordHistory():
+    c = a + b
+assert len(c.faces()) == 6
+top_a = a.faces().max()
+assert len(c.history.modified(top_a)) == 1
+assert c.history.modified(top_a)[0].wrapped.IsSame(c.faces().max().wrapped)
+assert len(c.deleted_faces()) == 1  # the inner face of a
+
+# cutting a hole through a cylinder, new_* don't need the recorded history
+tube = Cylinder(10, 20) - Cylinder(5, 20)
+assert len(tube.new_faces()) == 3
+assert len(tube.new_faces().filter_by(GeomType.CYLINDER)) == 1
+assert len(tube.new_edges().filter_by(GeomType.CIRCLE)) == 2
+
+# %%
+
+# results outside of RecordHistory only have new_*, and the caches skip
+# RecordHistory, since their results have no OCCT history
+
+plain = box - hole
+assert plain.history._reference is None  # the index is built by the first query
+assert len(plain.new_faces()) == 3
+
+# the history keeps the operand's shape at the time of the operation
+moved = Box(40, 30, 10)
+result = moved - hole
+moved.move(Pos(100, 0, 0))
+assert len(result.new_faces()) == 3
+try:
+    plain.modified_faces()
+    raise AssertionError("RuntimeError expected")
+except RuntimeError:
+    pass
+
+with BooleanCache() as cache:
+    box - hole
+    with RecordHistory():
+        assert len((box - hole).modified_faces()) == 2
+    assert len(cache) == 1 and cache.hits == 0
+    cached = box - hole
+    assert cache.hits == 1 and cached.history is None
+    try:
+        cached.new_faces()  # would be all faces, none is shared with box
+        raise AssertionError("RuntimeError expected")
+    except RuntimeError:
+        pass
+
+# %%
+
+# objects not created by an operation have no history
+
+assert Box(1, 1, 1).history is None
+try:
+    Box(1, 1, 1).new_edges()
+    raise AssertionError("RuntimeError expected")
+except RuntimeError:
+    pass
+
+# %%
+
+# set-based ShapeList difference
+
+plate = Box(200, 200, 5)
+last = plate.edges()
+plate -= Cylinder(2, 5) @ GridLocations(10, 10, 18, 18)
+
+t = time.time()
+diff = plate.edges() - last
+print("difference", time.time() - t)
+
+t = time.time()
+new = plate.new_edges()
+print("new_edges", time.time() - t)
+
+assert len(diff) == len(new) == 3 * 18 * 18
+assert len(ShapeList(list(plate.edges())) - ShapeList(list(last))) == len(new)
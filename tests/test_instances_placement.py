@@ -0,0 +1,37 @@
+# %%
+import time
+from alg123d import *
+
+# %%
+
+diam = 80
+locs = GridLocations(4, 4, 20, 20)
+x, y = locs.positions[:, 0], locs.positions[:, 1]
+locs = locs[x**2 + y**2 < (diam / 2 - 1.8) ** 2]
+
+r = Rectangle(2, 2)
+
+a = time.time()
+holes = r @ locs  # one compound, all faces share the TShape of r
+c1 = Circle(diam / 2) - holes
+print("instanced", time.time() - a)
+
+a = time.time()
+c2 = Circle(diam / 2) - [r @ loc for loc in locs]
+print("list", time.time() - a)
+
+assert len(holes.faces()) == len(locs)
+assert abs(c1.area - c2.area) < 1e-6
+
+show(c1)
+
+# %%
+
+b = Box(1, 1, 1) @ Pos(0, 0, 5)
+placed = b @ [Pos(0, 0, 0), Pos(3, 0, 0)]  # absolute, like b @ loc
+moved = b * [Pos(0, 0, 0), Pos(3, 0, 0)]  # relative, like b * loc
+
+assert abs(placed.center().Z) < 1e-6
+assert abs(moved.center().Z - 5) < 1e-6
+
+show(placed, moved)
@@ -1,7 +1,6 @@
 import time
 from alg123d import *
 
-
 # %%
 
 diam = 200  # 175
@@ -25,10 +24,7 @@ a = time.time()
 with LazyAlgCompound() as holes:
     r = Rectangle(meshop, meshop)
     for loc in GridLocations(meshop * 2, meshop * 2, gridxy, gridxy):
-        if (
-            loc.position.X**2 + loc.position.Y**2
-            < (diam / 2 - meshop * 0.9) ** 2
-        ):
+        if loc.position.X**2 + loc.position.Y**2 < (diam / 2 - meshop * 0.9) ** 2:
             holes += r @ loc
 
 c = Circle(diam / 2) - holes
@@ -66,3 +62,69 @@ print(time.time() - a)
 
 show(c)
 # %%
+
+# %%
+
+a = time.time()
+with AutoBatch():
+    holes = AlgCompound()
+    r = Rectangle(meshop, meshop)
+    for loc in GridLocations(meshop * 2, meshop * 2, gridxy, gridxy):
+        if loc.position.X**2 + loc.position.Y**2 < (diam / 2 - meshop * 0.9) ** 2:
+            holes += r @ loc
+
+    c = Circle(diam / 2) - holes
+    print(len(c.faces()))
+
+print(time.time() - a)
+show(c)
+
+# %%
+
+with AutoBatch():
+    b = Box(3, 3, 1)
+    b -= Cylinder(0.5, 2)
+    b += Box(1, 1, 1) @ Pos(z=1)
+    b &= Sphere(2)
+
+show(b)
+# %%
+
+# %%
+
+# pockets and bosses: one cut of all pockets, one fuse of all bosses between them
+
+a = time.time()
+with LazyAlgCompound() as body:
+    body += Box(100, 100, 10)
+    for loc in GridLocations(20, 20, 4, 4):
+        body -= Box(8, 8, 6, align=(Align.CENTER, Align.CENTER, Align.MIN)) @ loc
+    for loc in GridLocations(20, 20, 4, 4):
+        body += Cylinder(2, 10, align=(Align.CENTER, Align.CENTER, Align.MIN)) @ (
+            loc * Pos(10, 10, 4)
+        )
+    body &= Box(90, 90, 30)
+    modes = [mode for mode, _ in body._operands]
+    assert modes == [Mode.ADD] + [Mode.SUBTRACT] * 16 + [Mode.ADD] * 16 + [
+        Mode.INTERSECT
+    ]
+print(time.time() - a)
+
+assert body.dim == 3
+assert len(body.solids()) == 1
+show(body)
+
+# %%
+
+# nested scopes only holding additions are merged into the outer one
+
+with LazyAlgCompound() as plate:
+    plate += Rectangle(50, 50)
+    with LazyAlgCompound() as holes:
+        for loc in PolarLocations(20, 12):
+            holes += Circle(1.5) @ loc
+    plate -= holes
+    assert [mode for mode, _ in plate._operands].count(Mode.SUBTRACT) == 12
+
+assert abs(plate.area - (2500 - 12 * 3.1415926 * 1.5**2)) < 1e-3
+show(plate, reset_camera=False)
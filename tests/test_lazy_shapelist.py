@@ -0,0 +1,55 @@
+# %%
+import copy
+import pickle
+
+from alg123d import *
+
+set_defaults(axes=True, axes0=True, transparent=True)
+
+plate = Box(100, 100, 5) - Cylinder(2, 5) @ GridLocations(10, 10, 8, 8)
+
+# %%
+
+# faces are wrapped when accessed
+
+faces = plate.faces()
+assert isinstance(faces, LazyShapeList)
+assert len(faces) == 6 + 64
+assert len(faces._items) == 0
+
+top = faces.max()
+assert abs(top.center().Z - 2.5) < 1e-6
+assert len(faces._items) == 0  # sort_by creates temporary objects only
+
+assert faces[0] is faces[0]
+assert len(faces[2:10]) == 8
+assert isinstance(faces[2:10], LazyShapeList)
+assert faces[-1].wrapped.IsSame(list(faces)[-1].wrapped)
+assert faces[0] in faces
+
+cylinders = plate.faces().filter_by(GeomType.CYLINDER)
+assert isinstance(cylinders, LazyShapeList)
+assert len(cylinders) == 64
+
+planes = plate.faces().filter_by(Axis.Z)
+assert len(planes) == 2
+assert planes.sort_by(Axis.Z)[0].center().Z < planes.sort_by(Axis.Z)[-1].center().Z
+
+circles = plate.edges().filter_by(GeomType.CIRCLE).sort_by(SortBy.RADIUS)
+assert len(circles) == 128
+assert len(plate.edges().group_by(Axis.Z)) == 3  # bottom, vertical, top
+
+# %%
+
+# changing the list turns it into an ordinary ShapeList
+
+faces = plate.faces()
+faces.append(top)
+assert len(faces) == 71
+assert faces[-1] is top
+
+assert len(plate.faces() + plate.faces()) == 140
+assert len(copy.copy(plate.faces())) == 70
+assert len(pickle.loads(pickle.dumps(plate.vertices()))) == 8 + 2 * 64
+
+show(plate, top)
@@ -0,0 +1,36 @@
+# %%
+import time
+from alg123d import *
+
+# %%
+
+a = time.perf_counter()
+locs = GridLocations(1, 1, 100, 100)
+x, y = locs.positions[:, 0], locs.positions[:, 1]
+inner = locs[x**2 + y**2 < 40**2]
+print(len(inner), (time.perf_counter() - a) * 1e6, "us")
+
+# same as filtering the Location objects
+filtered = [
+    loc
+    for loc in GridLocations(1, 1, 100, 100)
+    if loc.position.X**2 + loc.position.Y**2 < 40**2
+]
+assert len(filtered) == len(inner)
+assert all((l1.position - l2.position).length < 1e-9 for l1, l2 in zip(filtered, inner))
+
+# %%
+
+plane = Plane.XZ * Pos(0, 0, 5)
+locs = plane * PolarLocations(10, 6)
+assert len(locs) == 6
+for loc, ref in zip(locs, PolarLocations(10, 6)):
+    assert ((plane * ref).position - loc.position).length < 1e-9
+
+r = Rectangle(1, 2)
+show(*[r @ loc for loc in locs], plane.symbol())
+
+# %%
+
+hexes = HexLocations(2, 5, 5) * Rot(z=30)
+show(*[RegularPolygon(2, 6) @ loc for loc in hexes])
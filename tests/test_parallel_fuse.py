@@ -0,0 +1,46 @@
+# %%
+import time
+from alg123d import *
+
+# the workers import this script, so the fuses only run in the main process
+
+# %%
+
+if __name__ == "__main__":
+    diam = 200
+    meshop = 2
+    gridxy = int(diam / meshop / 2)
+
+    r = Rectangle(meshop, meshop)
+    holes = [
+        r @ loc
+        for loc in GridLocations(meshop * 2, meshop * 2, gridxy, gridxy)
+        if loc.position.X**2 + loc.position.Y**2 < (diam / 2 - meshop * 0.9) ** 2
+    ]
+
+    a = time.time()
+    c1 = Circle(diam / 2) - holes
+    print("sequential", time.time() - a)
+
+    a = time.time()
+    with ParallelFuse():
+        c2 = Circle(diam / 2) - holes
+    print("parallel", time.time() - a)
+
+    print(len(c1.faces()), len(c2.faces()), c1.area, c2.area)
+    show(c2)
+
+# %%
+
+if __name__ == "__main__":
+    b = Box(20, 20, 2)
+    cylinders = [Cylinder(0.4, 4) @ loc for loc in GridLocations(1, 1, 19, 19)]
+
+    a = time.time()
+    with ParallelFuse(workers=4, min_operands=16):
+        b -= cylinders
+    print(time.time() - a)
+
+    show(b)
+
+# %%
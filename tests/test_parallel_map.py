@@ -0,0 +1,73 @@
+# %%
+import os
+import tempfile
+import time
+
+from alg123d import *
+
+set_defaults(axes=True, axes0=True, transparent=True)
+
+# the workers import this script, so the sweeps only run in the main process
+
+
+def plate(length, holes):
+    p = Box(length, 20, 2)
+    return p - Cylinder(2, 2) @ GridLocations(length / (holes + 1), 0, holes, 1)
+
+
+def broken(length, holes):
+    if holes == 3:
+        raise ValueError("no plate with 3 holes")
+    if holes == 4:
+        time.sleep(60)
+    return plate(length, holes)
+
+
+# %%
+
+if __name__ == "__main__":
+    t = time.time()
+    results = list(
+        parallel_map(plate, parameter_grid(length=[50, 100], holes=range(1, 6)))
+    )
+    print("parallel", time.time() - t)
+
+    assert len(results) == 10
+    assert all(r.error is None for r in results)
+    for r in results:
+        assert abs(r.result.volume - plate(**r.params).volume) < 1e-6
+
+    show(*[r.result @ Pos(0, 25 * r.index, 0) for r in results])
+
+# %%
+
+# failures and timeouts don't stop the batch
+
+if __name__ == "__main__":
+    results = {
+        r.params["holes"]: r
+        for r in parallel_map(
+            broken,
+            parameter_grid(length=[50], holes=range(1, 6)),
+            workers=2,
+            timeout=10,
+        )
+    }
+    assert "ValueError" in results[3].error
+    assert results[4].error.startswith("timeout")
+    assert all(results[h].error is None for h in (1, 2, 5))
+
+# %%
+
+# write files instead of sending shapes back
+
+if __name__ == "__main__":
+    directory = tempfile.mkdtemp()
+    for r in parallel_map(
+        plate,
+        parameter_grid(length=[50, 100], holes=[2]),
+        filename=os.path.join(directory, "plate_{length}.step"),
+    ):
+        assert r.result is None and os.path.exists(r.path)
+
+    print(sorted(os.listdir(directory)))
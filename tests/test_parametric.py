@@ -0,0 +1,67 @@
+# %%
+import time
+from alg123d import *
+
+# %%
+
+
+def plate(length, width, diam):
+    p = Box(length, width, 5)
+    p -= [Cylinder(diam / 2, 5) @ loc for loc in GridLocations(20, 20, 3, 3)]
+    return fillet(p, p.edges().filter_by(Axis.Z), 2)
+
+
+model = ParametricModel(plate, length=100, width=80, diam=6)
+
+a = time.time()
+p1 = model.build()
+print(model.stats, time.time() - a)
+
+# Box, Cylinder, 9 placements, cut and fillet
+assert model.stats == dict(operations=13, computed=13, reused=0)
+
+a = time.time()
+p2 = model.build(diam=8)
+print(model.stats, time.time() - a)
+
+# only the Box doesn't depend on diam
+assert model.stats == dict(operations=13, computed=12, reused=1)
+assert p2.volume < p1.volume - 9 * 3.14 * (4**2 - 3**2) * 5 * 0.99
+
+show(p1 @ Pos(-60), p2 @ Pos(60))
+
+# %%
+
+
+def bracket(length, thickness, hole):
+    base = Box(length, 20, thickness, align=(Align.CENTER, Align.CENTER, Align.MIN))
+    wall = Box(thickness, 20, 30, align=(Align.MIN, Align.CENTER, Align.MIN))
+    b = base + wall @ Pos(length / 2 - thickness)
+    b -= Cylinder(hole / 2, thickness) @ Pos(-length / 4, 0, thickness / 2)
+    return dict(bracket=b, base=base)
+
+
+model = ParametricModel(bracket, length=60, thickness=4, hole=5)
+parts = model.build()
+assert model.stats == dict(operations=7, computed=7, reused=0)
+
+parts2 = model.build(hole=6)
+print(model.stats)
+
+# base, wall, its placement and the fuse are reused, cylinder, placement and cut run
+assert model.stats == dict(operations=7, computed=3, reused=4)
+assert parts2["bracket"].volume < parts["bracket"].volume
+assert abs(parts2["base"].volume - parts["base"].volume) < 1e-6
+
+show(parts2["bracket"])
+
+# %%
+
+# nodes evaluated by another model are shared through the expression graph, so
+# they count as reused
+
+first = ParametricModel(plate, length=120, width=80, diam=6)
+first.build()
+second = ParametricModel(plate, length=120, width=80, diam=6)
+second.build()
+assert second.stats == dict(operations=13, computed=0, reused=13)
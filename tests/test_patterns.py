@@ -0,0 +1,47 @@
+# %%
+import time
+from alg123d import *
+
+set_defaults(axes=True, axes0=True, transparent=True)
+
+# %%
+
+a = Box(100, 100, 5)
+locs = GridLocations(6, 6, 15, 15)
+
+t = time.time()
+b = bore_pattern(a, locs, 1)
+print("pattern", time.time() - t)
+
+t = time.time()
+c = a
+for loc in locs:
+    c -= Bore(a, 1) @ loc
+print("loop", time.time() - t)
+
+assert abs(b.volume - c.volume) < 1e-6
+show(b)
+
+# %%
+
+a = Box(1, 2, 3)
+wp = Plane(a.faces().max())
+a = counter_bore_pattern(a, wp * Locations((0.2, 0.2), (-0.2, -0.2)), 0.1, 0.2, 0.1)
+
+show(a, reset_camera=False)
+
+# %%
+
+a = Box(1, 2, 3) + Box(1, 1, 3) @ Pos(x=3)
+for wp in Planes(a.faces().max_group()):
+    a = counter_sink_pattern(a, wp * Locations((0.2, 0.2), (-0.2, -0.2)), 0.1, 0.2)
+
+show(a, reset_camera=False)
+
+# %%
+
+plate = Rectangle(50, 50)
+plate = pattern(plate, Circle(1), PolarLocations(20, 12))
+plate = pattern(plate, Rectangle(2, 6), PolarLocations(25, 8), mode=Mode.ADD)
+
+show(plate)
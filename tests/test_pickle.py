@@ -0,0 +1,63 @@
+# %%
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+from alg123d import *
+
+set_defaults(axes=True, axes0=True, transparent=True)
+
+# %%
+
+a = Box(1, 2, 3) @ Pos(1, 2, 3)
+a.label = "box"
+a.metadata["material"] = "steel"
+
+b = pickle.loads(pickle.dumps(a))
+
+assert isinstance(b, Box)
+assert b.dim == 3
+assert b.label == "box"
+assert b.metadata == {"material": "steel"}
+assert (b.location.position - a.location.position).length < 1e-9
+assert abs(b.volume - a.volume) < 1e-9
+show(b)
+
+# %%
+
+# instances keep sharing their geometry
+
+c = Cylinder(1, 1) @ GridLocations(3, 3, 10, 10)
+d = pickle.loads(pickle.dumps(c))
+solids = d.solids()
+assert len(solids) == 100
+assert all(s.wrapped.IsPartner(solids[0].wrapped) for s in solids)
+
+# %%
+
+# sketches, lines and empty objects
+
+for obj in [Circle(1), Line((0, 0), (1, 1)), AlgCompound()]:
+    copy = pickle.loads(pickle.dumps(obj))
+    assert type(copy) == type(obj) and copy.dim == obj.dim
+
+# %%
+
+# lazy expressions are pickled as their result
+
+with LazyExpressions():
+    e = Box(2, 2, 2) - Sphere(1.2)
+f = pickle.loads(pickle.dumps(e))
+assert type(f) == AlgCompound and abs(f.volume - e.volume) < 1e-9
+
+# %%
+
+# parts can be sent to process pools
+
+
+def volume(part):
+    return part.volume
+
+
+with ProcessPoolExecutor(2) as executor:
+    volumes = list(executor.map(volume, [Box(1, 1, i) for i in range(1, 5)]))
+assert volumes == [1, 2, 3, 4]
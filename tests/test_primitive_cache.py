@@ -0,0 +1,61 @@
+# %%
+import time
+from alg123d import *
+
+# %%
+
+a = time.time()
+with PrimitiveCache(max_entries=100) as cache:
+    pips = AlgCompound()
+    for loc in GridLocations(8, 8, 6, 4):
+        pips += Cylinder(2.4, 1.8, align=(Align.CENTER, Align.CENTER, Align.MIN)) @ loc
+
+    plate = Box(48, 32, 3.2, align=(Align.CENTER, Align.CENTER, Align.MAX)) + pips
+
+print(cache.stats, time.time() - a)
+show(plate)
+
+# %%
+
+cached = PrimitiveCache(max_bytes=1_000_000)
+with cached:
+    r1 = Rectangle(2, 2)
+    r2 = Rectangle(2, 2)
+    r1.move(Pos(5, 0))  # doesn't change the cached object
+
+with cached:
+    r3 = Rectangle(2, 2)
+
+print(r2.location, r3.location, cached.cache.stats)
+show(r1, r2, r3)
+
+# %%
+
+# subclasses outside alg123d aren't cached unless they opt in, so their __init__ runs
+
+
+class Plate(Box):
+    def __init__(self, size):
+        super().__init__(size, size, 2)
+        self.size = size
+
+
+class Pin(Cylinder):
+    _cacheable = True
+
+    def __init__(self, length):
+        super().__init__(1, length)
+
+
+with PrimitiveCache() as cache:
+    plates = [Plate(10), Plate(10)]
+    assert all(p.size == 10 for p in plates)
+    assert cache.stats["entries"] == 0
+
+    pins = [Pin(5), Pin(5)]
+    assert cache.stats["entries"] == 1 and cache.stats["hits"] == 1
+
+    # holes would be keyed by the whole part
+    b = Box(10, 10, 10)
+    Bore(b, 1)
+    assert cache.stats["entries"] == 1
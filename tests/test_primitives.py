@@ -0,0 +1,64 @@
+# %%
+import build123d as bd
+from alg123d import *
+
+set_defaults(axes=True, axes0=True, transparent=True)
+
+# the builder-free primitives give the same objects as the build123d builder path
+
+PARTS = [
+    (Box, bd.Box, dict(length=1, width=2, height=3)),
+    (Cylinder, bd.Cylinder, dict(radius=1, height=2)),
+    (Cone, bd.Cone, dict(bottom_radius=2, top_radius=1, height=2)),
+    (Sphere, bd.Sphere, dict(radius=1)),
+    (Torus, bd.Torus, dict(major_radius=3, minor_radius=1)),
+    (
+        Wedge,
+        bd.Wedge,
+        dict(xsize=2, ysize=3, zsize=4, xmin=0.5, zmin=0.5, xmax=1.5, zmax=3.5),
+    ),
+]
+
+SKETCHES = [
+    (Circle, bd.Circle, dict(radius=1)),
+    (Ellipse, bd.Ellipse, dict(x_radius=2, y_radius=1)),
+    (Rectangle, bd.Rectangle, dict(width=2, height=1)),
+    (RectangleRounded, bd.RectangleRounded, dict(width=2, height=1, radius=0.2)),
+]
+
+POINTS = [(0, 0), (3, 0), (3, 1), (1, 2), (0, 1)]
+
+
+def assert_equal(fast, slow, name):
+    assert fast.dim == slow.dim, name
+    assert abs(fast.area - slow.area) < 1e-6, name
+    if fast.dim == 3:
+        assert abs(fast.volume - slow.volume) < 1e-6, name
+    fast_box, slow_box = fast.bounding_box(), slow.bounding_box()
+    assert (fast_box.min - slow_box.min).length < 1e-6, name
+    assert (fast_box.max - slow_box.max).length < 1e-6, name
+
+
+# %%
+
+for cls, bd_cls, params in PARTS:
+    for align in (None, (Align.CENTER,) * 3, (Align.MIN, Align.CENTER, Align.MAX)):
+        kwargs = params if align is None else dict(params, align=align)
+        slow = AlgCompound(AlgCompound().create_part(bd_cls, params=kwargs))
+        assert_equal(cls(**kwargs), slow, f"{cls.__name__} {align}")
+
+for cls, bd_cls, params in SKETCHES:
+    for align in (None, (Align.CENTER,) * 2, (Align.MIN, Align.MAX)):
+        kwargs = params if align is None else dict(params, align=align)
+        slow = AlgCompound(AlgCompound().create_sketch(bd_cls, params=kwargs))
+        assert_equal(cls(**kwargs), slow, f"{cls.__name__} {align}")
+
+for align in ((Align.CENTER,) * 2, (Align.MIN, Align.MAX)):
+    slow = AlgCompound(
+        AlgCompound().create_sketch(
+            bd.Polygon, objects=POINTS, params=dict(align=align)
+        )
+    )
+    assert_equal(Polygon(POINTS, align=align), slow, f"Polygon {align}")
+
+show(*[cls(**params) @ Pos(5 * i, 0, 0) for i, (cls, _, params) in enumerate(PARTS)])
@@ -0,0 +1,53 @@
+# %%
+import json
+import os
+import tempfile
+import time
+
+from alg123d import *
+
+set_defaults(axes=True, axes0=True, transparent=True)
+
+
+def model():
+    plate = Box(80, 60, 10)
+    plate = fillet(plate, plate.edges().filter_by(Axis.Z), 5)
+    for loc in GridLocations(15, 15, 4, 3):
+        plate -= Cylinder(3, 10) @ loc
+    return plate
+
+
+# %%
+
+with Profile() as profile:
+    a = model()
+
+print(profile.report())
+
+totals = profile.totals()
+assert totals["AlgCompound._place"]["calls"] == 12
+assert totals["fillet"]["calls"] == 1
+assert totals["Cylinder"]["calls"] == 12
+
+# every cut takes the plate and a cylinder and returns one solid
+place = [s for s in profile.spans if s.name == "AlgCompound._place"]
+assert all(s.inputs[2] == 2 and s.outputs[2] == 1 for s in place)
+
+filename = os.path.join(tempfile.mkdtemp(), "trace.json")
+profile.export_chrome_trace(filename)
+with open(filename) as f:
+    trace = json.load(f)
+assert len(trace["traceEvents"]) == len(profile.spans)
+
+show(a)
+
+# %%
+
+# without a Profile nothing is recorded
+
+t = time.time()
+b = model()
+print("untraced", time.time() - t)
+
+assert len(profile.spans) == len(trace["traceEvents"])
+assert abs(a.volume - b.volume) < 1e-6
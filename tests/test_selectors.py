@@ -0,0 +1,98 @@
+# %%
+import time
+
+from alg123d import *
+
+set_defaults(axes=True, axes0=True, transparent=True)
+
+plate = Box(100, 80, 10) - Cylinder(3, 10) @ GridLocations(20, 20, 4, 3)
+plate = fillet(plate, plate.edges().filter_by(Axis.Z).group_by(Axis.X)[0], 4)
+
+faces = plate.faces()
+eager = ShapeList(list(plate.faces()))
+
+
+def same(a, b):
+    return len(a) == len(b) and all(x.wrapped.IsSame(y.wrapped) for x, y in zip(a, b))
+
+
+# %%
+
+# vectorized selections give the same results as ShapeList
+
+for axis in (Axis.X, Axis.Y, Axis.Z):
+    assert faces.max(axis).wrapped.IsSame(eager.sort_by(axis)[-1].wrapped)
+    assert faces.min(axis).wrapped.IsSame(eager.sort_by(axis)[0].wrapped)
+    assert same(faces.sort_by(axis), eager.sort_by(axis))
+    assert same(faces.sort_by(axis, reverse=True), eager.sort_by(axis, reverse=True))
+    assert same(faces.filter_by(axis), eager.filter_by(axis))
+    assert same(faces.min_group(axis), eager.group_by(axis)[0])
+    assert same(faces.max_group(axis), eager.group_by(axis)[-1])
+
+for geom_type in (GeomType.PLANE, GeomType.CYLINDER):
+    assert same(faces.filter_by(geom_type), eager.filter_by(geom_type))
+    assert same(
+        faces.filter_by(geom_type, reverse=True),
+        eager.filter_by(geom_type, reverse=True),
+    )
+
+assert same(faces.sort_by(SortBy.AREA), eager.sort_by(SortBy.AREA))
+assert same(faces.sort_by(SortBy.DISTANCE), eager.sort_by(SortBy.DISTANCE))
+
+circles = plate.edges().filter_by(GeomType.CIRCLE)
+assert len(circles) == 12 * 2 + 2 * 2  # holes and fillets
+assert abs(circles.max(SortBy.RADIUS).radius - 4) < 1e-6
+assert len(circles.min_group(SortBy.RADIUS)) == 12 * 2
+
+lines = plate.edges().filter_by(Axis.X)
+assert all(abs(e.tangent_at(0).X) > 0.999 for e in lines)
+
+# chained selections keep the computed arrays
+top = plate.faces().filter_by(GeomType.PLANE).max(Axis.Z)
+assert abs(top.center().Z - 5) < 1e-6
+
+props = plate.faces().properties
+assert props.centers.shape == (len(faces), 3)
+assert props.bounds.shape == (len(faces), 6)
+assert abs(props.areas.sum() - plate.area) < 1e-6
+
+show(plate, top)
+
+# %%
+
+# after the first selection the arrays of the topology index are reused
+
+t = time.time()
+plate.faces().max()
+print("first", time.time() - t)
+
+t = time.time()
+for _ in range(100):
+    plate.faces().max()
+print("cached", (time.time() - t) / 100)
+
+# %%
+
+# the columns computed from the OCCT shapes equal the values of the objects
+
+wire = Wire.make_wire(plate.edges().filter_by(GeomType.LINE)[:1])
+for shapes in (
+    plate.vertices(),
+    plate.edges(),
+    plate.faces(),
+    plate.shells(),
+    plate.solids(),
+    wire.wires(),
+):
+    props = shapes.properties
+    for i, obj in enumerate(shapes):
+        assert (abs(props.centers[i] - obj.center().to_tuple()) < 1e-9).all()
+        assert props.geom_types[i] == obj.geom_type()
+        assert abs(props.areas[i] - obj.area) < 1e-9
+        if not isinstance(obj, Vertex):
+            assert abs(props.volumes[i] - obj.volume) < 1e-9
+        if isinstance(obj, (Edge, Wire)):
+            assert abs(props.lengths[i] - obj.length) < 1e-9
+
+circles = plate.edges().filter_by(GeomType.CIRCLE)
+assert all(abs(r - e.radius) < 1e-9 for r, e in zip(circles.properties.radii, circles))
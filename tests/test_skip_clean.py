@@ -12,3 +12,16 @@ with SkipClean():
 show(s1)
 
 # %%
+
+# %%
+
+assert SkipClean.clean and not Copy.shallow
+with SkipClean(), Copy():
+    assert not SkipClean.clean and Copy.shallow
+assert SkipClean.clean and not Copy.shallow
+try:
+    SkipClean.clean = False
+except AttributeError:
+    pass
+else:
+    raise AssertionError("SkipClean.clean is read-only")
@@ -0,0 +1,78 @@
+# %%
+import copy
+import time
+
+from alg123d import *
+
+set_defaults(axes=True, axes0=True, transparent=True)
+
+plate = Box(200, 200, 5) - Cylinder(2, 5) @ GridLocations(10, 10, 18, 18)
+
+# %%
+
+# the first query builds the topology index, the following ones reuse it
+
+t = time.time()
+faces = plate.faces()
+print("first", time.time() - t)
+
+t = time.time()
+for _ in range(10):
+    plate.faces()
+print("cached", (time.time() - t) / 10)
+
+assert len(faces) == 6 + 18 * 18
+assert len(plate.edges()) == 12 + 3 * 18 * 18
+assert len(plate.vertices()) == 8 + 2 * 18 * 18
+assert len(plate.solids()) == 1
+
+# every query returns new objects, changing them doesn't change the index
+f = plate.faces().max()
+f.move(Pos(0, 0, 10))
+assert abs(plate.faces().max().center().Z - 2.5) < 1e-6
+
+# degenerated edges are filtered once
+assert len(Sphere(10).edges()) == 2
+
+# %%
+
+# moving the shape in place or replacing wrapped invalidates the index
+
+z = plate.faces().max().center().Z
+plate.move(Pos(0, 0, 10))
+assert abs(plate.faces().max().center().Z - z - 10) < 1e-6
+
+plate.locate(Location())
+assert abs(plate.faces().max().center().Z - 2.5) < 1e-6
+
+plate -= Box(4, 4, 10)
+assert len(plate.faces()) == 6 + 18 * 18 + 4
+assert len(plate.solids()) == 1
+
+# copies build their own index
+c = copy.deepcopy(plate)
+assert len(c.faces()) == len(plate.faces())
+
+show(plate)
+
+# %%
+
+# same sub-shapes, order and orientations as the uncached Shape._entities
+
+from OCP.BRep import BRep_Tool
+from OCP.TopoDS import TopoDS
+
+
+def entities(shape, topo_type):
+    found = shape._entities(topo_type)
+    if topo_type == Edge.__name__:
+        found = [e for e in found if not BRep_Tool.Degenerated_s(TopoDS.Edge_s(e))]
+    return found
+
+
+for shape in [Cylinder(1, 2), Sphere(1), plate, Circle(1) - Rectangle(0.5, 3)]:
+    for name, query in [("Edge", Shape.edges), ("Face", Shape.faces)]:
+        expected = entities(shape, name)
+        found = [s.wrapped for s in query(shape)]
+        assert len(found) == len(expected)
+        assert all(a.IsEqual(b) for a, b in zip(found, expected))